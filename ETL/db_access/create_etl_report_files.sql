@@ -0,0 +1,14 @@
+-- Per-file details of the ETL reports, see ETLReportFile in models.py.
+-- Run once on the reporting database before deploying the ETL writing them.
+IF OBJECT_ID(N'dbo.etl_report_files', N'U') IS NULL
+CREATE TABLE dbo.etl_report_files (
+	id INTEGER NOT NULL IDENTITY,
+	report_id INTEGER NOT NULL,
+	file_name VARCHAR(max) NOT NULL,
+	creation_date VARCHAR(10) NOT NULL,
+	link VARCHAR(max) NOT NULL,
+	chunk_count INTEGER NOT NULL,
+	unprocessed_parts INTEGER NOT NULL,
+	PRIMARY KEY (id),
+	FOREIGN KEY(report_id) REFERENCES dbo.etl_reports (id)
+);
@@ -3,8 +3,7 @@
 from datetime import datetime
 from typing import ClassVar
 
-from sqlalchemy import JSON, DateTime, Integer, String, func
-from sqlalchemy.ext.mutable import MutableDict, MutableList
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -26,8 +25,24 @@ class ETLReport(Base):
     deleted_files: Mapped[int] = mapped_column(Integer)
     total_files: Mapped[int] = mapped_column(Integer)
     total_chunks: Mapped[int] = mapped_column(Integer)
-    files_in_db: Mapped[dict] = mapped_column(
-        MutableDict.as_mutable(JSON),
-    )
+    # {"files", "chunks", "unprocessed_parts"} counts, the details of each file are in ETLReportFile
+    # plain JSON: the report is written once, in-place change tracking is not needed
+    files_in_db: Mapped[dict] = mapped_column(JSON)
 
-    date: Mapped[datetime] = mapped_column(DateTime(), server_default=func.now())
\ No newline at end of file
+    date: Mapped[datetime] = mapped_column(DateTime(), server_default=func.now())
+
+
+class ETLReportFile(Base):
+    """Model containing the details of each file listed in an ETL report."""
+
+    __tablename__ = "etl_report_files"
+    __table_args__: ClassVar[dict] = {"schema": "dbo"}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    report_id: Mapped[int] = mapped_column(ForeignKey("dbo.etl_reports.id"))
+
+    file_name: Mapped[str] = mapped_column(String)
+    creation_date: Mapped[str] = mapped_column(String(10))
+    link: Mapped[str] = mapped_column(String)
+    chunk_count: Mapped[int] = mapped_column(Integer)
+    unprocessed_parts: Mapped[int] = mapped_column(Integer)
@@ -1,16 +1,18 @@
 """Operations with DBs."""
 
+import atexit
 import logging
 import sys
+import threading
 
-import pandas as pd
 import weaviate
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from ETL.tools.exceptions import DBError
 from ETL.tools.settings import rag_app_settings, sql_server_settings, weaviate_settings
-from weaviate.classes.query import MetadataQuery
+from weaviate.classes.query import MetadataQuery, QueryNested
 
-from ETL.db_access.models import ETLReport
+from ETL.db_access.models import ETLReport, ETLReportFile
 
 logging.basicConfig(
     level=logging.INFO,  # Set the logging level
@@ -21,13 +23,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of objects fetched from Weaviate per round-trip when scanning the collection
+WEAVIATE_PAGE_SIZE = 5000
 
-def read_weaviate_data() -> dict:
+_client: weaviate.WeaviateClient | None = None
+_client_lock = threading.Lock()
+
+
+def _get_weaviate_client() -> weaviate.WeaviateClient:
+    """Return the module-level Weaviate client, connecting on first use.
+
+    The connection is reused across calls and closed when the interpreter exits.
+    """
+    global _client
+    with _client_lock:
+        if _client is None or not _client.is_connected():
+            if _client is not None:
+                # release the dropped connection before replacing it
+                _client.close()
+            _client = weaviate.connect_to_local(weaviate_settings.url)
+        return _client
+
+
+def _close_weaviate_client() -> None:
+    """Close whichever module-level Weaviate client is current."""
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+
+
+atexit.register(_close_weaviate_client)
+
+
+def read_weaviate_data(client: weaviate.WeaviateClient | None = None) -> dict:
     """Retrieve and process document data from Weaviate vector database.
 
     Connects to the Weaviate instance, retrieves all documents in the collection,
     and processes the data to generate statistics about files and their chunks.
 
+    Args:
+        client (weaviate.WeaviateClient, optional): Connected client to use. Defaults to
+            a shared module-level client, opened on first use.
+
     Returns:
         dict: A dictionary containing:
             - 'total_files': The total number of unique files in the database
@@ -36,43 +73,38 @@ def read_weaviate_data() -> dict:
                 and their details (creation date, chunk count) as values
 
     """
-    client = weaviate.connect_to_local(weaviate_settings.url)
+    if client is None:
+        client = _get_weaviate_client()
     collection = client.collections.get(weaviate_settings.collection_name)
 
-    data = []
-    # Iterate through all objects, retrieving the creation_time metadata
+    # Single pass: count the chunks of each (file name, creation date, link)
+    counts: dict[tuple[str, str, str], int] = {}
+    count = counts.get
+    # Iterate through all objects, retrieving the creation_time metadata.
+    # The iterator pages with a cursor, so a large page keeps round-trips low
+    # without hitting the offset limit of fetch_objects.
+    # Only the metadata fields used for grouping are fetched, not the chunk content.
     for article in collection.iterator(
         return_metadata=MetadataQuery(creation_time=True),
+        return_properties=[QueryNested(name="metadata", properties=["file_name", "source"])],
+        cache_size=WEAVIATE_PAGE_SIZE,
     ):
-        # Build a list of dicts for DataFrame
-        filename = article.properties["metadata"]["file_name"]
-        content = article.properties["content"]
-        link = article.properties["metadata"]["source"]
-        creation_date = article.metadata.creation_time
-        data.append(
-            {
-                "File Name": filename,
-                "Creation Date": creation_date,
-                "Content": content,
-                "Link": link,
-            },
+        meta = article.properties["metadata"]
+        # format the date once, here, and keep it a plain str from now on
+        creation_time = article.metadata.creation_time
+        key = (
+            meta["file_name"],
+            creation_time.strftime("%Y-%m-%d") if creation_time else "",
+            meta["source"],
         )
+        counts[key] = count(key, 0) + 1
 
-    client.close()
-    df = pd.DataFrame(data)
-    df["Creation Date"] = df["Creation Date"].dt.date
-
-    # Group by filename and creation_date, count chunks, and collect content
-    grouped_df = (
-        df.groupby(["File Name", "Creation Date", "Link"])
-        .agg(**{"Number of chunks": ("Content", "size"), "Content": ("Content", list)})
-        .reset_index()
-    )
-    grouped_df["Creation Date"] = grouped_df["Creation Date"].astype(str)
-    grouped_df = grouped_df.set_index("File Name")
-    total_files = len(grouped_df)
-    total_chunks = int(grouped_df["Number of chunks"].sum())
-    files_in_db = grouped_df.to_dict("index")
+    files_in_db = {
+        filename: {"Creation Date": creation_date, "Link": link, "Number of chunks": n_chunks}
+        for (filename, creation_date, link), n_chunks in counts.items()
+    }
+    total_files = len(counts)
+    total_chunks = sum(counts.values())
 
     return {
         "total_files": total_files,
@@ -85,18 +117,27 @@ def record_operations_stats(
     n_new_files: int,
     n_updated_files: int,
     n_deleted_files: int,
-    images_count_per_file: dict
-) -> None:
+    images_count_per_file: dict,
+    reports: list[dict] | None = None,
+) -> list[int]:
     """Record ETL operation statistics to the SQL database.
 
     Retrieves current vector database statistics using read_weaviate_data(),
     then creates and stores a new ETLReport record with the combined statistics.
+    All the reports are written with a single multi-row INSERT. The details of
+    each file go to the ETLReportFile child table, the report only keeps their counts.
 
     Args:
         n_new_files (int): Number of new files processed in the current ETL operation
         n_updated_files (int): Number of files updated in the current ETL operation
         n_deleted_files (int): Number of files deleted in the current ETL operation
         images_count_per_file (dict): Dictionary mapping filenames to unprocessed image counts
+        reports (list[dict], optional): Additional ETLReport rows, as column mappings,
+            to be written in the same round-trip
+
+    Returns:
+        list[int]: The ids of the inserted reports, the current one first.
+
     Raises:
         DBError: If there's an error during database operations
 
@@ -104,35 +145,56 @@ def record_operations_stats(
     logger.info("--- Reading Weaviate data...")
     vector_db_data = read_weaviate_data()
 
-    # Add unprocessed images count to files_in_db
+    # Add unprocessed images count to files_in_db, defaulting to 0 if not found
     for filename, file_data in vector_db_data["files_in_db"].items():
-        if filename in images_count_per_file:
-            file_data["Unprocessed_parts"] = images_count_per_file[filename]
-        else:
-            file_data["Unprocessed_parts"] = 0  # Default to 0 if not found
-
+        file_data["Unprocessed_parts"] = images_count_per_file.get(filename, 0)
 
     engine = sql_server_settings.engine
 
+    files_in_db = vector_db_data["files_in_db"]
+    mappings = [
+        {
+            "app_id": rag_app_settings.app_id,
+            "new_files": n_new_files,
+            "updated_files": n_updated_files,
+            "deleted_files": n_deleted_files,
+            "total_files": vector_db_data["total_files"],
+            "total_chunks": vector_db_data["total_chunks"],
+            # the details of each file are in ETLReportFile, only the counts are kept here
+            "files_in_db": {
+                "files": vector_db_data["total_files"],
+                "chunks": vector_db_data["total_chunks"],
+                "unprocessed_parts": sum(file_data["Unprocessed_parts"] for file_data in files_in_db.values()),
+            },
+        },
+        *(reports or []),
+    ]
+
     logger.info("--- Writing report to SQL Server...")
     with Session(engine) as session:
         try:
-            rep2rec = ETLReport(
-                app_id=rag_app_settings.app_id,
-                new_files=n_new_files,
-                updated_files=n_updated_files,
-                deleted_files=n_deleted_files,
-                total_files=vector_db_data["total_files"],
-                total_chunks=vector_db_data["total_chunks"],
-                files_in_db=vector_db_data["files_in_db"],
-            )
-
-            session.add(rep2rec)
-            session.flush()  # getting the auto-generated id
-            session.commit()
+            # the transaction is rolled back by session.begin() if anything goes wrong
+            with session.begin():
+                report_ids = session.scalars(
+                    insert(ETLReport).returning(ETLReport.id, sort_by_parameter_order=True),
+                    mappings,
+                ).all()
+
+                file_rows = [
+                    {
+                        "report_id": report_ids[0],
+                        "file_name": filename,
+                        "creation_date": file_data["Creation Date"],
+                        "link": file_data["Link"],
+                        "chunk_count": file_data["Number of chunks"],
+                        "unprocessed_parts": file_data["Unprocessed_parts"],
+                    }
+                    for filename, file_data in files_in_db.items()
+                ]
+                if file_rows:
+                    session.execute(insert(ETLReportFile), file_rows)
 
         except Exception as e:  # noqa: BLE001
-            # Something gone wrong, rolling back all the changes within the sesion.
-            session.rollback()
             raise DBError(str(e))  # noqa: B904
     logger.info("--- Report succesfully wrote.")
+    return list(report_ids)
@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 
 class Parser(ABC):
     """Abstract base class for document parsers."""
+
+    __slots__ = ()
     
     @abstractmethod
     def parse(
@@ -101,6 +101,10 @@ class ProcessingConfig(BaseModel):
         default=None,
         description="Separators for recursive chunking"
     )
+    fast_recursive_splitter: bool = Field(
+        default=False,
+        description="Use the single-pass splitter (FastRecursiveTextSplitter) for recursive chunking"
+    )
     
     document_page_stitching: bool = Field(
         default=False,
@@ -127,6 +131,27 @@ class ProcessingConfig(BaseModel):
         description="Enable iterative chunk reconstruction for improved results"
     )
 
+    # Keyword generation configuration
+    llm_concurrency: int = Field(
+        default=20,
+        gt=0,
+        description="Maximum number of concurrent LLM calls for keyword generation"
+    )
+    di_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum number of files parsed concurrently by process_files"
+    )
+    chunk_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Number of threads chunking and reconstructing parsed files in process_files"
+    )
+    use_batch_api: bool = Field(
+        default=False,
+        description="Generate the keywords in process_files and the vision page summaries through the Azure OpenAI Batch API (up to 24h turnaround)"
+    )
+
     model_config = ConfigDict(use_enum_values=True)
     
 
@@ -1,6 +1,10 @@
 
 from __future__ import annotations
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 from typing import Optional
 
 from langchain.schema import Document
@@ -13,9 +17,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Above this number of chunks, the RAGEntry objects are built in a thread pool
+PARALLEL_ENTRIES_THRESHOLD = 500
+
 
 class BaseChunker(Chunker, ABC):
     """Base class for chunkers."""
+
+    # Whether split_text may split a text that already fits in one chunk
+    splits_within_chunk_size: bool = False
+
     def __init__(self, config: ProcessingConfig, embeddings: Optional[AzureOpenAIEmbeddings] = None):
         self.config = config
         self.embeddings = embeddings
@@ -25,6 +36,9 @@ class BaseChunker(Chunker, ABC):
         """
         Split text into chunks. Must be implemented by subclasses.
         
+        Chunkers that embed the text while splitting (e.g. semantic splitting) can put each
+        chunk's embedding in Document.metadata["vector"]: it is stored as is, not recomputed.
+        
         Args:
             text: The text to split
             **kwargs: Additional parameters (e.g., metadata)
@@ -37,32 +51,62 @@ class BaseChunker(Chunker, ABC):
 
     def process_entry(self, data: RAGEntry, do_augment_metadata: bool = True) -> list[RAGEntry]:
         try:
+            # Dump the original metadata once: ALL its fields are carried over to each chunk,
+            # only the ones that differ per chunk are reset
+            base_meta = data.metadata.model_dump(exclude={"keywords", "vector"})
+            base_meta["chunk_idx"] = ""  # Will be set later in file_processor
+
+            # Short text: the splitter would return it whole (stripped), skip it
+            text = data.content
+            if not self.splits_within_chunk_size and len(text) <= self.config.chunk_size and text.strip():
+                return self._build_entries(
+                    [Document(page_content=text.strip())], base_meta=base_meta, file_id=data.file_id
+                )
+
             # Use split_text method to get chunks
             # Note: We don't pass metadata here because we preserve the original metadata 
-            # from data.metadata using model_copy() below
-            chunks = self.split_text(text=data.content)
-            
-            result = []
-            for i, chunk_doc in enumerate(chunks):
-                # Use model_copy() - this automatically copies ALL fields from the original metadata
-                # No need to manually specify each field!
-                meta = data.metadata.model_copy(deep=False)
-                
-                # Only reset fields that should be different for each chunk
-                meta.chunk_idx = ""  # Will be set later in file_processor
-                meta.keywords = []    # Will be generated per chunk
-                meta.vector = []      # Will be generated per chunk
-                
-                # Create RAGEntry for this chunk
-                result.append(RAGEntry(
-                    content=chunk_doc.page_content,
-                    metadata=meta,
-                    file_id=data.file_id
-                ))
-                
-            logger.debug(f"Processed entry {data.file_id}: created {len(result)} chunks from {len(data.content)} characters")
+            # from data.metadata using model_construct() below
+            chunks = self.split_text(text=text)
+
+            if len(chunks) > PARALLEL_ENTRIES_THRESHOLD:
+                # Split the chunks in one slab per worker, keeping their order
+                n_workers = os.cpu_count() or 1
+                slab_size = -(-len(chunks) // n_workers)
+                slabs = [chunks[i:i + slab_size] for i in range(0, len(chunks), slab_size)]
+                build_entries = partial(self._build_entries, base_meta=base_meta, file_id=data.file_id)
+                with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                    result = list(chain.from_iterable(executor.map(build_entries, slabs)))
+            else:
+                result = self._build_entries(chunks, base_meta=base_meta, file_id=data.file_id)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Processed entry %s: created %d chunks from %d characters",
+                    data.file_id, len(result), len(data.content),
+                )
             return result
 
         except Exception as e:
             logger.error(f"Failed to process entry {data.file_id}: {e}", exc_info=True)
             raise
+
+    @staticmethod
+    def _build_entries(chunk_docs: list[Document], base_meta: dict, file_id: str) -> list[RAGEntry]:
+        """Build one RAGEntry per chunk, each with its own copy of the base metadata."""
+        result = []
+        for chunk_doc in chunk_docs:
+            # model_construct() skips validation, the values were validated with the entry metadata
+            meta = RAGMetadata.model_construct(
+                **base_meta,
+                keywords=[],  # Will be generated per chunk
+                vector=chunk_doc.metadata.get("vector") or [],  # Generated per chunk unless the chunker did
+            )
+
+            # Create RAGEntry for this chunk: content is the splitter's str and file_id
+            # comes from the validated entry, so validation is skipped here too
+            result.append(RAGEntry.model_construct(
+                content=chunk_doc.page_content,
+                metadata=meta,
+                file_id=file_id
+            ))
+        return result
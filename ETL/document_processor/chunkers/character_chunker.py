@@ -28,9 +28,9 @@ class CharacterChunker(BaseChunker):
             is_separator_regex=False,
         )
         
-        logger.info(
-            f"Initialized CharacterChunker with chunk_size={config.chunk_size}, "
-            f"chunk_overlap={config.chunk_overlap}, separator='\\n\\n'"
+        logger.debug(
+            "Initialized CharacterChunker with chunk_size=%d, chunk_overlap=%d, separator='\\n\\n'",
+            config.chunk_size, config.chunk_overlap,
         )
 
     def split_text(self, text: str, **kwargs) -> List[Document]:
@@ -48,7 +48,7 @@ class CharacterChunker(BaseChunker):
             logger.warning("Empty text provided for chunking")
             return []
 
-        logger.debug(f"Splitting text of length {len(text)} characters")
+        logger.debug("Splitting text of length %d characters", len(text))
         
         # Extract metadata from kwargs if provided
         metadata = kwargs.get("metadata", {})
@@ -56,12 +56,14 @@ class CharacterChunker(BaseChunker):
         # Use split_text method
         chunks = self._splitter.split_text(text)
         
-        # Convert to Document objects
+        # Convert to Document objects, each one owning a shallow copy of the metadata.
+        # The splitter's create_documents() is not used: it deep-copies per chunk.
+        copy_metadata = metadata.copy
         documents = [
-            Document(page_content=chunk, metadata=metadata.copy())
+            Document(page_content=chunk, metadata=copy_metadata())
             for chunk in chunks
         ]
         
-        logger.debug(f"Created {len(documents)} chunks from input text")
+        logger.debug("Created %d chunks from input text", len(documents))
         
         return documents
@@ -4,7 +4,7 @@ from typing import Optional
 from langchain_openai import AzureOpenAIEmbeddings
 
 from ETL.document_processor.base.interfaces import Chunker
-from ETL.document_processor.base.models import ProcessingConfig
+from ETL.document_processor.base.models import ChunkingStrategy, ProcessingConfig
 from ETL.document_processor.chunkers.recursive_chunker import RecursiveChunker
 from ETL.document_processor.chunkers.markdown_chunker import MarkdownChunker
 from ETL.document_processor.chunkers.character_chunker import CharacterChunker
@@ -17,26 +17,23 @@ logger = logging.getLogger(__name__)
 class ChunkerFactory:
     """Factory for creating chunker instances."""
 
+    # keyed by the enum; ChunkingStrategy is a str Enum, so plain strings hash to the same slots
     _chunkers = {
-        "recursive": RecursiveChunker,
-        "markdown": MarkdownChunker,
-        "character": CharacterChunker,
+        ChunkingStrategy.RECURSIVE: RecursiveChunker,
+        ChunkingStrategy.MARKDOWN: MarkdownChunker,
+        ChunkingStrategy.CHARACTER: CharacterChunker,
     }
 
     @staticmethod
     def create_chunker(config: ProcessingConfig, embeddings: Optional[AzureOpenAIEmbeddings] = None) -> Chunker:
-        strategy = config.chunking_strategy
-        if hasattr(strategy, "value"):
-            strategy = strategy.value
-
-        if strategy not in ChunkerFactory._chunkers:
+        chunker_class = ChunkerFactory._chunkers.get(config.chunking_strategy)
+        if chunker_class is None:
             logger.warning(
-                f"Unknown chunking strategy '{strategy}'. Falling back to 'recursive'. "
-                f"Supported: {list(ChunkerFactory._chunkers.keys())}"
+                f"Unknown chunking strategy '{config.chunking_strategy}'. Falling back to 'recursive'. "
+                f"Supported: {ChunkerFactory.get_supported_strategies()}"
             )
-            strategy = "recursive"
+            chunker_class = RecursiveChunker
 
-        chunker_class = ChunkerFactory._chunkers[strategy]
         return chunker_class(config)
 
     @classmethod
@@ -46,4 +43,4 @@ class ChunkerFactory:
 
     @classmethod
     def get_supported_strategies(cls) -> list[str]:
-        return list(cls._chunkers.keys())
\ No newline at end of file
+        return [getattr(strategy, "value", strategy) for strategy in cls._chunkers]
\ No newline at end of file
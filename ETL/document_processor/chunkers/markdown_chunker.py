@@ -16,14 +16,17 @@ logger = logging.getLogger(__name__)
 
 class MarkdownChunker(BaseChunker):
     """Chunker that splits text by markdown headers."""
-    
+
+    # Headers split the text whatever its length
+    splits_within_chunk_size = True
+
     def __init__(self, config: ProcessingConfig, embeddings: Optional[AzureOpenAIEmbeddings] = None):
         super().__init__(config, embeddings)
         
         headers = config.markdown_headers or [("#", "h1"), ("##", "h2"), ("###", "h3")]
         self._splitter = MarkdownHeaderTextSplitter(headers_to_split_on=headers, return_each_line=True, strip_headers=False)
         
-        logger.info(f"Initialized MarkdownChunker with headers: {headers}")
+        logger.debug("Initialized MarkdownChunker with headers: %s", headers)
 
     def split_text(self, text: str, **kwargs) -> List[Document]:
         """
@@ -40,7 +43,7 @@ class MarkdownChunker(BaseChunker):
             logger.warning("Empty text for markdown splitting")
             return []
 
-        logger.debug(f"Splitting markdown text of length {len(text)} characters")
+        logger.debug("Splitting markdown text of length %d characters", len(text))
         
         # Extract metadata from kwargs if provided
         base_metadata = kwargs.get("metadata", {})
@@ -49,18 +52,17 @@ class MarkdownChunker(BaseChunker):
         split_docs = self._splitter.split_text(text)
         
         # Merge base metadata with header metadata
+        base = dict(base_metadata)
         result = []
         for doc in split_docs:
-            # Combine base metadata with the header metadata from splitting
-            combined_metadata = base_metadata.copy()
-            if doc.metadata:
-                combined_metadata.update(doc.metadata)
-            
+            # Combine base metadata with the header metadata from splitting;
+            # Document copies the dict it is given, so the base can be passed as is
+            md = doc.metadata
             result.append(Document(
                 page_content=doc.page_content,
-                metadata=combined_metadata
+                metadata={**base, **md} if md else base
             ))
         
-        logger.debug(f"Created {len(result)} chunks from markdown text")
+        logger.debug("Created %d chunks from markdown text", len(result))
         
         return result
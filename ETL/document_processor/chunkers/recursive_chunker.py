@@ -1,6 +1,7 @@
 
 from __future__ import annotations
-from typing import Optional, List
+import re
+from typing import Any, Optional, List
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
@@ -13,6 +14,76 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_NON_SPACE = re.compile(r"\S")
+
+
+class FastRecursiveTextSplitter(RecursiveCharacterTextSplitter):
+    """
+    Single-pass variant of RecursiveCharacterTextSplitter.
+
+    The text is walked once, from start to end, slicing one chunk at a time:
+    each chunk ends at the last occurrence of the highest-priority separator
+    that fits in chunk_size, and the next chunk restarts at the first occurrence
+    of that same separator inside the overlap window. Without any separator in
+    the window, the text is cut hard at chunk_size. A chunk always ends past the
+    end of the previous one, so no chunk is contained in the one before it.
+    """
+
+    def __init__(self, separators: Optional[list[str]] = None, **kwargs: Any):
+        super().__init__(separators=separators, **kwargs)
+        # The empty separator ("split anywhere") is the hard-cut fallback
+        self._split_separators = [sep for sep in self._separators if sep]
+
+    def split_text(self, text: str) -> list[str]:
+        if self._is_separator_regex or self._length_function is not len:
+            # Index math only holds for literal separators and a length in characters
+            return super().split_text(text)
+
+        chunks: list[str] = []
+        text_length = len(text)
+        start = 0
+        # First non-whitespace character after the previous chunk: the overlap restarts
+        # before it, but the next chunk has to include it
+        prev_end = 0
+        while start < text_length:
+            end = start + self._chunk_size
+            cut, separator = min(end, text_length), None
+            if end < text_length:
+                # Searches run in C over the current window only
+                for sep in self._split_separators:
+                    idx = text.rfind(sep, max(start, prev_end) + 1, end)
+                    if idx != -1:
+                        cut, separator = idx, sep
+                        break
+
+            chunk = text[start:cut]
+            if self._strip_whitespace:
+                chunk = chunk.strip()
+            if chunk:
+                chunks.append(chunk)
+            if cut >= text_length:
+                break
+
+            match = _NON_SPACE.search(text, cut)
+            if match is None:
+                # only whitespace left, already in the previous chunk
+                break
+            prev_end = match.start()
+
+            next_start = cut
+            if self._chunk_overlap:
+                window_start = max(start + 1, cut - self._chunk_overlap)
+                if separator is not None:
+                    idx = text.find(separator, window_start, cut)
+                    if idx != -1:
+                        next_start = idx
+                else:
+                    next_start = window_start
+            # the next chunk must still reach past the previous one
+            start = max(next_start, prev_end - self._chunk_size + 1)
+
+        return chunks
+
 
 class RecursiveChunker(BaseChunker):
     """Recursive character-based text splitter."""
@@ -21,16 +92,19 @@ class RecursiveChunker(BaseChunker):
         super().__init__(config, embeddings)
         
         # Configure splitter with proper parameters
-        self._splitter = RecursiveCharacterTextSplitter(
+        splitter_class = (
+            FastRecursiveTextSplitter if config.fast_recursive_splitter else RecursiveCharacterTextSplitter
+        )
+        self._splitter = splitter_class(
             chunk_size=config.chunk_size,
             chunk_overlap=config.chunk_overlap,
             length_function=len,
             separators=config.separators if config.separators else None,
         )
         
-        logger.info(
-            f"Initialized RecursiveChunker with chunk_size={config.chunk_size}, "
-            f"chunk_overlap={config.chunk_overlap}"
+        logger.debug(
+            "Initialized RecursiveChunker with chunk_size=%d, chunk_overlap=%d",
+            config.chunk_size, config.chunk_overlap,
         )
 
     def split_text(self, text: str, **kwargs) -> List[Document]:
@@ -49,17 +123,20 @@ class RecursiveChunker(BaseChunker):
             return []
 
         # Log text length for debugging
-        logger.debug(f"Splitting text of length {len(text)} characters")
+        logger.debug("Splitting text of length %d characters", len(text))
         
         metadata = kwargs.get("metadata", {})
         
         chunks = self._splitter.split_text(text)
         
+        # Convert to Document objects, each one owning a shallow copy of the metadata.
+        # The splitter's create_documents() is not used: it deep-copies per chunk.
+        copy_metadata = metadata.copy
         documents = [
-            Document(page_content=chunk, metadata=metadata.copy())
+            Document(page_content=chunk, metadata=copy_metadata())
             for chunk in chunks
         ]
         
-        logger.debug(f"Created {len(documents)} chunks from input text")
+        logger.debug("Created %d chunks from input text", len(documents))
         
         return documents
@@ -3,16 +3,28 @@ Main File Processor Orchestrator
 """
 
 from __future__ import annotations
+import asyncio
+import itertools
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import logging
-from time import sleep
 
+import httpx
+import requests
 import weaviate
+from requests.adapters import HTTPAdapter
+from weaviate.classes.query import Filter, QueryNested
 from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient as AsyncDocumentIntelligenceClient
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
+from openai import AzureOpenAI
 
 from ETL.document_processor.base.models import RAGEntry, RAGMetadata, ProcessingConfig
 from ETL.document_processor.utils.exceptions import ProcessingError, StorageError
@@ -26,9 +38,82 @@ from ETL.document_processor.utils.settings import (
     document_intelligence_settings,
     weaviate_settings,
 )
+from ETL.tools.async_loop import run_coroutine
 
 logger = logging.getLogger(__name__)
 
+# Number of chunk contents sent per embeddings request
+EMBEDDING_BATCH_SIZE = 16
+
+# Attempts of the embeddings client on a failed or throttled request
+EMBEDDING_MAX_RETRIES = 5
+
+# Number of files waiting between two stages of process_files
+PIPELINE_QUEUE_SIZE = 8
+
+# Number of (file id, etag) lookups remembered by a FileProcessor
+ETAG_CACHE_SIZE = 1024
+
+# Seconds between two status checks of an Azure OpenAI batch job
+BATCH_POLL_SECONDS = 60
+
+# Connection pool shared by the Azure clients
+HTTP_MAX_CONNECTIONS = 128
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+
+# Parser type of each non-pdf extension, anything else is read as text
+_EXT_TO_PARSER = {
+    ".txt": "text",
+    ".text": "text",
+    ".md": "text",
+    ".docx": "docx",
+    ".aspx": "aspx",
+    ".xlsx": "excel",
+}
+
+# Metadata fields that are not stored in Weaviate
+UNSTORED_METADATA_FIELDS = frozenset({"header_pages", "vector"})
+
+
+def _chunk_properties(chunk: RAGEntry) -> dict:
+    """
+    Build the Weaviate properties of a chunk from plain attribute reads.
+
+    Same result as chunk.model_dump(exclude={"metadata": UNSTORED_METADATA_FIELDS}) without
+    going through the pydantic serializer and its exclude resolution for every chunk.
+    """
+    meta = chunk.metadata
+    metadata = {
+        "source": meta.source,
+        "file_name": meta.file_name,
+        "document_title": meta.document_title,
+        "keywords": list(meta.keywords),
+        "chunk_idx": meta.chunk_idx,
+        "page_number": meta.page_number,
+    }
+    if meta.__pydantic_extra__:
+        metadata.update(
+            (key, value) for key, value in meta.__pydantic_extra__.items() if key not in UNSTORED_METADATA_FIELDS
+        )
+    return {"content": chunk.content, "metadata": metadata, "file_id": chunk.file_id}
+
+
+class _ThreadDIClient:
+    """
+    Document Intelligence client resolved on every call, on the thread making it.
+
+    Parsers can be built on the event loop thread and parse in worker threads: each
+    call then goes through the pool client of the worker thread, not of the loop.
+    """
+
+    __slots__ = ("_get_client",)
+
+    def __init__(self, get_client: Callable[[], DocumentIntelligenceClient]):
+        self._get_client = get_client
+
+    def __getattr__(self, name: str):
+        return getattr(self._get_client(), name)
+
 
 class FileProcessor:
     """Main orchestrator for document processing pipeline."""
@@ -36,6 +121,8 @@ class FileProcessor:
     #def __init__(self, config: Optional[ProcessingConfig] = None):
         self.weaviate_client = weaviate_client
         self.config = config or ProcessingConfig()
+        # (file id, etag) -> number of chunks already stored for that version of the file
+        self._etag_cache: OrderedDict[tuple[str, str], int] = OrderedDict()
 
         try:
             self.collection = self.weaviate_client.collections.get(weaviate_settings.collection_name)
@@ -65,14 +152,25 @@ class FileProcessor:
         )
 
     def _initialize_azure_components(self):
+        # One keep-alive pool for the OpenAI clients, requests sessions for Document Intelligence
+        # (azure-core has no httpx transport), so connections stay warm across the calls
+        self._http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            )
+        )
+
         self.embeddings = AzureOpenAIEmbeddings(
             azure_deployment=azure_openai_embedding_settings.deployment,
             openai_api_version=azure_openai_embedding_settings.api_version,
             azure_endpoint=azure_openai_embedding_settings.endpoint,
             openai_api_key=azure_openai_embedding_settings.api_key,
-            max_retries=3,
-            retry_min_seconds=20,
-            retry_max_seconds=60,
+            # the client retries with exponential backoff and honours Retry-After
+            max_retries=EMBEDDING_MAX_RETRIES,
+            retry_min_seconds=1,
+            retry_max_seconds=30,
+            http_client=self._http_client,
         )
         self.llm = AzureChatOpenAI(
             azure_endpoint=azure_openai_completion_settings.endpoint,
@@ -83,12 +181,55 @@ class FileProcessor:
             verbose=False,
             streaming=False,
             max_retries=3,
+            http_client=self._http_client,
         )
-        self.di_client = DocumentIntelligenceClient(
-            endpoint=document_intelligence_settings.endpoint,
-            credential=AzureKeyCredential(document_intelligence_settings.api_key),
-            api_version="2024-07-31-preview",
-        )
+        # One Document Intelligence client per config.di_concurrency, each with its own session,
+        # so the threads parsing PDFs don't all queue on the same connection pool
+        pool_maxsize = max(1, HTTP_MAX_KEEPALIVE_CONNECTIONS // self.config.di_concurrency)
+        self._di_sessions = []
+        self._di_pool = []
+        for _ in range(self.config.di_concurrency):
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_maxsize=pool_maxsize))
+            self._di_sessions.append(session)
+            self._di_pool.append(
+                DocumentIntelligenceClient(
+                    endpoint=document_intelligence_settings.endpoint,
+                    credential=AzureKeyCredential(document_intelligence_settings.api_key),
+                    api_version="2024-07-31-preview",
+                    transport=RequestsTransport(session=session, session_owner=False),
+                )
+            )
+        self.di_client = self._di_pool[0]
+        self._di_local = threading.local()
+        self._di_turn = itertools.count()
+        self._thread_di_client = _ThreadDIClient(self._get_di_client)
+
+    def _get_di_client(self) -> DocumentIntelligenceClient:
+        """Return the Document Intelligence client of the calling thread.
+
+        Threads get the clients of the pool in turn, on their first call. Thread idents
+        are aligned addresses, so they can't be used modulo the pool size.
+        """
+        di_client = getattr(self._di_local, "client", None)
+        if di_client is None:
+            di_client = self._di_pool[next(self._di_turn) % len(self._di_pool)]
+            self._di_local.client = di_client
+        return di_client
+
+    def close(self) -> None:
+        """Close the Azure clients and their connection pools."""
+        for di_client in self._di_pool:
+            di_client.close()
+        for session in self._di_sessions:
+            session.close()
+        self._http_client.close()
+
+    def __enter__(self) -> FileProcessor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _choose_parser_type_for_extension(self, ext: str) -> str:
         """
@@ -100,64 +241,314 @@ class FileProcessor:
         if ext == ".pdf":
             parser_type = self.config.parser_type
             return parser_type if isinstance(parser_type, str) else parser_type.value
-        if ext in [".txt", ".text", ".md"]:
-            return "text"
-        if ext == ".docx":
-            return "docx"
-        if ext == ".aspx":
-            return "aspx"
-        if ext == ".xlsx":
-            return "excel"
-        return "text"
+        return _EXT_TO_PARSER.get(ext, "text")
+
+    def _get_parser(self, file_path: Path, async_di_client: Optional[AsyncDocumentIntelligenceClient] = None):
+        file_type = file_path.suffix.lstrip(".").lower()
+        parser_type = self._choose_parser_type_for_extension(file_path.suffix)
+
+        return ParserFactory.get_parser(
+            file_type=file_type,
+            parser_type=parser_type,
+            di_client=self._thread_di_client,
+            llm=self.llm,
+            config=self.config,
+            async_di_client=async_di_client,
+        )
 
     def process_file(self, file_path: Path, file_metadata: dict) -> tuple[int, int]:
         try:
             logger.info(f"Processing file: {file_path.name} ({file_path.suffix})")
 
-            file_type = file_path.suffix.lstrip(".").lower()
-            parser_type = self._choose_parser_type_for_extension(file_path.suffix)
+            n_existing_chunks = self._count_stored_chunks(file_path, file_metadata)
+            if n_existing_chunks:
+                logger.info(f"Skipping {file_path.name}: unchanged, {n_existing_chunks} chunks already stored")
+                return n_existing_chunks, 0
 
-            parser = ParserFactory.get_parser(
-                file_type=file_type,
-                parser_type=parser_type,
-                di_client=self.di_client,
-                llm=self.llm,
-                config=self.config
-            )
+            parser = self._get_parser(file_path)
 
             markdown_content, n_unprocessed_images = parser.parse(
                 file_path=file_path,
                 file_metadata=file_metadata
             )
 
-            chunks = self.chunker.split_text(text=markdown_content, metadata={"source": str(file_path)})
+            chunks_as_entries = self._chunk_parsed(file_path, markdown_content, file_metadata)
+            self._store_entries(file_path, chunks_as_entries)
+            return len(chunks_as_entries), n_unprocessed_images
 
-            chunks_as_entries = self._convert_chunks_to_entries(
-                chunks=chunks,
-                file_path=file_path,
-                file_metadata=file_metadata
-            )
+        except Exception as e:
+            logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
+            raise ProcessingError(f"File processing failed for {file_path.name}: {e}") from e
 
-            # The agent internally decides what to do (summary, iterative, both, or nothing)
-            if self.config.append_summary_to_chunks or self.config.use_iterative_reconstruction:
-                logger.info("Reconstructing chunks...")
-                chunks_as_entries = self.reconstruction_agent.reconstruct_chunks(
-                    chunks=chunks_as_entries,
-                    original_content=markdown_content,
-                    filename=file_path.stem
-                )
+    def process_files(
+        self,
+        items: list[tuple[Path, dict]],
+        on_file_done: Callable[[int, tuple[int, int]], None] | None = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Process several files, overlapping their stages across files.
+
+        Three stages connected by bounded queues, so a slow stage holds back the others:
+        - parse: up to config.di_concurrency files at a time (PDFs through the async
+          Document Intelligence client)
+        - chunk and reconstruct: config.chunk_workers threads
+        - store: a single worker, the calling thread, which sends the Weaviate batches
+
+        Args:
+            items: (file_path, file_metadata) pairs
+            on_file_done: Called with the index and the result of each file once it is stored
+
+        Returns:
+            (number of chunks, unprocessed images) for each file, in the order of items
+
+        Raises:
+            ProcessingError: The first failure, raised once the other files are processed and stored.
+        """
+        if self.config.use_batch_api:
+            return self.process_files_batched(items, on_file_done=on_file_done)
+
+        results: list[tuple[int, int] | None] = [None] * len(items)
+        to_process = self._skip_unchanged_files(items, results)
+
+        parsed_queue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        chunked_queue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        n_workers = self.config.chunk_workers
+
+        def parse_stage() -> None:
+            try:
+                asyncio.run(self._aparse_files(items, to_process, parsed_queue))
+            finally:
+                for _ in range(n_workers):
+                    parsed_queue.put(None)
+
+        def chunk_stage() -> None:
+            while (item := parsed_queue.get()) is not None:
+                index, parsed = item
+                file_path, file_metadata = items[index]
+                if not isinstance(parsed, Exception):
+                    markdown_content, n_unprocessed_images = parsed
+                    try:
+                        entries = self._chunk_parsed(file_path, markdown_content, file_metadata)
+                        parsed = (entries, n_unprocessed_images)
+                    except Exception as e:
+                        logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
+                        parsed = ProcessingError(f"File processing failed for {file_path.name}: {e}")
+                chunked_queue.put((index, parsed))
+            chunked_queue.put(None)
+
+        first_error: Exception | None = None
+        with ThreadPoolExecutor(max_workers=1 + n_workers) as executor:
+            parse_future = executor.submit(parse_stage)
+            for _ in range(n_workers):
+                executor.submit(chunk_stage)
+
+            # store stage: keep storing until every chunk worker is done, a failed file doesn't
+            # hold back the others and the upstream stages would otherwise block on the full queues
+            n_done = 0
+            while n_done < n_workers:
+                item = chunked_queue.get()
+                if item is None:
+                    n_done += 1
+                    continue
+                index, chunked = item
+                file_path, _ = items[index]
+                if isinstance(chunked, Exception):
+                    first_error = first_error or chunked
+                    continue
+                entries, n_unprocessed_images = chunked
+                try:
+                    self._store_entries(file_path, entries)
+                    results[index] = (len(entries), n_unprocessed_images)
+                    if on_file_done is not None:
+                        on_file_done(index, results[index])
+                except Exception as e:
+                    logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
+                    first_error = first_error or ProcessingError(f"File processing failed for {file_path.name}: {e}")
+
+        # surfaces a failure of the parse stage itself, e.g. opening the Document Intelligence client
+        parse_future.result()
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def process_files_batched(
+        self,
+        items: list[tuple[Path, dict]],
+        on_file_done: Callable[[int, tuple[int, int]], None] | None = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Process several files, generating all their keywords with one Azure OpenAI Batch API job.
+
+        The files are parsed and chunked first, then the keyword requests of every chunk are
+        sent as a single batch, and the chunks are stored once it completes. The batch can take
+        up to 24h: only for runs where latency doesn't matter.
 
-            if chunks_as_entries:
-                self.store_chunks(chunks_as_entries)
-                logger.info(f"Successfully processed {file_path.name}: {len(chunks_as_entries)} chunks stored")
+        Args:
+            items: (file_path, file_metadata) pairs
+            on_file_done: Called with the index and the result of each file once it is stored
+
+        Returns:
+            (number of chunks, unprocessed images) for each file, in the order of items
+        """
+        results: list[tuple[int, int] | None] = [None] * len(items)
+        to_process = self._skip_unchanged_files(items, results)
+
+        parsed_queue: queue.Queue = queue.Queue()
+        asyncio.run(self._aparse_files(items, to_process, parsed_queue))
+
+        chunked: dict[int, tuple[list[RAGEntry], int]] = {}
+        while not parsed_queue.empty():
+            index, parsed = parsed_queue.get()
+            if isinstance(parsed, Exception):
+                raise parsed
+            file_path, file_metadata = items[index]
+            markdown_content, n_unprocessed_images = parsed
+            try:
+                chunked[index] = (self._chunk_parsed(file_path, markdown_content, file_metadata), n_unprocessed_images)
+            except Exception as e:
+                logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
+                raise ProcessingError(f"File processing failed for {file_path.name}: {e}") from e
+
+        texts = {
+            f"{index}-{i}": self._content_for_keywords(chunk)
+            for index, (entries, _) in chunked.items()
+            for i, chunk in enumerate(entries)
+        }
+        keywords: dict[str, list[str]] = {}
+        if texts:
+            client = AzureOpenAI(
+                azure_endpoint=azure_openai_completion_settings.endpoint,
+                api_key=azure_openai_completion_settings.api_key,
+                api_version=azure_openai_completion_settings.api_version,
+            )
+            try:
+                keywords = self.keyword_generator.generate_keywords_batch(
+                    texts,
+                    client=client,
+                    deployment=azure_openai_completion_settings.batch_deployment
+                    or azure_openai_completion_settings.deployment,
+                    poll_interval=BATCH_POLL_SECONDS,
+                )
+            except Exception as e:
+                logger.warning(f"Keyword batch failed, storing the chunks without keywords: {e}")
+
+        for index, (entries, n_unprocessed_images) in chunked.items():
+            file_path, _ = items[index]
+            for i, chunk in enumerate(entries):
+                chunk.metadata.keywords = keywords.get(f"{index}-{i}", [])
+            try:
+                if entries:
+                    self.store_chunks(entries, generate_keywords=False)
+                    logger.info(f"Successfully processed {file_path.name}: {len(entries)} chunks stored")
+                else:
+                    logger.warning(f"No chunks generated for {file_path.name}")
+            except Exception as e:
+                logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
+                raise ProcessingError(f"File processing failed for {file_path.name}: {e}") from e
+            results[index] = (len(entries), n_unprocessed_images)
+            if on_file_done is not None:
+                on_file_done(index, results[index])
+
+        return results
+
+    def _skip_unchanged_files(self, items: list[tuple[Path, dict]], results: list) -> list[int]:
+        """Fill results for the files already stored with the same etag, return the indexes of the others."""
+        to_process = []
+        for index, (file_path, file_metadata) in enumerate(items):
+            n_existing_chunks = self._count_stored_chunks(file_path, file_metadata)
+            if n_existing_chunks:
+                logger.info(f"Skipping {file_path.name}: unchanged, {n_existing_chunks} chunks already stored")
+                results[index] = (n_existing_chunks, 0)
             else:
-                logger.warning(f"No chunks generated for {file_path.name}")
+                to_process.append(index)
+        return to_process
 
-            return len(chunks_as_entries), n_unprocessed_images
+    async def _aparse_files(self, items: list[tuple[Path, dict]], indexes: list[int], parsed_queue: queue.Queue) -> None:
+        """Parse items[indexes] concurrently, putting (index, (content, n_unprocessed) or error) on the queue."""
+        semaphore = asyncio.Semaphore(self.config.di_concurrency)
 
-        except Exception as e:
-            logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
-            raise ProcessingError(f"File processing failed for {file_path.name}: {e}") from e
+        # the async client is bound to the running event loop, so it lives for this run only
+        async with AsyncDocumentIntelligenceClient(
+            endpoint=document_intelligence_settings.endpoint,
+            credential=AzureKeyCredential(document_intelligence_settings.api_key),
+            api_version="2024-07-31-preview",
+        ) as async_di_client:
+
+            async def parse_one(index: int, file_path: Path, file_metadata: dict) -> None:
+                async with semaphore:
+                    try:
+                        logger.info(f"Parsing file: {file_path.name} ({file_path.suffix})")
+                        parser = self._get_parser(file_path, async_di_client=async_di_client)
+                        parsed = await parser.aparse(file_path=file_path, file_metadata=file_metadata)
+                    except Exception as e:
+                        logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
+                        parsed = ProcessingError(f"File processing failed for {file_path.name}: {e}")
+                    # a blocking put applies the queue backpressure, keep it off the event loop
+                    await asyncio.to_thread(parsed_queue.put, (index, parsed))
+
+            await asyncio.gather(*(parse_one(index, *items[index]) for index in indexes))
+
+    def _count_stored_chunks(self, file_path: Path, file_metadata: dict) -> int:
+        """
+        Count the chunks already stored for this version of the file.
+
+        Returns 0 unless Weaviate holds chunks of the same file id, with the same etag and
+        document title. A failed store deletes what it stored, so any chunk found means
+        the file is stored in full. Lookups are cached per (file id, etag) for the processor lifetime.
+        """
+        file_id = file_metadata.get("id", "")
+        etag = file_metadata.get("etag", "")
+        if not file_id or not etag:
+            return 0
+
+        key = (file_id, etag)
+        if key in self._etag_cache:
+            self._etag_cache.move_to_end(key)
+            return self._etag_cache[key]
+
+        # the nested metadata can't be filtered on, so filter on file_id and compare the etag
+        file_filter = Filter.by_property("file_id").equal(file_id)
+        response = self.collection.query.fetch_objects(
+            filters=file_filter,
+            limit=1,
+            return_properties=[QueryNested(name="metadata", properties=["etag", "document_title"])],
+        )
+        n_chunks = 0
+        if response.objects:
+            metadata = response.objects[0].properties["metadata"]
+            if metadata.get("etag") == etag and metadata.get("document_title") == file_path.stem:
+                n_chunks = self.collection.aggregate.over_all(filters=file_filter, total_count=True).total_count
+
+        self._etag_cache[key] = n_chunks
+        if len(self._etag_cache) > ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
+        return n_chunks
+
+    def _chunk_parsed(self, file_path: Path, markdown_content: str, file_metadata: dict) -> list[RAGEntry]:
+        chunks = self.chunker.split_text(text=markdown_content, metadata={"source": str(file_path)})
+
+        chunks_as_entries = self._convert_chunks_to_entries(
+            chunks=chunks,
+            file_path=file_path,
+            file_metadata=file_metadata
+        )
+
+        # The agent internally decides what to do (summary, iterative, both, or nothing)
+        if self.config.append_summary_to_chunks or self.config.use_iterative_reconstruction:
+            logger.info("Reconstructing chunks...")
+            chunks_as_entries = self.reconstruction_agent.reconstruct_chunks(
+                chunks=chunks_as_entries,
+                original_content=markdown_content,
+                filename=file_path.stem
+            )
+        return chunks_as_entries
+
+    def _store_entries(self, file_path: Path, chunks_as_entries: list[RAGEntry]) -> None:
+        if chunks_as_entries:
+            self.store_chunks(chunks_as_entries)
+            logger.info(f"Successfully processed {file_path.name}: {len(chunks_as_entries)} chunks stored")
+        else:
+            logger.warning(f"No chunks generated for {file_path.name}")
 
 
     def _convert_chunks_to_entries(self, chunks: list, file_path: Path, file_metadata: dict) -> list[RAGEntry]:
@@ -167,71 +558,125 @@ class FileProcessor:
                 file_name=file_path.name,
                 file_type=file_path.suffix,
                 etag=file_metadata.get("etag", ""),
+                content_hash=file_metadata.get("content_hash", ""),
                 document_title=file_path.stem,
                 header_pages={},
             )
             result: list[RAGEntry] = []
             for chunk in chunks:
+                vector = None
                 if hasattr(chunk, "page_content"):
                     content = chunk.page_content
+                    vector = chunk.metadata.get("vector")
                 elif isinstance(chunk, dict):
                     content = chunk.get("content", chunk.get("text", str(chunk)))
+                    vector = chunk.get("vector")
                 else:
                     content = str(chunk)
                 if not content or not content.strip():
                     continue
-                result.append(RAGEntry(content=content, metadata=metadata, file_id=file_metadata.get("id", "")))
+                # each entry gets its own metadata: keywords, chunk_idx and vector are set per chunk;
+                # a vector computed by the chunker is kept so store_chunks doesn't embed it again
+                chunk_metadata = metadata.model_copy(update={"vector": vector} if vector else None)
+                result.append(RAGEntry(content=content, metadata=chunk_metadata, file_id=file_metadata.get("id", "")))
             return result
         except Exception as e:
             logger.error(f"Chunk conversion failed: {e}")
             raise ProcessingError(f"Chunk conversion failed: {e}") from e
 
-    def store_chunks(self, chunks: list[RAGEntry]) -> None:
+    def store_chunks(self, chunks: list[RAGEntry], generate_keywords: bool = True) -> None:
         if not chunks:
             logger.warning("No chunks to store")
             return
 
-        stored_count = 0
         failed_count = 0
-        max_retries = 3
 
+        if generate_keywords:
+            # Generate the keywords of all the chunks concurrently, on the shared event loop:
+            # the async client of self.llm must not move from one loop to another
+            keywords = run_coroutine(self._keywords_all(chunks))
+            for chunk, chunk_keywords in zip(chunks, keywords):
+                chunk.metadata.keywords = chunk_keywords
         for i, chunk in enumerate(chunks):
-            retry_count = 0
-            while retry_count <= max_retries:
-                try:
-                    content_for_keywords = (
-                        chunk.metadata.table_resume
-                        if hasattr(chunk.metadata, "table_resume") and chunk.metadata.table_resume
-                        else chunk.content
-                    )
-                    try:
-                        chunk.metadata.keywords = self.keyword_generator.generate_keywords(content_for_keywords)
-                    except Exception as e:
-                        logger.warning(f"Keyword generation failed for chunk {i}: {e}")
-                        chunk.metadata.keywords = []
-
-                    vector = None
-                    if hasattr(chunk.metadata, "vector") and chunk.metadata.vector:
-                        vector = chunk.metadata.vector
-                    else:
-                        vector = self.embeddings.embed_query(chunk.content)
+            chunk.metadata.chunk_idx = f"{chunk.metadata.file_name}_{i}"
+
+        # Embed the chunks without a precomputed vector, EMBEDDING_BATCH_SIZE contents per request
+        # vector is an extra metadata field, absent unless precomputed
+        needs_vec = [chunk for chunk in chunks if not getattr(chunk.metadata, "vector", None)]
+        failed_ids = set()
+        for start in range(0, len(needs_vec), EMBEDDING_BATCH_SIZE):
+            batch_chunks = needs_vec[start:start + EMBEDDING_BATCH_SIZE]
+            try:
+                vectors = self.embeddings.embed_documents([chunk.content for chunk in batch_chunks])
+            except Exception as e:
+                logger.error(f"Failed to embed {len(batch_chunks)} chunks: {e}")
+                failed_ids.update(id(chunk) for chunk in batch_chunks)
+                continue
+            for chunk, vector in zip(batch_chunks, vectors):
+                chunk.metadata.vector = vector
+        failed_count += len(failed_ids)
+
+        # Prepare all the objects first, so the batch below only has to send them
+        objects = [  # (properties, vector) tuples
+            (_chunk_properties(chunk), chunk.metadata.vector)
+            for chunk in chunks
+            if id(chunk) not in failed_ids
+        ]
+
+        # Insert with the client's dynamic batching, which already retries the failed requests
+        try:
+            with self.collection.batch.dynamic() as batch:
+                for properties, vector in objects:
+                    batch.add_object(properties=properties, vector=vector)
+        except Exception:
+            self._delete_stored_chunks(chunks)
+            raise
 
-                    chunk.metadata.chunk_idx = f"{chunk.metadata.file_name}_{i}"
+        failed_objects = self.collection.batch.failed_objects
+        if failed_objects:
+            logger.error(f"Failed to store {len(failed_objects)} chunks: {failed_objects[0].message}")
 
-                    properties = chunk.model_dump(exclude={"metadata": {"header_pages", "vector"}})
-                    self.collection.data.insert(properties=properties, vector=vector)
-                    stored_count += 1
-                    break
-                except Exception as e:
-                    retry_count += 1
-                    if retry_count > max_retries:
-                        logger.error(f"Failed to store chunk {i} after {max_retries} retries: {e}")
-                        failed_count += 1
-                        break
-                    else:
-                        logger.warning(f"Chunk storage failed (attempt {retry_count}/{max_retries}): {e}")
-                        sleep(1.0 * retry_count)
+        failed_count += len(failed_objects)
+        stored_count = len(objects) - len(failed_objects)
 
         logger.info(f"Storage complete: {stored_count} stored, {failed_count} failed")
         if failed_count > 0:
+            self._delete_stored_chunks(chunks)
             raise StorageError(f"Failed to store {failed_count}/{len(chunks)} chunks")
+
+    def _delete_stored_chunks(self, chunks: list[RAGEntry]) -> None:
+        """
+        Delete the chunks already stored for the files of these chunks, after a failed store.
+
+        _count_stored_chunks skips a file with any chunk stored, so a partial store
+        would never be completed: the next run stores the file again from scratch.
+        """
+        file_ids = list({chunk.file_id for chunk in chunks if chunk.file_id})
+        if not file_ids:
+            return
+        try:
+            self.collection.data.delete_many(where=Filter.by_property("file_id").contains_any(file_ids))
+        except Exception as e:
+            logger.error(f"Failed to delete the partially stored chunks of {file_ids}: {e}")
+
+    @staticmethod
+    def _content_for_keywords(chunk: RAGEntry) -> str:
+        return (
+            chunk.metadata.table_resume
+            if hasattr(chunk.metadata, "table_resume") and chunk.metadata.table_resume
+            else chunk.content
+        )
+
+    async def _keywords_all(self, chunks: list[RAGEntry]) -> list[list[str]]:
+        """Generate the keywords of each chunk, at most config.llm_concurrency LLM calls at a time."""
+        semaphore = asyncio.Semaphore(self.config.llm_concurrency)
+
+        async def keywords_for(i: int, chunk: RAGEntry) -> list[str]:
+            async with semaphore:
+                try:
+                    return await self.keyword_generator.agenerate_keywords(self._content_for_keywords(chunk))
+                except Exception as e:
+                    logger.warning(f"Keyword generation failed for chunk {i}: {e}")
+                    return []
+
+        return await asyncio.gather(*(keywords_for(i, chunk) for i, chunk in enumerate(chunks)))
@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 
 class AspxParser(BaseParser, Parser):
     """Parser for ASPX files using convert_aspx_to_markdown utility."""
+    __slots__ = ()
+
     def __init__(self, config: ProcessingConfig | None = None):
         super().__init__(config)
 
@@ -1,10 +1,19 @@
-
 from __future__ import annotations
+import asyncio
 from abc import ABC
+from pathlib import Path
 from ETL.document_processor.base.models import ProcessingConfig
 
 
 class BaseParser(ABC):
     """Base parser class with shared config."""
+
+    # parsers are created per file, slots keep the instances small
+    __slots__ = ("config",)
+
     def __init__(self, config: ProcessingConfig | None = None):
         self.config = config or ProcessingConfig()
+
+    async def aparse(self, file_path: Path, file_metadata: dict, **kwargs) -> tuple[str, int]:
+        """Async parse; by default runs the sync parse() in a worker thread."""
+        return await asyncio.to_thread(self.parse, file_path=file_path, file_metadata=file_metadata, **kwargs)
@@ -3,10 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 
 from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient as AsyncDocumentIntelligenceClient
 from ETL.document_processor.parsers.base_parser import BaseParser
 from ETL.document_processor.base.interfaces import Parser
 from ETL.document_processor.base.models import ProcessingConfig
-from ETL.tools.parser import parse_pdf_docs  # type: ignore
+from ETL.tools.parser import aparse_pdf_docs, parse_pdf_docs  # type: ignore
 
 import logging
 
@@ -15,9 +16,17 @@ logger = logging.getLogger(__name__)
 
 class DocumentIntelligenceParser(BaseParser, Parser):
     """Parser for PDFs using Azure Document Intelligence."""
-    def __init__(self, di_client: DocumentIntelligenceClient, config: ProcessingConfig | None = None):
+    __slots__ = ("di_client", "async_di_client")
+
+    def __init__(
+        self,
+        di_client: DocumentIntelligenceClient,
+        config: ProcessingConfig | None = None,
+        async_di_client: AsyncDocumentIntelligenceClient | None = None,
+    ):
         super().__init__(config)
         self.di_client = di_client
+        self.async_di_client = async_di_client
 
     def supports_file_type(self, file_extension: str) -> bool:
         return file_extension.lower() in [".pdf"]
@@ -28,4 +37,14 @@ class DocumentIntelligenceParser(BaseParser, Parser):
             file_metadata={**file_metadata, "file_path": file_path}
         )
         content = msdb_entry.content or ""
-        return content, n_unprocessed_images
\ No newline at end of file
+        return content, n_unprocessed_images
+
+    async def aparse(self, file_path: Path, file_metadata: dict, **kwargs) -> tuple[str, int]:
+        if self.async_di_client is None:
+            return await super().aparse(file_path=file_path, file_metadata=file_metadata, **kwargs)
+        msdb_entry, n_unprocessed_images = await aparse_pdf_docs(
+            di_client=self.async_di_client,
+            file_metadata={**file_metadata, "file_path": file_path}
+        )
+        content = msdb_entry.content or ""
+        return content, n_unprocessed_images
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 class DocxParser(BaseParser, Parser):
     """Parser for DOCX files using your existing process_docx utility."""
+    __slots__ = ("llm",)
+
     def __init__(self, config: ProcessingConfig | None = None, llm: Optional[AzureChatOpenAI] = None):
         super().__init__(config)
         self.llm = llm
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 from pathlib import Path
-import pandas as pd
+from typing import Any, Iterable
+
+from openpyxl import load_workbook
 
 from ETL.document_processor.parsers.base_parser import BaseParser
 from ETL.document_processor.base.interfaces import Parser
@@ -12,9 +14,40 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# pipes and line breaks would break the table row, escaped in one pass over each cell
+_CELL_ESCAPES = str.maketrans({"|": "\\|", "\n": " ", "\r": " "})
+
+
+def _fmt(value: Any) -> str:
+    """Format a cell value for a markdown table cell."""
+    if value is None:
+        return ""
+    return str(value).translate(_CELL_ESCAPES)
+
+
+def _rows_to_markdown(rows: Iterable[tuple]) -> str:
+    """Build a markdown table from worksheet rows, the first non-empty one being the header."""
+    rows = (row for row in rows if any(value is not None for value in row))
+    header = next(rows, None)
+    if header is None:
+        return ""
+
+    # no column widths to compute: markdown renders the pipe rows as they are
+    width = len(header)
+    lines = ["| " + " | ".join(map(_fmt, header)) + " |", "|" + "---|" * width]
+    for row in rows:
+        # rows of a read-only sheet can be ragged
+        cells = list(map(_fmt, row[:width]))
+        if len(cells) < width:
+            cells.extend([""] * (width - len(cells)))
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
 
 class ExcelParser(BaseParser, Parser):
     """Parser for Excel (.xlsx) files: converts each sheet to markdown and concatenates."""
+    __slots__ = ()
+
     def __init__(self, config: ProcessingConfig | None = None):
         super().__init__(config)
 
@@ -23,17 +56,21 @@ class ExcelParser(BaseParser, Parser):
 
     def parse(self, file_path: Path, file_metadata: dict, **kwargs) -> tuple[str, int]:
         try:
-            all_sheets = pd.read_excel(file_path, sheet_name=None)
-            parts: list[str] = []
-            for sheet_name, df in all_sheets.items():
-                try:
-                    md_table = df.to_markdown(index=False)
-                    section = f"\n\n# Sheet: {sheet_name}\n\n{md_table}\n"
-                    parts.append(section)
-                except Exception as e:
-                    logger.warning(f"Failed to process sheet '{sheet_name}' in {file_path.name}: {e}")
-                    continue
+            # read_only streams the rows instead of loading the whole workbook
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                parts: list[str] = []
+                for worksheet in workbook.worksheets:
+                    try:
+                        md_table = _rows_to_markdown(worksheet.iter_rows(values_only=True))
+                        section = f"\n\n# Sheet: {worksheet.title}\n\n{md_table}\n"
+                        parts.append(section)
+                    except Exception as e:
+                        logger.warning(f"Failed to process sheet '{worksheet.title}' in {file_path.name}: {e}")
+                        continue
+            finally:
+                workbook.close()
             return "\n\n".join(parts), 0
         except Exception as e:
             logger.error(f"Excel parsing failed for {file_path.name}: {e}")
-            raise
\ No newline at end of file
+            raise
@@ -5,9 +5,10 @@ Factory for creating parser instances based on file type and parser type.
 """
 
 from __future__ import annotations
-from typing import Optional, Dict, Type
+from typing import Callable, Dict, Optional, Tuple, Type
 
 from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient as AsyncDocumentIntelligenceClient
 from langchain_openai import AzureChatOpenAI
 
 from ETL.document_processor.base.interfaces import Parser
@@ -24,19 +25,37 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _build_document_intelligence(di_client, llm, config, async_di_client) -> Parser:
+    if not di_client:
+        raise ValueError("Document Intelligence client required for DocumentIntelligenceParser")
+    return DocumentIntelligenceParser(di_client, config, async_di_client=async_di_client)
+
+
+def _build_vision(di_client, llm, config, async_di_client) -> Parser:
+    if not llm:
+        raise ValueError("LLM client required for VisionParser")
+    return VisionParser(llm, di_client, config)
+
+
+def _build_text(di_client, llm, config, async_di_client) -> Parser:
+    return TextParser(config)
+
+
+ParserBuilder = Callable[..., Parser]
+
+
 class ParserFactory:
     """Factory for creating parser instances."""
-    _parsers: Dict[str, Dict[str, Type[Parser]]] = {
-        "pdf": {
-            "document_intelligence": DocumentIntelligenceParser,
-            "vision": VisionParser,
-        },
-        "txt": {"text": TextParser},
-        "text": {"text": TextParser},
-        "md": {"text": TextParser},
-        "docx": {"docx": DocxParser},
-        "aspx": {"aspx": AspxParser},
-        "xlsx": {"excel": ExcelParser},
+    # (file type, parser type) -> builder(di_client, llm, config, async_di_client)
+    _builders: Dict[Tuple[str, str], ParserBuilder] = {
+        ("pdf", "document_intelligence"): _build_document_intelligence,
+        ("pdf", "vision"): _build_vision,
+        ("txt", "text"): _build_text,
+        ("text", "text"): _build_text,
+        ("md", "text"): _build_text,
+        ("docx", "docx"): lambda di_client, llm, config, async_di_client: DocxParser(config, llm),
+        ("aspx", "aspx"): lambda di_client, llm, config, async_di_client: AspxParser(config),
+        ("xlsx", "excel"): lambda di_client, llm, config, async_di_client: ExcelParser(config),
     }
 
     @staticmethod
@@ -45,67 +64,37 @@ class ParserFactory:
         parser_type: str,
         di_client: Optional[DocumentIntelligenceClient] = None,
         llm: Optional[AzureChatOpenAI] = None,
-        config: Optional[ProcessingConfig] = None
+        config: Optional[ProcessingConfig] = None,
+        async_di_client: Optional[AsyncDocumentIntelligenceClient] = None,
     ) -> Parser:
         file_type = file_type.lower().lstrip(".")
         parser_type = parser_type.lower()
 
-        if file_type not in ParserFactory._parsers:
-            raise ValueError(f"Unsupported file type: {file_type}")
-
-        if parser_type not in ParserFactory._parsers[file_type]:
+        try:
+            builder = ParserFactory._builders[(file_type, parser_type)]
+        except KeyError:
+            available = ParserFactory.get_supported_parsers_for_file_type(file_type)
+            if not available:
+                raise ValueError(f"Unsupported file type: {file_type}") from None
             raise ValueError(
                 f"Parser type '{parser_type}' not supported for file type '{file_type}'. "
-                f"Available parsers: {list(ParserFactory._parsers[file_type].keys())}"
-            )
-
-        parser_class = ParserFactory._parsers[file_type][parser_type]
-
-        if parser_class == DocumentIntelligenceParser:
-            print("I am Creating DocumentIntelligenceParser")
-            if not di_client:
-                raise ValueError("Document Intelligence client required for DocumentIntelligenceParser")
-            return DocumentIntelligenceParser(di_client, config)
-
-        elif parser_class == VisionParser:
-            print("I am Creating VisionParser")
-            if not llm:
-                raise ValueError("LLM client required for VisionParser")
-            return VisionParser(llm, di_client, config)
-
-        elif parser_class == TextParser:
-            return TextParser(config)
-
-        elif parser_class == DocxParser:
-            print("I am Creating DocxParser")
-            return DocxParser(config, llm)
-
-        elif parser_class == AspxParser:
-            return AspxParser(config)
-
-        elif parser_class == ExcelParser:
-            print("I am Creating ExcelParser")
-            return ExcelParser(config)
+                f"Available parsers: {available}"
+            ) from None
 
-        else:
-            raise ValueError(f"Parser class {parser_class} not properly configured")
+        return builder(di_client, llm, config, async_di_client)
 
     @classmethod
     def register_parser(cls, file_type: str, parser_type: str, parser_class: Type[Parser]) -> None:
         file_type = file_type.lower().lstrip(".")
         parser_type = parser_type.lower()
-        if file_type not in cls._parsers:
-            cls._parsers[file_type] = {}
-        cls._parsers[file_type][parser_type] = parser_class
+        cls._builders[(file_type, parser_type)] = lambda di_client, llm, config, async_di_client: parser_class(config)
         logger.info(f"Registered parser '{parser_type}' for file type '{file_type}'")
 
     @classmethod
     def get_supported_file_types(cls) -> list[str]:
-        return list(cls._parsers.keys())
+        return list(dict.fromkeys(file_type for file_type, _ in cls._builders))
 
     @classmethod
     def get_supported_parsers_for_file_type(cls, file_type: str) -> list[str]:
         file_type = file_type.lower().lstrip(".")
-        if file_type in cls._parsers:
-            return list(cls._parsers[file_type].keys())
-        return []
\ No newline at end of file
+        return [parser_type for known_type, parser_type in cls._builders if known_type == file_type]
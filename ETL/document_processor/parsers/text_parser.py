@@ -1,4 +1,5 @@
 from __future__ import annotations
+import os
 from pathlib import Path
 from ETL.document_processor.parsers.base_parser import BaseParser
 from ETL.document_processor.base.interfaces import Parser
@@ -9,8 +10,29 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _read_utf8(file_path: Path) -> str:
+    """Read a whole UTF-8 file with raw os reads, skipping the TextIOWrapper decode loop."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        while chunk := os.read(fd, max(size, 1 << 16)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    content = b"".join(chunks).decode("utf-8")
+    # same newlines as read_text's universal newlines mode
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
 class TextParser(BaseParser, Parser):
     """Parser for .txt and .md files."""
+    __slots__ = ()
+
     def __init__(self, config: ProcessingConfig | None = None):
         super().__init__(config)
 
@@ -19,7 +41,7 @@ class TextParser(BaseParser, Parser):
 
     def parse(self, file_path: Path, file_metadata: dict, **kwargs) -> tuple[str, int]:
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = _read_utf8(file_path)
             return content, 0
         except Exception as e:
             logger.error(f"Failed to read {file_path}: {e}")
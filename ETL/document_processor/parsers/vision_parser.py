@@ -1,5 +1,6 @@
 
 from __future__ import annotations
+import asyncio
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,7 @@ from langchain_openai import AzureChatOpenAI
 from ETL.document_processor.parsers.base_parser import BaseParser
 from ETL.document_processor.base.interfaces import Parser
 from ETL.document_processor.base.models import ProcessingConfig
+from ETL.tools.async_loop import run_coroutine
 from ETL.tools.doc_etl_components import etl_components  # type: ignore
 from ETL.tools.parser import parse_pdf_file_with_document_intelligence  # type: ignore
 
@@ -16,9 +18,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of pages summarized by the LLM at the same time
+MAX_CONCURRENT_PAGES = 10
+# Maximum number of rendered pages waiting for the LLM
+PAGE_QUEUE_SIZE = 16
+
+# Line around the page headers of the concatenated output
+PAGE_SEPARATOR = "=" * 80
+
 
 class VisionParser(BaseParser, Parser):
     """Vision-based parser for PDFs, producing stitched or sequential markdown."""
+    __slots__ = ("llm", "di_client")
+
     def __init__(self, llm: AzureChatOpenAI, di_client: Optional[DocumentIntelligenceClient] = None, config: ProcessingConfig | None = None):
         super().__init__(config)
         self.llm = llm
@@ -30,36 +42,68 @@ class VisionParser(BaseParser, Parser):
     def parse(self, file_path: Path, file_metadata: dict, **kwargs) -> tuple[str, int]:
         image_processor = etl_components(file=file_path.as_posix(), llm_multimodal=self.llm)
 
-        image_map = image_processor.pdf_to_base64_utf8_images(blob_pdf_path=file_path.as_posix())
-        images = list(image_map.values())
-        if not images:
+        if self.config.use_batch_api:
+            # One Batch API job for all the pages, a page the job failed on stays empty
+            image_map = image_processor.pdf_to_base64_utf8_images()
+            summaries = image_processor.batch_summarize_images(image_map) if image_map else {}
+            page_summaries = [summaries.get(name, "") for name in image_map]
+        else:
+            page_summaries = run_coroutine(self._summarize_all(image_processor))
+        if not page_summaries:
             logger.warning(f"No images extracted from {file_path.name}")
             return "", 0
 
-        page_summaries = []
-        for i, img in enumerate(images, 1):
-            try:
-                print(f"Processing image {i}/{len(images)}")
-                summary = image_processor.new_summarize_image(img)
-                page_summaries.append(summary)
-            except Exception as e:
-                logger.warning(f"Failed to summarize image page {i}: {e}")
-                page_summaries.append("")
-
         if self.config.document_page_stitching and self.di_client:
             try:
-                di_result = parse_pdf_file_with_document_intelligence(
-                    bytes_source=file_path.with_suffix(".pdf").read_bytes(),
-                    client=self.di_client
-                )
+                with file_path.with_suffix(".pdf").open("rb") as document:
+                    di_result = parse_pdf_file_with_document_intelligence(
+                        document=document,
+                        client=self.di_client
+                    )
                 reference_text = di_result["result"].content if di_result and "result" in di_result else ""
                 stitched = image_processor.stitch_pages(reference_text=reference_text, page_contents_list=page_summaries)
                 return stitched, 0
             except Exception as e:
                 logger.warning(f"Stitching failed, falling back to simple concatenation: {e}")
 
-        concatenated = ""
-        for i, page in enumerate(page_summaries, 1):
-            concatenated += f"\n{'='*80}\nPAGE {i}\n{'='*80}\n{page}\n{'='*80}\n"
+        concatenated = "".join(
+            f"\n{PAGE_SEPARATOR}\nPAGE {i}\n{PAGE_SEPARATOR}\n{page}\n{PAGE_SEPARATOR}\n"
+            for i, page in enumerate(page_summaries, 1)
+        )
+
+        return concatenated, 0
+
+    @staticmethod
+    async def _summarize_all(image_processor: etl_components) -> list[str]:
+        """Summarize the page images while the next pages are still being rendered, keeping the page order.
+
+        The rendered pages go through a queue of PAGE_QUEUE_SIZE to MAX_CONCURRENT_PAGES
+        consumers, so the LLM calls start with the first page instead of after the last one.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(maxsize=PAGE_QUEUE_SIZE)
+        page_summaries: list[str] = []
+        pages = image_processor.iter_pdf_base64_images()
+
+        async def render() -> None:
+            try:
+                # the generator blocks on the rendering, it is advanced from a worker thread
+                while (page := await loop.run_in_executor(None, next, pages, None)) is not None:
+                    page_summaries.append("")
+                    await queue.put((len(page_summaries), page[1]))
+            finally:
+                pages.close()
+                for _ in range(MAX_CONCURRENT_PAGES):
+                    await queue.put(None)
+
+        async def summarize() -> None:
+            while (item := await queue.get()) is not None:
+                i, img = item
+                try:
+                    logger.debug(f"Processing image {i}")
+                    page_summaries[i - 1] = await image_processor.anew_summarize_image(img)
+                except Exception as e:
+                    logger.warning(f"Failed to summarize image page {i}: {e}")
 
-        return concatenated, 0
\ No newline at end of file
+        await asyncio.gather(render(), *(summarize() for _ in range(MAX_CONCURRENT_PAGES)))
+        return page_summaries
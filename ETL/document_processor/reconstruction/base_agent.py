@@ -1,9 +1,10 @@
 
 from __future__ import annotations
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from abc import ABC, abstractmethod
 
-from langchain_openai import AzureChatOpenAI
+if TYPE_CHECKING:
+    from langchain_openai import AzureChatOpenAI
 
 from ETL.document_processor.base.interfaces import ReconstructionAgent
 from ETL.document_processor.base.models import ProcessingConfig, RAGEntry
@@ -70,21 +71,23 @@ class BaseReconstructionAgent(ReconstructionAgent, ABC):
             List[RAGEntry] with augmented content
         """
         import os
-        import copy
-        
-        chunk_copy = copy.deepcopy(chunks)
         
         filename = os.path.basename(file) if file else 'Not given'
-        doc_summary = summary
+        # the banner and the summary are the same for every chunk, format them once
+        summary_suffix = (
+            f"\n\n---\n\n"
+            f"### **Filename : {filename}** \n"
+            f"### Consolidated summary / high-level overview of whole document given below: ###############\n\n"
+            f"{summary}"
+        )
         
-        for i in range(len(chunk_copy)):
-            base_content = str(chunk_copy[i].content)
-            entire_summary = (
-                f"{base_content}\n\n---\n\n"
-                f"### **Filename : {filename}** \n"
-                f"### Consolidated summary / high-level overview of whole document given below: ###############\n\n"
-                f"{str(doc_summary)}"
+        # shallow copies: only the content changes, and each chunk keeps its own metadata
+        # since keywords, chunk_idx and vector are set per chunk later on
+        chunk_copy = [
+            chunk.model_copy(
+                update={"content": chunk.content + summary_suffix, "metadata": chunk.metadata.model_copy()}
             )
-            chunk_copy[i].content = entire_summary
+            for chunk in chunks
+        ]
         
         return chunk_copy
@@ -1,9 +1,10 @@
 # ETL.document_processor/reconstruction/combined_agent.py
 
 from __future__ import annotations
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from langchain_openai import AzureChatOpenAI
+if TYPE_CHECKING:
+    from langchain_openai import AzureChatOpenAI
 
 from ETL.document_processor.reconstruction.summary_agent import SummaryAgent
 from ETL.document_processor.reconstruction.iterative_agent import IterativeReconstructionAgent
@@ -34,7 +35,7 @@ class CombinedReconstructionAgent(SummaryAgent, IterativeReconstructionAgent):
     ) -> list[RAGEntry]:
         """Apply both summary augmentation and iterative improvement."""
         try:
-            print("I am in CombinedReconstructionAgent")
+            logger.debug("Running combined reconstruction")
             # Step 1: Add document summary to chunks
             logger.info("Step 1: Adding document summary to chunks")
             chunks = SummaryAgent.reconstruct_chunks(
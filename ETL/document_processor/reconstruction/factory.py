@@ -5,8 +5,12 @@ Factory for creating reconstruction agent instances.
 """
 
 from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
-from langchain_openai import AzureChatOpenAI
+if TYPE_CHECKING:
+    from langchain_openai import AzureChatOpenAI
 
 from ETL.document_processor.base.interfaces import ReconstructionAgent
 from ETL.document_processor.base.models import ProcessingConfig
@@ -19,14 +23,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Number of agents kept by ReconstructionAgentFactory.create_agent
+AGENT_CACHE_SIZE = 4
+
 
 class ReconstructionAgentFactory:
     """Factory for creating reconstruction agent instances."""
-    
-    @staticmethod
-    def create_agent(config: ProcessingConfig, llm: AzureChatOpenAI) -> ReconstructionAgent:
+
+    # (id of the llm, config as JSON) -> agent; the agent holds the llm, so its id can't be reused
+    _agents: OrderedDict[tuple[int, str], ReconstructionAgent] = OrderedDict()
+    # FileProcessors are created from several threads, the cache is updated under this lock
+    _agents_lock = threading.Lock()
+
+    @classmethod
+    def create_agent(cls, config: ProcessingConfig, llm: AzureChatOpenAI) -> ReconstructionAgent:
         """
         Create appropriate reconstruction agent based on config.
+
+        The agents are cached: the same llm with an equal config gets the same agent back.
         
         Args:
             config: Processing configuration
@@ -35,6 +49,21 @@ class ReconstructionAgentFactory:
         Returns:
             ReconstructionAgent instance
         """
+        key = (id(llm), config.model_dump_json())
+        with cls._agents_lock:
+            agent = cls._agents.get(key)
+            if agent is None:
+                agent = cls._build_agent(config, llm)
+                if len(cls._agents) >= AGENT_CACHE_SIZE:
+                    cls._agents.popitem(last=False)
+                cls._agents[key] = agent
+            else:
+                cls._agents.move_to_end(key)
+            return agent
+
+    @staticmethod
+    def _build_agent(config: ProcessingConfig, llm: AzureChatOpenAI) -> ReconstructionAgent:
+        """Build the reconstruction agent matching the config."""
         if config.append_summary_to_chunks and config.use_iterative_reconstruction:
             logger.info("Creating CombinedReconstructionAgent")
             return CombinedReconstructionAgent(llm, config)
@@ -49,7 +78,7 @@ class ReconstructionAgentFactory:
         
         else:
             logger.info("Creating NullReconstructionAgent (no reconstruction)")
-            return NullReconstructionAgent()
+            return NullReconstructionAgent.instance
     
     @staticmethod
     def create_agent_by_type(
@@ -80,7 +109,7 @@ class ReconstructionAgentFactory:
         elif agent_type == "combined":
             return CombinedReconstructionAgent(llm, config)
         elif agent_type == "null":
-            return NullReconstructionAgent()
+            return NullReconstructionAgent.instance
         else:
             raise ValueError(
                 f"Unknown agent type '{agent_type}'. "
@@ -1,8 +1,12 @@
 # ETL.document_processor/reconstruction/iterative_agent.py
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from langchain_openai import AzureChatOpenAI
+if TYPE_CHECKING:
+    from langchain_openai import AzureChatOpenAI
 
 from ETL.document_processor.reconstruction.base_agent import BaseReconstructionAgent
 from ETL.document_processor.base.models import ProcessingConfig, RAGEntry
@@ -12,6 +16,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_chunk_improver() -> type | None:
+    """Import ChunkImprover (langgraph, langchain) once, on the first agent that needs it."""
+    try:
+        from ETL.tools.rag_chunking_agent.chunk_improver import ChunkImprover
+    except ImportError as e:
+        logger.warning(f"ChunkImprover not available: {e}")
+        return None
+    return ChunkImprover
+
+
 class IterativeReconstructionAgent(BaseReconstructionAgent):
     """
     Agent that iteratively improves chunk quality.
@@ -22,13 +37,8 @@ class IterativeReconstructionAgent(BaseReconstructionAgent):
     def __init__(self, llm: AzureChatOpenAI, config: ProcessingConfig):
         super().__init__(llm, config)
         
-        # Import here to avoid issues if module not available
-        try:
-            from ETL.tools.rag_chunking_agent.chunk_improver import ChunkImprover
-            self.improver = ChunkImprover(llm=self.llm)
-        except ImportError as e:
-            logger.warning(f"ChunkImprover not available: {e}")
-            self.improver = None
+        chunk_improver = _load_chunk_improver()
+        self.improver = chunk_improver(llm=self.llm) if chunk_improver is not None else None
     
     def reconstruct_chunks(
         self,
@@ -42,18 +52,28 @@ class IterativeReconstructionAgent(BaseReconstructionAgent):
             return chunks
         
         try:
-            print("I am in iterative improvement agent")
-            for idx, chunk in enumerate(chunks, 1):
-                result = self.improver.improve_chunk(
-                    document=original_content or "",
-                    chunk=chunk.content,
-                    return_only_result=False
-                )
-                chunk.content = result.improved_chunk
-                logger.info(f"[Chunk {idx}/{len(chunks)}] quality score: {result.quality_score:.2f}")
-            
-            return chunks
-            
+            logger.debug("Running iterative reconstruction")
+            return self._improve_chunks(chunks, original_content)
+
         except Exception as e:
             logger.error(f"Iterative reconstruction failed: {e}", exc_info=True)
             return chunks
+
+    def _improve_chunks(self, chunks: list[RAGEntry], original_content: str) -> list[RAGEntry]:
+        """Improve the chunks, at most config.llm_concurrency reconstruction loops at a time.
+
+        The chunks are evaluated first, EVALUATION_BATCH_SIZE of them per LLM call, with one
+        call per chunk for a group whose response is unusable. Then only the ones that need it
+        are reconstructed. The chunks are only updated once all of them are improved.
+        """
+        with ThreadPoolExecutor(max_workers=self.config.llm_concurrency) as executor:
+            results = self.improver.improve_chunks_batch(
+                document=original_content or "",
+                chunks=[chunk.content for chunk in chunks],
+                map_fn=executor.map,
+            )
+
+        for idx, (chunk, result) in enumerate(zip(chunks, results), 1):
+            chunk.content = result.improved_chunk
+            logger.info(f"[Chunk {idx}/{len(chunks)}] quality score: {result.quality_score:.2f}")
+        return chunks
@@ -13,7 +13,10 @@ class NullReconstructionAgent(ReconstructionAgent):
     No-op reconstruction agent.
     
     Returns chunks unchanged - used when no reconstruction is needed.
+    Stateless, so NullReconstructionAgent.instance is shared by everyone.
     """
+
+    instance: NullReconstructionAgent
     
     def reconstruct_chunks(
         self,
@@ -23,3 +26,6 @@ class NullReconstructionAgent(ReconstructionAgent):
     ) -> list[RAGEntry]:
         """Return chunks unchanged."""
         return chunks
+
+
+NullReconstructionAgent.instance = NullReconstructionAgent()
@@ -1,17 +1,26 @@
 """Summary-based reconstruction agent."""
 
 from __future__ import annotations
-from typing import Optional
+import hashlib
+from typing import TYPE_CHECKING, Optional
 
-from langchain_openai import AzureChatOpenAI
+if TYPE_CHECKING:
+    from langchain_openai import AzureChatOpenAI
 
 from ETL.document_processor.reconstruction.base_agent import BaseReconstructionAgent
 from ETL.document_processor.base.models import ProcessingConfig, RAGEntry
+from ETL.tools.file_utils import write_atomic
+from ETL.tools.fs_constants import SUMMARY_CACHE_DIR
+from ETL.tools.settings import rag_app_settings
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Part of the summary cache key: bump it when the summary prompts change,
+# so the summaries generated with the previous prompts are not reused
+SUMMARY_PROMPT_VERSION = 1
+
 
 class SummaryAgent(BaseReconstructionAgent):
     """
@@ -56,15 +65,49 @@ class SummaryAgent(BaseReconstructionAgent):
             return chunks
     
     def _generate_summary(self, content: str, **kwargs) -> Optional[str]:
+        """
+        Generate summary based on parser type, reusing the summary of a document seen before.
+
+        With rag_app_settings.summary_cache, summaries are cached on disk in SUMMARY_CACHE_DIR,
+        keyed by a hash of the content, the parser type, the filename, the LLM deployment and
+        SUMMARY_PROMPT_VERSION, so a re-scanned document costs no LLM call.
+        """
+        if not rag_app_settings.summary_cache:
+            return self._generate_summary_uncached(content, **kwargs)
+
+        parser_type = getattr(self.parser_type, "value", self.parser_type)
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            parser_type,
+            getattr(self.llm, "deployment_name", None) or "",
+            str(SUMMARY_PROMPT_VERSION),
+            kwargs.get("filename", "document"),
+            content,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        cache_file = SUMMARY_CACHE_DIR / f"{digest.hexdigest()}.txt"
+
+        try:
+            return cache_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+
+        summary = self._generate_summary_uncached(content, **kwargs)
+        if summary:
+            write_atomic(cache_file, str(summary))
+        return summary
+
+    def _generate_summary_uncached(self, content: str, **kwargs) -> Optional[str]:
         """Generate summary based on parser type."""
         if self.parser_type == "document_intelligence":
-            print("I am in generate summary DI")
+            logger.debug("Generating document summary (document_intelligence)")
             return self._generate_summary_header_resume(
                 content,
                 filename=kwargs.get("filename", 'document')
             )
         elif self.parser_type == "vision":
-            print("I am in generate summary vision")
+            logger.debug("Generating document summary (vision)")
             return self._generate_summary_vision(content)
         else:
             logger.warning(
@@ -75,8 +118,11 @@ class SummaryAgent(BaseReconstructionAgent):
     def _augment_chunks(self, chunks: list[RAGEntry], summary: str, **kwargs) -> list[RAGEntry]:
         """Augment chunks with summary based on parser type."""
         if self.parser_type == "document_intelligence":
+            logger.debug("Augmenting chunks with summary (document_intelligence)")
+            # same result as _augment_chunk_with_summary_doc_intel, the prefix is formatted once
+            prefix = f"Document Context:\n{summary}\n\nChunk Content:\n"
             for chunk in chunks:
-                chunk.content = self._augment_chunk_with_summary_doc_intel(chunk.content, summary)
+                chunk.content = prefix + chunk.content
             return chunks
         elif self.parser_type == "vision":
             # Vision method returns a new deep-copied list
@@ -90,7 +136,7 @@ class SummaryAgent(BaseReconstructionAgent):
         """DI - Generate document summary using LLM."""
         try:
             # Import here to avoid circular dependency
-            print("I am in generate summary DI - Header Resume")
+            logger.debug("Generating header resume summary")
             from ETL.tools.resumes import generate_document_resume
             return generate_document_resume(
                 filename=filename,
@@ -104,7 +150,7 @@ class SummaryAgent(BaseReconstructionAgent):
     def _generate_summary_vision(self, content: str) -> Optional[str]:
         """Vision - Generate document summary using LLM."""
         try:
-            print("I am in generate summary Vision - generate document summary stuff")
+            logger.debug("Generating vision document summary")
             # Import here to avoid circular dependency
             from ETL.tools.doc_etl_components import etl_components
             etl_obj = etl_components(file=None, llm_multimodal=self.llm)
@@ -119,8 +165,6 @@ class SummaryAgent(BaseReconstructionAgent):
         if not summary:
             return chunk_content
         
-        print("I am in Augment chunk with summary DI")
-        
         return (
             f"Document Context:\n{summary}\n\n"
             f"Chunk Content:\n{chunk_content}"
@@ -136,7 +180,7 @@ class SummaryAgent(BaseReconstructionAgent):
         Augment RAGEntry chunks with a consolidated summary in the exact same
         format and behavior as append_chunks_fulldoc_summary.
         
-        - Uses deep copy (does not mutate the input list)
+        - Returns copies (does not mutate the input list)
         - Derives filename via os.path.basename(file) (defaults to 'Not given')
         - Appends banner and str(summary) to each chunk.content
         - Matches the exact string formatting of append_chunks_fulldoc_summary
@@ -147,25 +191,27 @@ class SummaryAgent(BaseReconstructionAgent):
             file: Optional file path used to derive the filename
             
         Returns:
-            A deep-copied list of RAGEntry with augmented content
+            A new list of RAGEntry with augmented content
         """
         import os
-        import copy
-        
-        print("I am in Augment chunk with summary VISION")
-        chunk_copy = copy.deepcopy(chunks)
         
+        logger.debug("Augmenting chunks with summary (vision)")
         filename = os.path.basename(file) if file else 'Not given'
-        doc_summary = summary
+        # the banner and the summary are the same for every chunk, format them once
+        summary_suffix = (
+            f"\n\n---\n\n"
+            f"### **Filename : {filename}** \n"
+            f"### Consolidated summary / high-level overview of whole document given below: ###############\n\n"
+            f"{summary}"
+        )
         
-        for i in range(len(chunk_copy)):
-            base_content = str(chunk_copy[i].content)
-            entire_summary = (
-                f"{base_content}\n\n---\n\n"
-                f"### **Filename : {filename}** \n"
-                f"### Consolidated summary / high-level overview of whole document given below: ###############\n\n"
-                f"{str(doc_summary)}"
+        # shallow copies: only the content changes, and each chunk keeps its own metadata
+        # since keywords, chunk_idx and vector are set per chunk later on
+        chunk_copy = [
+            chunk.model_copy(
+                update={"content": chunk.content + summary_suffix, "metadata": chunk.metadata.model_copy()}
             )
-            chunk_copy[i].content = entire_summary
+            for chunk in chunks
+        ]
         
         return chunk_copy
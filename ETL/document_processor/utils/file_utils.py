@@ -1,49 +1,205 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import shutil
+import subprocess
+import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import aiohttp
 import requests
-from docx2pdf import convert
 from ETL.tools.fs_constants import DOWNLOAD_DIR
 from ETL.document_processor.utils.settings import spo_settings, etl_settings
 
 
 logger = logging.getLogger(__name__)
 
-def download_file(file: dict, convert_to_pdf: bool = False) -> Path:
-    """Download a file from SPO and save it to the local directory."""
+# Number of files downloaded from SPO at the same time
+DOWNLOAD_CONCURRENCY = 8
+
+# Bytes written to disk at a time while a download streams in
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Keep-alive connections reused by the successive download_file calls
+_session = requests.Session()
+
+# Seconds a SPO token is reused for, well within its lifetime
+SPO_TOKEN_REUSE_SECONDS = 300
+
+
+# LibreOffice binary used to convert documents to PDF, docx2pdf (Word) is the fallback
+SOFFICE = shutil.which("soffice") or shutil.which("libreoffice")
+SOFFICE_TIMEOUT_SECONDS = 120
+
+
+@lru_cache(maxsize=1)
+def _cached_spo_token(bucket: int) -> str:
+    """Return a SPO token, fetched once per time bucket."""
+    return spo_settings.get_spo_token()
+
+
+def _spo_token() -> str:
+    """Return the SPO token of the current SPO_TOKEN_REUSE_SECONDS window."""
+    return _cached_spo_token(int(time.time() // SPO_TOKEN_REUSE_SECONDS))
+
+def _download_target(file: dict, convert_to_pdf: bool) -> tuple[Path, str]:
+    """Return the local path and the Graph download URL of a SPO file.
+
+    Each SPO item gets its own directory, named after its id: files with the same
+    name in different SPO folders are downloaded side by side, and keep their name.
+    """
+    item_dir = DOWNLOAD_DIR / file["id"]
+    item_dir.mkdir(exist_ok=True)
     if convert_to_pdf and ("docx" in file["name"]):
         print("Converting DOCX to PDF...")
-        file_path = Path(DOWNLOAD_DIR / file["name"].replace(".docx", ".pdf"))
+        file_path = item_dir / file["name"].replace(".docx", ".pdf")
         download_url = f"https://graph.microsoft.com/v1.0/sites/{spo_settings.site_id}/drive/items/{file['id']}/content?format=pdf"
     else:
         print("Docx remain Docx")
-        file_path = Path(DOWNLOAD_DIR / file["name"])
+        file_path = item_dir / file["name"]
         download_url = f"https://graph.microsoft.com/v1.0/sites/{spo_settings.site_id}/drive/items/{file['id']}/content"
-        
+    return file_path, download_url
+
+
+def _etag_file(file_path: Path) -> Path:
+    """Return the sidecar file holding the etag of a downloaded file."""
+    return file_path.with_name(f"{file_path.name}.etag")
+
+
+def _is_downloaded(file_path: Path, etag: str | None) -> bool:
+    """Tell whether file_path already holds the version of the file with this etag."""
+    if not etag or not file_path.exists():
+        return False
+    try:
+        return _etag_file(file_path).read_text(encoding="utf-8") == etag
+    except FileNotFoundError:
+        return False
+
+
+def _save_download(tmp_path: Path, file_path: Path, etag: str | None) -> None:
+    """Move a complete download to its final path and record its etag."""
+    os.replace(tmp_path, file_path)
+    if etag:
+        _etag_file(file_path).write_text(etag, encoding="utf-8")
+
+
+def download_file(file: dict, convert_to_pdf: bool = False) -> Path:
+    """Download a file from SPO and save it to the local directory.
+
+    Nothing is downloaded if the local copy already has the etag of the file.
+    """
+    file_path, download_url = _download_target(file, convert_to_pdf)
+    if _is_downloaded(file_path, file.get("etag")):
+        logger.info(f"File {file_path.stem} already downloaded, skipping")
+        return file_path
+
     # Set the headers
-    access_token = spo_settings.get_spo_token()
+    access_token = _spo_token()
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    # Send the GET request
-    response = requests.get(download_url, headers=headers, timeout=30)
+    # Send the GET request, the body is read as it is written
+    with _session.get(download_url, headers=headers, stream=True, timeout=30) as response:
+
+        # Save the file if the request is successful
+        if response.status_code == 200:  # noqa: PLR2004
+            # written aside first, an interrupted download never looks complete
+            tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+            with tmp_path.open("wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            _save_download(tmp_path, file_path, file.get("etag"))
+            msg = f"File {file_path.stem} downloaded successfully!"
+        else:
+            msg = f"""Failed to download file {file_path.stem}:
+            {response.status_code}, {response.text}"""
+    logger.info(msg)
 
-    # Save the file if the request is successful
+    return file_path
 
-    if response.status_code == 200:  # noqa: PLR2004
-        with file_path.open("wb") as f:
-            f.write(response.content)
-        msg = f"File {file_path.stem} downloaded successfully!"
-    else:
-        msg = f"""Failed to download file {file_path.stem}:
-            {response.status_code}, {response.text}"""
+
+async def adownload_file(
+    session: aiohttp.ClientSession,
+    file: dict,
+    convert_to_pdf: bool = False,
+) -> Path:
+    """Download a file from SPO with an open aiohttp session, streaming it to the local directory.
+
+    Nothing is downloaded if the local copy already has the etag of the file.
+    """
+    file_path, download_url = _download_target(file, convert_to_pdf)
+    if _is_downloaded(file_path, file.get("etag")):
+        logger.info(f"File {file_path.stem} already downloaded, skipping")
+        return file_path
+
+    async with session.get(download_url) as response:
+        if response.status == 200:  # noqa: PLR2004
+            # written aside first, an interrupted download never looks complete
+            tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+            with tmp_path.open("wb") as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    # the disk write is blocking I/O, keep it off the event loop
+                    await asyncio.to_thread(f.write, chunk)
+            _save_download(tmp_path, file_path, file.get("etag"))
+            msg = f"File {file_path.stem} downloaded successfully!"
+        else:
+            msg = f"""Failed to download file {file_path.stem}:
+            {response.status}, {await response.text()}"""
     logger.info(msg)
 
     return file_path
 
 
+def download_files(files: list[dict], convert_to_pdf: bool = False) -> list[Path]:
+    """Download files from SPO concurrently, DOWNLOAD_CONCURRENCY at a time.
+
+    All the downloads share one token and one connection pool.
+
+    Returns:
+        The local paths, in the order of files.
+    """
+    access_token = _spo_token()
+
+    async def download_all() -> list[Path]:
+        semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+        async with aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {access_token}"},
+            timeout=aiohttp.ClientTimeout(sock_connect=30, sock_read=30),
+        ) as session:
+
+            async def download(file: dict) -> Path:
+                async with semaphore:
+                    return await adownload_file(session, file, convert_to_pdf=convert_to_pdf)
+
+            return await asyncio.gather(*(download(file) for file in files))
+
+    return asyncio.run(download_all())
+
+
+def _soffice_convert(input_file: str | Path, output_dir: Path) -> None:
+    """Convert a document to PDF in output_dir with headless LibreOffice."""
+    # one profile per process: soffice instances sharing a profile wait on its lock
+    profile_dir = Path(tempfile.gettempdir()) / f"lo_profile_{os.getpid()}"
+    subprocess.run(  # noqa: S603
+        [
+            SOFFICE,
+            f"-env:UserInstallation={profile_dir.as_uri()}",
+            "--headless",
+            "--convert-to",
+            "pdf",
+            "--outdir",
+            str(output_dir),
+            str(input_file),
+        ],
+        check=True,
+        capture_output=True,
+        timeout=SOFFICE_TIMEOUT_SECONDS,
+    )
+
+
 def convert_to_pdf(input_file):
     """
     Convert a file to PDF based on its extension.
@@ -72,7 +228,13 @@ def convert_to_pdf(input_file):
     try:
         if file_ext == '.docx':
             # DOCX to PDF
-            convert(input_file, output_file)
+            if SOFFICE:
+                _soffice_convert(input_file, output_file.parent)
+            else:
+                # docx2pdf drives Word, only imported on the machines without LibreOffice
+                from docx2pdf import convert
+
+                convert(input_file, output_file)
 
         else:
             print(f"Unsupported file type: {file_ext}")
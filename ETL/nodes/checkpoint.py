@@ -0,0 +1,54 @@
+"""Keep track of the files processed by a run, so an interrupted run can be resumed."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import orjson
+from ETL.tools.fs_constants import ETL_CHECKPOINT_FILE
+
+logger = logging.getLogger(__name__)
+
+# the new and the updated files are processed on two threads
+_lock = threading.Lock()
+
+
+def load_checkpoint() -> dict[str, dict]:
+    """Load the files processed since the last completed run, by file id."""
+    try:
+        lines = ETL_CHECKPOINT_FILE.read_bytes().splitlines()
+    except FileNotFoundError:
+        return {}
+
+    done = {}
+    for line in lines:
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # the last line of a run killed while writing it
+            continue
+        done[entry["id"]] = entry
+    return done
+
+
+def record_file_done(file: dict, n_unprocessed: int) -> None:
+    """Append a processed file, with its number of unprocessed images, to the checkpoint."""
+    line = orjson.dumps(
+        {"id": file["id"], "etag": file["etag"], "name": file["name"], "unprocessed": n_unprocessed},
+    )
+    with _lock, ETL_CHECKPOINT_FILE.open("ab") as f:
+        f.write(line + b"\n")
+
+
+def pending_files(files: list[dict], done: dict[str, dict]) -> list[dict]:
+    """Return the files not already processed, in this same version, by an interrupted run."""
+    pending = [f for f in files if done.get(f["id"], {}).get("etag") != f["etag"]]
+    if len(pending) < len(files):
+        logger.info(f"{len(files) - len(pending)} files already processed by the previous run, skipped")
+    return pending
+
+
+def clear_checkpoint() -> None:
+    """Forget the processed files, once the run is complete."""
+    ETL_CHECKPOINT_FILE.unlink(missing_ok=True)
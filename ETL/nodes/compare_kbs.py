@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,35 +19,52 @@ from ETL.tools.fs_constants import (
     UPDATED_FILES,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # Load the JSON files
 def load_json(file_path: Path) -> dict:
     """Read dict from json."""
-    with file_path.open() as file:
-        return json.load(file)
+    return orjson.loads(file_path.read_bytes())
+
+
+def same_content(old_file: dict, new_file: dict) -> bool:
+    """Tell whether a file with a new etag still has the content and the url that were stored.
 
+    The etag also changes when only the metadata of a file is edited; SharePoint's content hash doesn't.
+    """
+    content_hash = new_file.get("content_hash")
+    return (
+        bool(content_hash)
+        and content_hash == old_file.get("content_hash")
+        and new_file.get("web_url") == old_file.get("web_url")
+    )
 
-# Compare JSON data based on file_etag
+
+# Compare JSON data based on file_etag and content hash
 def compare_dicts(old_data: dict, new_data: dict) -> tuple:
     """Compare dicts."""
     old_files = {file["id"]: file for file in old_data}
     new_files = {file["id"]: file for file in new_data}
 
-    new_files_list = []
-    deleted_files_list = []
-    updated_files_list = []
-
-    # Find new and updated files
-    for file_id, new_file in new_files.items():
-        if file_id not in old_files:
-            new_files_list.append(new_file)
-        elif new_file["etag"] != old_files[file_id]["etag"]:
-            updated_files_list.append(new_file)
-
-    # Find deleted files
-    for file_id, old_file in old_files.items():
-        if file_id not in new_files:
-            deleted_files_list.append(old_file)
+    # The ids only in one of the dicts, or in both; the lists below keep the order of the data
+    new_ids = new_files.keys() - old_files.keys()
+    deleted_ids = old_files.keys() - new_files.keys()
+    common_ids = new_files.keys() & old_files.keys()
+
+    new_files_list = [new_file for file_id, new_file in new_files.items() if file_id in new_ids]
+    deleted_files_list = [old_file for file_id, old_file in old_files.items() if file_id in deleted_ids]
+    changed_files = [
+        (new_file, old_files[file_id])
+        for file_id, new_file in new_files.items()
+        if file_id in common_ids and new_file["etag"] != old_files[file_id]["etag"]
+    ]
+    updated_files_list = [
+        new_file for new_file, old_file in changed_files if not same_content(old_file, new_file)
+    ]
+    n_unchanged_files = len(changed_files) - len(updated_files_list)
+    if n_unchanged_files:
+        logger.info(f"{n_unchanged_files} files have a new etag but the same content, not updated")
 
     return new_files_list, deleted_files_list, updated_files_list
 
@@ -52,8 +72,7 @@ def compare_dicts(old_data: dict, new_data: dict) -> tuple:
 # Write results to JSON files
 def write_json(file_path: Path, data: dict) -> None:
     """Write the data in a json."""
-    with file_path.open("w") as file:
-        json.dump(data, file, indent=4)
+    file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 # Main function
@@ -72,9 +91,11 @@ def compare_kbs(
     new_files, deleted_files, updated_files = compare_dicts(old_data, new_data)
 
     if use_filesystem:
-        write_json(NEW_FILES, new_files)
-        write_json(DELETED_FILES, deleted_files)
-        write_json(UPDATED_FILES, updated_files)
+        # independent files, written concurrently
+        outputs = {NEW_FILES: new_files, DELETED_FILES: deleted_files, UPDATED_FILES: updated_files}
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            # list() re-raises the error of a failed write
+            list(executor.map(write_json, outputs.keys(), outputs.values()))
         return None
     return new_files, deleted_files, updated_files
 
@@ -2,22 +2,61 @@
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+
 import weaviate
 from ETL.tools.settings import weaviate_settings
 from weaviate.classes.query import Filter
 
+logger = logging.getLogger(__name__)
+
+# Number of file ids matched by a single delete_many request
+DELETE_BATCH_SIZE = 200
+# Number of delete requests in flight at the same time
+DELETE_CONCURRENCY = 4
+# Number of times a failed delete request is retried, waiting twice as long each time
+DELETE_MAX_RETRIES = 3
+
+
+def _delete_batch(collection, file_ids: list[str]) -> None:  # noqa: ANN001
+    """Delete the entries of one batch of file ids, retrying with exponential backoff."""
+    wait_time = 1
+    for attempt in range(DELETE_MAX_RETRIES + 1):
+        try:
+            collection.data.delete_many(
+                where=Filter.by_property("file_id").contains_any(file_ids),
+            )
+            return
+        except Exception as e:
+            if attempt == DELETE_MAX_RETRIES:
+                raise
+            logger.warning(f"Deleting {len(file_ids)} files failed ({e}), retrying in {wait_time}s")
+            sleep(wait_time)
+            wait_time *= 2
+
 
 def delete_entries_with_id(deleted_files: list[dict]) -> None:
-    """Delete entries in  the DB that correspond to the given IDs."""
+    """Delete entries in  the DB that correspond to the given IDs.
+
+    The ids are sent in batches of DELETE_BATCH_SIZE, so that a large deletion
+    neither builds one huge filter on the server nor fails as a whole.
+    """
     file_ids = [f["id"] for f in deleted_files]
+    if not file_ids:
+        return
+    batches = [
+        file_ids[i : i + DELETE_BATCH_SIZE] for i in range(0, len(file_ids), DELETE_BATCH_SIZE)
+    ]
     client = weaviate.connect_to_local(weaviate_settings.url)
 
     try:
         collection = client.collections.get(weaviate_settings.collection_name)
 
-        collection.data.delete_many(
-            where=Filter.by_property("file_id").contains_any(file_ids),
-        )
+        with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as executor:
+            # list() re-raises the first error once the other batches are done
+            list(executor.map(lambda batch: _delete_batch(collection, batch), batches))
 
     finally:
         client.close()
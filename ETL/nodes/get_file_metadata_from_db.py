@@ -1,19 +1,25 @@
-"""Retrieve unique couples of file_id and file_etag from a Weaviate database."""
+"""Retrieve the unique versions (id, etag, content hash, url) of the files in a Weaviate database."""
 
 from __future__ import annotations
 
-import json
 import logging
 
+import orjson
 import weaviate
+from weaviate.classes.query import QueryNested
 from ETL.tools.fs_constants import OLD_METADATA_FILE
 from ETL.tools.settings import weaviate_settings
 
+# Number of objects fetched from Weaviate per round-trip when scanning the collection
+WEAVIATE_PAGE_SIZE = 5000
+
+# Metadata compared with SPO; a collection filled before content_hash existed doesn't have it yet
+FILE_VERSION_FIELDS = ("etag", "content_hash", "source")
+
 
 def save_to_json(files_data: list[dict[str, str]]) -> None:
     """Save the unique couples of file_id and file_etag to a JSON file."""
-    with OLD_METADATA_FILE.open("w") as json_file:
-        json.dump(files_data, json_file, indent=4)
+    OLD_METADATA_FILE.write_bytes(orjson.dumps(files_data, option=orjson.OPT_INDENT_2))
     msg = "File metadata from DB saved to {OLD_METADATA_FILE}"
     logging.info(msg)  # noqa: LOG015
 
@@ -24,18 +30,36 @@ def load_unique_couples() -> list[dict[str, str]]:
 
     try:
         collection = client.collections.get(weaviate_settings.collection_name)
-        unique_couples = set()
-
-        for item in collection.iterator():
-            metadata = item.properties["metadata"]
-            unique_couples.add((item.properties["file_id"], metadata["etag"]))
+        metadata_schema = next(
+            (prop for prop in collection.config.get().properties if prop.name == "metadata"),
+            None,
+        )
+        existing = {prop.name for prop in (metadata_schema.nested_properties or [])} if metadata_schema else set()
+        fields = [name for name in FILE_VERSION_FIELDS if name in existing]
+
+        # (file_id, etag, content_hash, source) in the order they are met, a dict dedupes them like a set
+        unique_couples: dict[tuple[str, str, str, str], None] = {}
+
+        # Only the properties used here are fetched, not the chunk content nor the vector
+        for item in collection.iterator(
+            return_properties=["file_id", QueryNested(name="metadata", properties=fields)] if fields else ["file_id"],
+            cache_size=WEAVIATE_PAGE_SIZE,
+        ):
+            metadata = item.properties.get("metadata") or {}
+            unique_couples[
+                item.properties["file_id"],
+                metadata.get("etag") or "",
+                metadata.get("content_hash") or "",
+                metadata.get("source") or "",
+            ] = None
 
     finally:
         client.close()
 
-    cp_as_list = list(unique_couples)
-
-    return [{"id": entry[0], "etag": entry[1]} for entry in cp_as_list]
+    return [
+        {"id": file_id, "etag": etag, "content_hash": content_hash, "web_url": web_url}
+        for file_id, etag, content_hash, web_url in unique_couples
+    ]
 
 
 def get_file_metadata_from_db(*, use_filesystem: bool) -> None | dict:
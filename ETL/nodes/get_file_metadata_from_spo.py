@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+import orjson
 import requests
 from ETL.tools.exceptions import SPOError
 from ETL.tools.fs_constants import NEW_METADATA_FILE
@@ -16,6 +17,9 @@ from ETL.tools.settings import etl_settings, spo_settings
 
 logger = logging.getLogger(__name__)
 
+# Number of SPO folders listed at the same time
+SCAN_CONCURRENCY = 16
+
 
 class SharePointScanner:
     """Class to scan SharePoint Online for files and folders."""
@@ -27,52 +31,72 @@ class SharePointScanner:
         self.files_data = []  # List to store file information
 
     def scan_spo(self, folder_path: str | None = None) -> None:
-        """Scan SharePoint Online for files and folders."""
-        headers = {"Authorization": f"Bearer {self.spo_token}"}
+        """Scan SharePoint Online for files and folders.
 
-        # Get the SharePoint site ID
+        The folders of a level of the tree are listed concurrently, then the files are
+        collected depth-first, in the same order as a folder by folder scan.
+        """
+        # Get the SharePoint site ID, once for all the folders
         site_id = spo_settings.site_id
 
         # Determine the folder path to scan
         folder_path = folder_path or spo_settings.main_folder_path
+
+        # folder path -> (files, subfolder paths) of that folder
+        listings: dict[str, tuple[list[dict], list[str]]] = {}
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=SCAN_CONCURRENCY) as executor:
+            session.headers["Authorization"] = f"Bearer {self.spo_token}"
+            level = [folder_path]
+            while level:
+                listed = executor.map(lambda path: self._list_folder(session, site_id, path), level)
+                listings.update(zip(level, listed))
+                level = [subfolder for path in level for subfolder in listings[path][1]]
+
+        stack = [folder_path]
+        while stack:
+            files, subfolders = listings[stack.pop()]
+            self.files_data.extend(files)
+            stack.extend(reversed(subfolders))
+
+    @staticmethod
+    def _list_folder(session: requests.Session, site_id: str, folder_path: str) -> tuple[list[dict], list[str]]:
+        """Return the files and the paths of the subfolders of a SPO folder."""
         folder_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive/root:/{folder_path}:/children"
         msg = f"--- --- Scanning folder: {folder_path}"
         logger.info(msg)
-        folder_response = requests.get(folder_url, headers=headers, timeout=30)
-
-        if folder_response.status_code == 200:  # noqa: PLR2004
-            folder_data = folder_response.json()
-
-            folders2scan = []
-            this_folder = folder_data.get("value", [])
-            for item in this_folder:
-                if "folder" in item:  # If it's a folder
-                    if "UAT" in item["name"] and etl_settings.prod_env:
-                        # no UAT / test folder in prod
-                        continue
-                    folders2scan.append(f"{folder_path}/{item['name']}")
-                elif "file" in item:  # If it's a file
-                    file_info = {
-                        "id": item["id"],
-                        "name": item["name"],
-                        "etag": item["eTag"],
-                        "web_url": item["webUrl"],
-                    }
-                    self.files_data.append(file_info)
-            for subfolder_path in folders2scan:
-                self.scan_spo(
-                    folder_path=subfolder_path,
-                )  # Recursive call for subfolders
-
-        else:
+        folder_response = session.get(folder_url, timeout=30)
+
+        if folder_response.status_code != 200:  # noqa: PLR2004
             msg = f"""Error accessing folder:
             {folder_response.status_code} - {folder_response.text}"""
             raise SPOError(msg)
 
+        folder_data = folder_response.json()
+
+        files = []
+        folders2scan = []
+        this_folder = folder_data.get("value", [])
+        for item in this_folder:
+            if "folder" in item:  # If it's a folder
+                if "UAT" in item["name"] and etl_settings.prod_env:
+                    # no UAT / test folder in prod
+                    continue
+                folders2scan.append(f"{folder_path}/{item['name']}")
+            elif "file" in item:  # If it's a file
+                file_info = {
+                    "id": item["id"],
+                    "name": item["name"],
+                    "etag": item["eTag"],
+                    # SharePoint's hash of the content: unchanged when only the metadata is edited
+                    "content_hash": item["file"].get("hashes", {}).get("quickXorHash", ""),
+                    "web_url": item["webUrl"],
+                }
+                files.append(file_info)
+        return files, folders2scan
+
     def save_to_json(self) -> None:
         """Save the collected file metadata to a JSON file."""
-        with self.output_file.open("w") as json_file:
-            json.dump(self.files_data, json_file, indent=4)
+        self.output_file.write_bytes(orjson.dumps(self.files_data, option=orjson.OPT_INDENT_2))
         msg = f"File data saved to {self.output_file}"
         logging.info(msg)  # noqa: LOG015
 
@@ -1,29 +1,37 @@
 """Main file processor."""
 import logging
-import weaviate
-from ETL.document_processor.main_processor.file_processor import FileProcessor
+from typing import Callable
+
 from ETL.document_processor.base.models import ProcessingConfig
 from ETL.document_processor.utils.settings import weaviate_settings
-from ETL.document_processor.utils.file_utils import download_file
-from ETL.document_processor.utils.file_utils import convert_to_pdf
-
-from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
 
-def process_new_files(files: list[dict], config: ProcessingConfig) -> dict:
+def process_new_files(
+    files: list[dict],
+    config: ProcessingConfig,
+    on_file_done: Callable[[dict, int], None] | None = None,
+) -> dict:
     """
     Process a list of files from SharePoint.
     
     Args:
         files: List of file metadata dicts
         config: Processing configuration
+        on_file_done: Called with the metadata and the unprocessed image count of each file
+            as soon as it is stored
         
     Returns:
         Dict mapping filenames to unprocessed image counts
     """
+    # Heavy imports (weaviate, langchain, Azure SDKs) only when there are files to process
+    import weaviate
+    from ETL.document_processor.main_processor.file_processor import FileProcessor
+    from ETL.document_processor.utils.file_utils import download_files
+
     weaviate_client = weaviate.connect_to_local(weaviate_settings.url)
+    processor = None
     try:
         n_chunks = None
 
@@ -31,31 +39,31 @@ def process_new_files(files: list[dict], config: ProcessingConfig) -> dict:
         #processor = FileProcessor(config=config)
         unprocessed_per_file_dict = {}
 
-        for file_metadata in tqdm(files):
-
-            should_convert = (config.parser_type == 'vision')
-            file_path = download_file(file_metadata, convert_to_pdf=should_convert)
-
-            msg = f"processing file {file_metadata['name']}"
-            logger.info(msg)
+        # Download all the files concurrently
+        should_convert = (config.parser_type == 'vision')
+        file_paths = download_files(files, convert_to_pdf=should_convert)
 
+        items = []
+        for file_metadata, file_path in zip(files, file_paths):
             file_metadata["file_path"] = file_path
+            items.append((file_path, file_metadata))
+
+        # Process files, their parsing overlaps
+        results = processor.process_files(
+            items,
+            on_file_done=None if on_file_done is None else lambda index, result: on_file_done(files[index], result[1]),
+        )
 
-            # Process file
-            n_chunks, unprocessed = processor.process_file(
-                file_path=file_path,
-                file_metadata=file_metadata
-            )
+        for file_metadata, (n_chunks, unprocessed) in zip(files, results):
 
             # Store unprocessed items
             unprocessed_per_file_dict[file_metadata['name']] = unprocessed
             
             # Log results
             if unprocessed:
-                unprocessed_str = ", ".join([f"{count} {item}" for item, count in unprocessed.items()])
                 logger.info(
                     f"Completed {file_metadata['name']}: "
-                    f"{n_chunks} chunks, Unprocessed: {unprocessed_str}"
+                    f"{n_chunks} chunks, Unprocessed: {unprocessed} images"
                 )
             else:
                 logger.info(
@@ -66,4 +74,6 @@ def process_new_files(files: list[dict], config: ProcessingConfig) -> dict:
         return unprocessed_per_file_dict
 
     finally:
+        if processor is not None:
+            processor.close()
         weaviate_client.close()
@@ -2,8 +2,11 @@
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ETL.db_access.ops import record_operations_stats
+from ETL.nodes.checkpoint import clear_checkpoint, load_checkpoint, pending_files, record_file_done
 from ETL.nodes.compare_kbs import compare_kbs
 from ETL.nodes.delete_old_entries import delete_entries_with_id
 from ETL.nodes.get_file_metadata_from_db import get_file_metadata_from_db
@@ -12,7 +15,7 @@ from ETL.nodes.process_new_files import process_new_files
 from ETL.tools.weaviate_setup import check_n_create_weaviate_collection
 from ETL.document_processor.base.models import ProcessingConfig
 from ETL.tools.settings import rag_app_settings
-from ETL.tools.registry_utils import get_etl_sources
+from ETL.tools.registry_utils import get_etl_sources_cached
 
 # Configure logging to write to stdout
 logging.basicConfig(
@@ -25,163 +28,203 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Get app_id from settings
-app_id = rag_app_settings.app_id
-logger.info(f"Loading configuration for app_id: {app_id}")
+USE_FILESYSTEM = False
+
+
+@lru_cache(maxsize=8)
+def load_processing_config(app_id: int) -> ProcessingConfig:
+    """Build the ProcessingConfig of an app from its App Registry configuration.
 
+    Falls back to a default configuration when the registry has none for app_id.
 
-# Fetch all ETL configurations from App Registry API
-try:
-    all_etl_configs = get_etl_sources()
+    Raises:
+        Exception: If the ETL configurations can't be retrieved from the App Registry
+    """
+    logger.info(f"Loading configuration for app_id: {app_id}")
+
+    # Fetch all ETL configurations from App Registry API
+    all_etl_configs = get_etl_sources_cached(app_id)
     logger.info(f"Retrieved {len(all_etl_configs)} ETL configurations from App Registry")
-except Exception as e:
-    logger.error(f"Failed to retrieve ETL configurations from App Registry: {e}")
-    logger.error("Cannot proceed without ETL configuration. Exiting...")
-    sys.exit(1)
-
-
-# Filter configuration for current app_id
-filtered_configs = [item for item in all_etl_configs if item.applicationId == app_id]
-
-# Create ProcessingConfig from registry values
-if filtered_configs:
-    registry_config = filtered_configs[0]
-    logger.info(f"Found ETL configuration for app_id {app_id}")
-    logger.info(f"  - applicationName: {registry_config.applicationName}")
-    logger.info(f"  - parserType: {registry_config.parserType}")
-    logger.info(f"  - chunkerType: {registry_config.chunkerType}")
-    logger.info(f"  - chunkAugmentationMethod: {registry_config.chunkAugmentationMethod}")
+
+    # Filter configuration for current app_id
+    filtered_configs = [item for item in all_etl_configs if item.applicationId == app_id]
+
+    # Create ProcessingConfig from registry values
+    if filtered_configs:
+        registry_config = filtered_configs[0]
+        logger.info(f"Found ETL configuration for app_id {app_id}")
+        logger.info(f"  - applicationName: {registry_config.applicationName}")
+        logger.info(f"  - parserType: {registry_config.parserType}")
+        logger.info(f"  - chunkerType: {registry_config.chunkerType}")
+        logger.info(f"  - chunkAugmentationMethod: {registry_config.chunkAugmentationMethod}")
     
-    # Normalize chunk_augmentation_method: convert 'None' or None to 'none'
-    chunk_method = registry_config.chunkAugmentationMethod
-    if chunk_method in [None, 'None']:
-        chunk_method = 'none'
-        logger.info(f"  - Normalized chunkAugmentationMethod from '{registry_config.chunkAugmentationMethod}' to 'none'")
+        # Normalize chunk_augmentation_method: convert 'None' or None to 'none'
+        chunk_method = registry_config.chunkAugmentationMethod
+        if chunk_method in [None, 'None']:
+            chunk_method = 'none'
+            logger.info(f"  - Normalized chunkAugmentationMethod from '{registry_config.chunkAugmentationMethod}' to 'none'")
     
-    config1 = ProcessingConfig(
-        parser_type=registry_config.parserType or 'document_intelligence',
-        chunking_strategy=registry_config.chunkerType or 'recursive',
-        chunk_augment_method=chunk_method,
-        document_page_stitching=True,
-    )
+        config1 = ProcessingConfig(
+            parser_type=registry_config.parserType or 'document_intelligence',
+            chunking_strategy=registry_config.chunkerType or 'recursive',
+            chunk_augment_method=chunk_method,
+            document_page_stitching=True,
+        )
     
-    logger.info(f"ProcessingConfig created successfully:")
-    logger.info(f"  - parser_type: {config1.parser_type}")
-    logger.info(f"  - chunking_strategy: {config1.chunking_strategy}")
-    logger.info(f"  - chunk_augment_method: {config1.chunk_augment_method}")
-    logger.info(f"  - append_summary_to_chunks: {config1.append_summary_to_chunks}")
-    logger.info(f"  - use_iterative_reconstruction: {config1.use_iterative_reconstruction}")
-    logger.info(f"  - document_page_stitching: {config1.document_page_stitching}")
+        logger.info(f"ProcessingConfig created successfully:")
+        logger.info(f"  - parser_type: {config1.parser_type}")
+        logger.info(f"  - chunking_strategy: {config1.chunking_strategy}")
+        logger.info(f"  - chunk_augment_method: {config1.chunk_augment_method}")
+        logger.info(f"  - append_summary_to_chunks: {config1.append_summary_to_chunks}")
+        logger.info(f"  - use_iterative_reconstruction: {config1.use_iterative_reconstruction}")
+        logger.info(f"  - document_page_stitching: {config1.document_page_stitching}")
     
-else:
-    # No matching configuration found for app_id
-    logger.warning(f"No ETL configuration found for app_id {app_id}")
-    logger.warning(f"Available applicationIds: {[item.applicationId for item in all_etl_configs]}")
+    else:
+        # No matching configuration found for app_id
+        logger.warning(f"No ETL configuration found for app_id {app_id}")
+        logger.warning(f"Available applicationIds: {[item.applicationId for item in all_etl_configs]}")
     
-    # Option 1: Use default configuration (current behavior)
-    logger.warning("Using default configuration")
-    config1 = ProcessingConfig(
-        chunking_strategy="recursive",
-        parser_type='document_intelligence',
-        chunk_augment_method='none',
-        document_page_stitching=False,
-    )
-    logger.info("Using default ProcessingConfig")
+        # Option 1: Use default configuration (current behavior)
+        logger.warning("Using default configuration")
+        config1 = ProcessingConfig(
+            chunking_strategy="recursive",
+            parser_type='document_intelligence',
+            chunk_augment_method='none',
+            document_page_stitching=False,
+        )
+        logger.info("Using default ProcessingConfig")
 
+    if rag_app_settings.max_workers:
+        config1.chunk_workers = rag_app_settings.max_workers
+        logger.info(f"  - chunk_workers: {config1.chunk_workers}")
 
-USE_FILESYSTEM = False
+    return config1
 
-check_n_create_weaviate_collection()
-
-logger.info("getting metadata from DB...")
-db_data = get_file_metadata_from_db(use_filesystem=USE_FILESYSTEM)
-
-logger.info("getting metadata from SPO...")
-spo_data = get_file_metadata_from_spo(use_filesystem=USE_FILESYSTEM)
-
-logger.info("comparing metadata....")
-if USE_FILESYSTEM is False:
-    new_files, deleted_files, updated_files = compare_kbs(
-        use_filesystem=USE_FILESYSTEM,
-        new_data=spo_data,
-        old_data=db_data,
-    )
-    msg = f"""There are: {len(new_files)} new files,
-        and {len(updated_files)} updated files
-        and {len(deleted_files)} deleted files."""
-    logger.info(msg)
-    if new_files:
-        try:
-            logger.info("New files to be added:")
-            for f in new_files:
-                msg = f"- {f['name']}"
-                logger.info(msg)
-            images_count_per_file_dict = process_new_files(new_files, config1)
-
-            n_new_files = len(new_files)
-        except Exception as e:
-            # any error happened
-            n_new_files = -1
-            images_count_per_file_dict = {}
-            logger.exception(str(e))  # noqa: TRY401
-    else:
-        n_new_files = 0
-        images_count_per_file_dict = {}  # Changed default
-
-    if deleted_files:
-        try:
-            logger.info("Old files to be deleted:")
-            for f in deleted_files:
-                msg = f["id"]
-                logger.info(msg)
-            delete_entries_with_id(deleted_files)
-
-            n_deleted_files = len(deleted_files)
-        except Exception as e:
-            # any error happened
-            n_deleted_files = -1
-            logger.exception(str(e))  # noqa: TRY401
 
-    else:
-        n_deleted_files = 0
-
-    if updated_files:
-        try:
-            logger.info("Files to be updated:")
-            for f in updated_files:
-                msg = f"- {f['name']}"
-                logger.info(msg)
-            # update = delete + add new
-            delete_entries_with_id(updated_files)
-            images_count_per_file_dict_updated = process_new_files(updated_files, config1)  ## added 
-            images_count_per_file_dict.update(images_count_per_file_dict_updated) ## added
-
-            n_updated_files = len(updated_files)
-        except Exception as e:
-            # any error happened
-            n_updated_files = -1
-            logger.exception(str(e))  # noqa: TRY401
-    else:
-        n_updated_files = 0
+def main() -> None:
+    """Run the ETL: sync the Weaviate collection with the files in SPO."""
+    try:
+        config1 = load_processing_config(rag_app_settings.app_id)
+    except Exception as e:
+        logger.error(f"Failed to retrieve ETL configurations from App Registry: {e}")
+        logger.error("Cannot proceed without ETL configuration. Exiting...")
+        sys.exit(1)
+
+    check_n_create_weaviate_collection()
+
+    # The DB and SPO metadata come from independent backends, fetch them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        logger.info("getting metadata from DB...")
+        db_future = executor.submit(get_file_metadata_from_db, use_filesystem=USE_FILESYSTEM)
+
+        logger.info("getting metadata from SPO...")
+        spo_future = executor.submit(get_file_metadata_from_spo, use_filesystem=USE_FILESYSTEM)
+
+        db_data, spo_data = db_future.result(), spo_future.result()
+
+    logger.info("comparing metadata....")
+    if USE_FILESYSTEM is False:
+        new_files, deleted_files, updated_files = compare_kbs(
+            use_filesystem=USE_FILESYSTEM,
+            new_data=spo_data,
+            old_data=db_data,
+        )
+        msg = f"""There are: {len(new_files)} new files,
+            and {len(updated_files)} updated files
+            and {len(deleted_files)} deleted files."""
+        logger.info(msg)
+
+        # Files stored by an interrupted run, in the same version, are not processed again
+        checkpoint = load_checkpoint()
+
+        def add_new_files() -> tuple[int, dict]:
+            """Process the new files, return their number (-1 on error) and their unprocessed images."""
+            try:
+                logger.info("New files to be added:")
+                for f in new_files:
+                    msg = f"- {f['name']}"
+                    logger.info(msg)
+                files = pending_files(new_files, checkpoint)
+                return len(new_files), process_new_files(files, config1, on_file_done=record_file_done) if files else {}
+            except Exception as e:
+                # any error happened
+                logger.exception(str(e))  # noqa: TRY401
+                return -1, {}
+
+        def update_files() -> tuple[int, dict]:
+            """Process the updated files, return their number (-1 on error) and their unprocessed images."""
+            try:
+                logger.info("Files to be updated:")
+                for f in updated_files:
+                    msg = f"- {f['name']}"
+                    logger.info(msg)
+                files = pending_files(updated_files, checkpoint)
+                if not files:
+                    return len(updated_files), {}
+                # update = delete + add new
+                delete_entries_with_id(files)
+                return len(updated_files), process_new_files(files, config1, on_file_done=record_file_done)
+            except Exception as e:
+                # any error happened
+                logger.exception(str(e))  # noqa: TRY401
+                return -1, {}
+
+        # The new and the updated files don't share any entry, process them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            new_future = executor.submit(add_new_files) if new_files else None
+            updated_future = executor.submit(update_files) if updated_files else None
+
+            if deleted_files:
+                try:
+                    logger.info("Old files to be deleted:")
+                    for f in deleted_files:
+                        msg = f["id"]
+                        logger.info(msg)
+                    delete_entries_with_id(deleted_files)
+
+                    n_deleted_files = len(deleted_files)
+                except Exception as e:
+                    # any error happened
+                    n_deleted_files = -1
+                    logger.exception(str(e))  # noqa: TRY401
+
+            else:
+                n_deleted_files = 0
+
+            n_new_files, images_count_per_file_dict = new_future.result() if new_future else (0, {})
+            n_updated_files, images_count_per_file_dict_updated = (
+                updated_future.result() if updated_future else (0, {})
+            )
+            images_count_per_file_dict.update(images_count_per_file_dict_updated)
+
+        # the files stored before a failure, in this run or an interrupted one, are reported too
+        images_count_per_file_dict = {
+            **{entry["name"]: entry["unprocessed"] for entry in load_checkpoint().values()},
+            **images_count_per_file_dict,
+        }
+
+        # fill the report table in the DB
+        if n_new_files == -1 and n_deleted_files == -1 and n_updated_files == -1:
+            logger.error("Error happened during processing files, not recording stats")
+        else:
+            logger.info("Record operations in DB...")
+            record_operations_stats(
+                n_new_files=n_new_files,
+                n_updated_files=n_updated_files,
+                n_deleted_files=n_deleted_files,
+                images_count_per_file=images_count_per_file_dict
+            )
+            clear_checkpoint()
 
-    # fill the report table in the DB
-    if n_new_files == -1 and n_deleted_files == -1 and n_updated_files == -1:
-        logger.error("Error happened during processing files, not recording stats")
     else:
-        logger.info("Record operations in DB...")
-        formatting = "{} - Images present and not supported".format(n_updated_files)
-        record_operations_stats(
-            n_new_files=n_new_files,
-            n_updated_files=n_updated_files,
-            n_deleted_files=n_deleted_files,
-            images_count_per_file=images_count_per_file_dict
+        compare_kbs(
+            use_filesystem=USE_FILESYSTEM,
+            new_data=spo_data,
+            old_data=db_data,
         )
 
-else:
-    compare_kbs(
-        use_filesystem=USE_FILESYSTEM,
-        new_data=spo_data,
-        old_data=db_data,
-    )
+    logger.info("All Right!")
+
 
-logger.info("All Right!")
+if __name__ == "__main__":
+    main()
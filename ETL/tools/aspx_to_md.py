@@ -2,15 +2,62 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from html import unescape
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Iterator
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from markdownify import MarkdownConverter
+
+from ETL.tools.file_utils import write_atomic
+from ETL.tools.fs_constants import ASPX_CACHE_DIR
+from ETL.tools.settings import rag_app_settings
 
 logger = logging.getLogger(__name__)
 
+# Parser used by BeautifulSoup: the C-based lxml when installed, several times faster
+HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
+
+# Patterns compiled once, the same ones run on every page of a batch
+_IMG_SRC_RE = re.compile(r'<img[^>]*src="([^"]*)"[^>]*>')
+_PLUGIN_URL_RE = re.compile(r'data-imageurl="([^"]*)"')
+_BANNER_SRC_RE = re.compile(r'data-sp-prop-name="imageSource"[^>]*src="([^"]*)"')
+_WEBPART_IMAGE_RE = re.compile(r'"imageSources"[^{]*{[^{]*"([^"]*)"[^}]*}')
+_TITLE_RE = re.compile(r"<title>(.*?)</title>")
+_CANVAS_RE = re.compile(r"<mso:CanvasContent1[^>]*>(.*?)</mso:CanvasContent1>", re.DOTALL)
+_RTE_RE = re.compile(r'<div data-sp-rte="[^"]*">(.*?)</div>', re.DOTALL)
+_WEBPART_RE = re.compile(r'data-sp-webpartdata="[^"]*"')
+_WEBPART_TEXT_RE = re.compile(r"searchablePlainTexts&[^;]*;&[^;]*;([^&]*?)&", re.DOTALL)
+_BODY_RE = re.compile(r"<body[^>]*>(.*?)</body>", re.DOTALL)
+_PLUGIN_BLOCK_RE = re.compile(r'<div class="imagePlugin"[^>]*data-imageurl="([^"]*)"[^>]*>(.*?)</div>')
+_WIDTH_RE = re.compile(r'data-width="([^"]*)"')
+_HEIGHT_RE = re.compile(r'data-height="([^"]*)"')
+_IMAGE_TITLE_RE = re.compile(r'data-imagetitle="([^"]*)"')
+_DATA_SP_RE = re.compile(r' data-sp-(?!prop-name="imageSource")[^=]*="[^"]*"')
+
+# Tags that keep a div or span from being removed as empty by clean_sharepoint_html
+_KEPT_TAGS = frozenset({"img", "a", "table", "iframe"})
+
+# Converter shared by every page, it only keeps a cache of its conversion functions
+_MARKDOWN_CONVERTER = MarkdownConverter()
+
+
+def _is_image_plugin(tag: Tag) -> bool:
+    """Tell whether a tag is a SharePoint imagePlugin div."""
+    return tag.name == "div" and "imagePlugin" in (tag.get("class") or [])
+
+
+def _is_image_element(tag: Tag) -> bool:
+    """Tell whether a tag references an image: img, imagePlugin div or SharePoint image source."""
+    return tag.name == "img" or _is_image_plugin(tag) or tag.get("data-sp-prop-name") == "imageSource"
+
 
 class ImagePathProcessor:
     """Handles the extraction and reference updating of images without downloading."""
@@ -31,8 +78,10 @@ class ImagePathProcessor:
         self.local_base_path = local_base_path or Path(
             r"C:\Source\parsing_tests\SitePages",
         )
-        self.processed_images = {}  # Maps original URLs to new local paths
-        self.failed_images = []  # List of URLs that couldn't be processed
+        # the local paths are built by joining strings, cheaper than Path arithmetic per image
+        self._base_str = str(self.local_base_path)
+        self.processed_images = {}  # Maps original URLs to new local paths, or to themselves
+        self.failed_images = set()  # URLs that couldn't be processed
         self.verbose = verbose
 
         # SharePoint paths to replace - will be replaced with local_base_path
@@ -45,38 +94,36 @@ class ImagePathProcessor:
             src (str): Image source URL
 
         Returns:
-            str: Local file path or None if cannot be processed
+            str: Local file path, the original URL if it cannot be processed,
+                or None if there is no URL
 
         """
+        # every URL seen before, processed or not, is answered from the mapping
         if src in self.processed_images:
             return self.processed_images[src]
 
         if not src:
             return None
 
-        # Skip data URLs
-        if src.startswith("data:"):
-            return src
-
-        try:
-            # Check if the URL starts with the SharePoint path prefix
-            if src.startswith(self.sharepoint_path_prefix):
-                # Extract the path after the SharePoint prefix
-                relative_path = src[len(self.sharepoint_path_prefix) :].lstrip("/")
-
-                # Create local path using the base path and relative path
-                local_path = self.local_base_path / relative_path
-
-                self.processed_images[src] = local_path
-                return local_path
-
-            self.failed_images.append(src)
-            return src  # noqa: TRY300 Return original for now, may improve this fallback later
-        except Exception:  # noqa: BLE001
-            self.failed_images.append(src)
-            return src
-
-    def process_html_images(self, html_content: str) -> str:  # noqa: C901
+        # Check if the URL starts with the SharePoint path prefix
+        if src.startswith(self.sharepoint_path_prefix):
+            # Extract the path after the SharePoint prefix
+            relative_path = src[len(self.sharepoint_path_prefix) :].lstrip("/")
+
+            # Create local path using the base path and relative path
+            local_path = os.path.join(self._base_str, relative_path) if relative_path else self._base_str  # noqa: PTH118
+            # an img tag already given its local path is seen again by the imageSource pass
+            self.processed_images[local_path] = local_path
+        else:
+            # Return original for now, may improve this fallback later; data URLs are kept as is
+            local_path = src
+            if not src.startswith("data:"):
+                self.failed_images.add(src)
+
+        self.processed_images[src] = local_path
+        return local_path
+
+    def process_html_images(self, html_content: str) -> str:
         """Process all images in the HTML content and update references to local paths.
 
         Args:
@@ -86,52 +133,47 @@ class ImagePathProcessor:
             str: Updated HTML content with local image references
 
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # 1. Process standard img tags
-        for img in soup.find_all("img"):
-            src = img.get("src")
-            if not src:
-                continue
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+        self.process_soup_images(soup)
+        return str(soup)
 
-            # Get the local path
-            local_path = self.get_local_image_path(src)
+    def process_soup_images(self, soup: BeautifulSoup) -> None:
+        """Update the image references of a parsed HTML document to local paths, in place.
 
-            if local_path:
-                # Update the img tag with the new source
-                img["src"] = local_path
-
-        # 2. Process SharePoint imagePlugin divs
-        for div in soup.find_all("div", {"class": "imagePlugin"}):
-            # Extract image URL from data-imageurl attribute
-            image_url = div.get("data-imageurl")
+        Args:
+            soup (BeautifulSoup): Parsed HTML content
 
-            if not image_url:
+        """
+        # A single walk over the three kinds of image elements, in document order
+        for element in soup.find_all(_is_image_element):
+            # SharePoint imagePlugin divs become standard img tags
+            image_url = element.get("data-imageurl") if _is_image_plugin(element) else None
+            if image_url:
+                # Get the local path
+                local_path = self.get_local_image_path(image_url)
+
+                if local_path:
+                    # Create a new img tag to replace the div
+                    new_img = soup.new_tag("img")
+                    new_img["src"] = local_path
+
+                    # Copy dimensions if available
+                    if element.get("data-height"):
+                        new_img["height"] = element["data-height"]
+                    if element.get("data-width"):
+                        new_img["width"] = element["data-width"]
+
+                    # Add alt text if available
+                    if element.get("data-imagetitle"):
+                        new_img["alt"] = element["data-imagetitle"]
+
+                    # Replace the div with the new img tag
+                    element.replace_with(new_img)
                 continue
 
-            # Get the local path
-            local_path = self.get_local_image_path(image_url)
-
-            if local_path:
-                # Create a new img tag to replace the div
-                new_img = soup.new_tag("img")
-                new_img["src"] = local_path
-
-                # Copy dimensions if available
-                if div.get("data-height"):
-                    new_img["height"] = div["data-height"]
-                if div.get("data-width"):
-                    new_img["width"] = div["data-width"]
-
-                # Add alt text if available
-                if div.get("data-imagetitle"):
-                    new_img["alt"] = div["data-imagetitle"]
-
-                # Replace the div with the new img tag
-                div.replace_with(new_img)
-
-        # 3. Process SharePoint-specific image data attributes
-        for element in soup.find_all(attrs={"data-sp-prop-name": "imageSource"}):
+            # Standard img tags and SharePoint-specific image data attributes
+            if element.name != "img" and element.get("data-sp-prop-name") != "imageSource":
+                continue
             src = element.get("src")
             if not src:
                 continue
@@ -143,8 +185,6 @@ class ImagePathProcessor:
                 # Update the element with the new source
                 element["src"] = local_path
 
-        return str(soup)
-
 
 def extract_direct_image_urls(content: str) -> str:
     """Extract image URLs directly from the ASPX content before any processing.
@@ -159,22 +199,19 @@ def extract_direct_image_urls(content: str) -> str:
     image_urls = []
 
     # Extract URLs from standard img tags
-    img_matches = re.findall(r'<img[^>]*src="([^"]*)"[^>]*>', content)
+    img_matches = _IMG_SRC_RE.findall(content)
     image_urls.extend(img_matches)
 
     # Extract URLs from imagePlugin divs
-    plugin_matches = re.findall(r'data-imageurl="([^"]*)"', content)
+    plugin_matches = _PLUGIN_URL_RE.findall(content)
     image_urls.extend(plugin_matches)
 
     # Extract URLs from SharePoint banner components
-    banner_matches = re.findall(
-        r'data-sp-prop-name="imageSource"[^>]*src="([^"]*)"',
-        content,
-    )
+    banner_matches = _BANNER_SRC_RE.findall(content)
     image_urls.extend(banner_matches)
 
     # Extract URLs from data-imageSources in webpart data
-    webpart_matches = re.findall(r'"imageSources"[^{]*{[^{]*"([^"]*)"[^}]*}', content)
+    webpart_matches = _WEBPART_IMAGE_RE.findall(content)
     image_urls.extend(webpart_matches)
 
     return list(set(image_urls))  # Remove duplicates
@@ -213,14 +250,62 @@ def convert_aspx_to_markdown(
     with Path(input_file).open(encoding="utf-8") as file_:
         content = file_.read()
 
+    # A page converted before, e.g. by a retry or a re-run, is read back from the cache
+    cache_file = None
+    if rag_app_settings.aspx_cache:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (str(img_processor.local_base_path), content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        cache_file = ASPX_CACHE_DIR / f"{digest.hexdigest()}.md"
+        try:
+            return cache_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+
+    markdown = _convert_aspx_content(content, img_processor)
+
+    if cache_file is not None:
+        write_atomic(cache_file, markdown)
+    return markdown
+
+
+def _convert_aspx_content(content: str, img_processor: ImagePathProcessor) -> str:
+    """Convert the content of an ASPX file to Markdown."""
     # First convert ASPX to HTML
     html_content = convert_aspx_string_to_html(content)
 
-    # Process images in HTML
-    html_with_images = img_processor.process_html_images(html_content)
+    # Process images in HTML, the parsed document is converted as is
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    img_processor.process_soup_images(soup)
 
     # Then convert HTML to Markdown
-    return md(html_with_images)
+    return _MARKDOWN_CONVERTER.convert_soup(soup)
+
+
+def convert_aspx_batch(
+    paths: list[Path],
+    local_base_path: Path | None = None,
+    max_workers: int | None = None,
+) -> dict[Path, str]:
+    """Convert several SharePoint ASPX files to Markdown, in parallel processes.
+
+    The conversion is CPU bound (regex, BeautifulSoup and markdownify), threads
+    would run it one file at a time.
+
+    Args:
+        paths (list[Path]): Paths to the input ASPX files
+        local_base_path (Path, optional): Base path for local image files
+        max_workers (int, optional): Number of processes. Defaults to the number of CPUs
+
+    Returns:
+        dict[Path, str]: the converted content of each file.
+
+    """
+    convert = partial(convert_aspx_to_markdown, local_base_path=local_base_path)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        # several files per task, so the pickling round-trips are amortised
+        return dict(zip(paths, executor.map(convert, paths, chunksize=4)))
 
 
 def convert_aspx_string_to_html(aspx_content: str) -> str:
@@ -234,21 +319,21 @@ def convert_aspx_string_to_html(aspx_content: str) -> str:
 
     """
     # Extract the page title
-    title_match = re.search(r"<title>(.*?)</title>", aspx_content)
+    title_match = _TITLE_RE.search(aspx_content)
     page_title = title_match.group(1) if title_match else "Converted Page"
 
     extracted_content = ""
 
-    # Try multiple extraction methods in order of preference
-    extraction_methods = [
-        extract_from_canvas_content,
-        extract_from_rte_divs,
-        extract_from_webparts,
-        extract_from_body,
-    ]
+    # Try multiple extraction methods in order of preference, lazily;
+    # the rte divs and the webparts both search the page decoded once
+    def extractions() -> Iterator[str | None]:
+        yield extract_from_canvas_content(aspx_content)
+        decoded_content = decode_sharepoint_entities(aspx_content)
+        yield extract_from_rte_divs(aspx_content, decoded_content=decoded_content)
+        yield extract_from_webparts(aspx_content, decoded_content=decoded_content)
+        yield extract_from_body(aspx_content)
 
-    for method in extraction_methods:
-        extracted = method(aspx_content)
+    for extracted in extractions():
         if extracted and len(extracted.strip()) > 0:
             extracted_content = extracted
             break
@@ -277,11 +362,7 @@ def convert_aspx_string_to_html(aspx_content: str) -> str:
 
 def extract_from_canvas_content(content: str) -> str:
     """Extract content from SharePoint's CanvasContent1 section."""
-    canvas_content_match = re.search(
-        r"<mso:CanvasContent1[^>]*>(.*?)</mso:CanvasContent1>",
-        content,
-        re.DOTALL,
-    )
+    canvas_content_match = _CANVAS_RE.search(content)
 
     if not canvas_content_match:
         return None
@@ -298,14 +379,17 @@ def extract_from_canvas_content(content: str) -> str:
     return clean_sharepoint_html(canvas_content)
 
 
-def extract_from_rte_divs(content: str) -> str:
-    """Extract content from data-sp-rte (Rich Text Editor) divs."""
+def extract_from_rte_divs(content: str, decoded_content: str | None = None) -> str:
+    """Extract content from data-sp-rte (Rich Text Editor) divs.
+
+    decoded_content, when given, is content already passed through decode_sharepoint_entities.
+    """
     # Decode the content first
-    decoded_content = decode_sharepoint_entities(content)
+    if decoded_content is None:
+        decoded_content = decode_sharepoint_entities(content)
 
     # Find all Rich Text Editor divs
-    rte_pattern = r'<div data-sp-rte="[^"]*">(.*?)</div>'
-    rte_matches = re.findall(rte_pattern, decoded_content, re.DOTALL)
+    rte_matches = _RTE_RE.findall(decoded_content)
 
     if not rte_matches:
         return None
@@ -320,16 +404,18 @@ def extract_from_rte_divs(content: str) -> str:
     return extracted_content
 
 
-def extract_from_webparts(content: str) -> str:
-    """Extract content from SharePoint web parts."""
-    decoded_content = decode_sharepoint_entities(content)
+def extract_from_webparts(content: str, decoded_content: str | None = None) -> str:
+    """Extract content from SharePoint web parts.
+
+    decoded_content, when given, is content already passed through decode_sharepoint_entities.
+    """
+    if decoded_content is None:
+        decoded_content = decode_sharepoint_entities(content)
 
     # Look for content in webpart data
-    webpart_pattern = r'data-sp-webpartdata="[^"]*"'
-    if re.search(webpart_pattern, decoded_content):
+    if _WEBPART_RE.search(decoded_content):
         # Find searchable plain texts in webparts
-        text_pattern = r"searchablePlainTexts&[^;]*;&[^;]*;([^&]*?)&"
-        text_matches = re.findall(text_pattern, decoded_content, re.DOTALL)
+        text_matches = _WEBPART_TEXT_RE.findall(decoded_content)
 
         if text_matches:
             extracted_content = ""
@@ -343,7 +429,7 @@ def extract_from_webparts(content: str) -> str:
 
 def extract_from_body(content: str) -> str | None:
     """Extract content from the body section as a last resort."""
-    body_match = re.search(r"<body[^>]*>(.*?)</body>", content, re.DOTALL)
+    body_match = _BODY_RE.search(content)
     if body_match:
         body_content = body_match.group(1)
         # Try to clean up the content
@@ -353,33 +439,12 @@ def extract_from_body(content: str) -> str | None:
 
 
 def decode_sharepoint_entities(content: str) -> str:
-    """Decode SharePoint specific HTML entities."""
-    # Basic HTML entities
-    decoded = content.replace("&amp;", "&")
-    decoded = decoded.replace("&lt;", "<")
-    decoded = decoded.replace("&gt;", ">")
-    decoded = decoded.replace("&quot;", '"')
-
-    # SharePoint specific encoding
-    decoded = decoded.replace("&#58;", ":")
-    decoded = decoded.replace("&#123;", "{")
-    decoded = decoded.replace("&#125;", "}")
-    decoded = decoded.replace("&#160;", "&nbsp;")
-    decoded = decoded.replace("&amp;#58;", ":")
-    decoded = decoded.replace("&amp;#123;", "{")
-    decoded = decoded.replace("&amp;#125;", "}")
-    decoded = decoded.replace("&amp;#160;", "&nbsp;")
-
-    # Handle more complex number entities
-    entities = re.findall(r"&#(\d+);", decoded)
-    for entity in entities:
-        try:
-            char_code = int(entity)
-            decoded = decoded.replace(f"&#{entity};", chr(char_code))
-        except (ValueError, OverflowError):  # noqa: PERF203
-            pass
+    """Decode SharePoint specific HTML entities.
 
-    return decoded
+    SharePoint encodes the page content twice (e.g. ``&amp;#58;`` for ``:``),
+    so the entities are decoded twice.
+    """
+    return unescape(unescape(content))
 
 
 def convert_sharepoint_image_plugins(content: str) -> str:
@@ -392,8 +457,6 @@ def convert_sharepoint_image_plugins(content: str) -> str:
         str: HTML content with image plugins converted to standard img tags
 
     """
-    # Pattern to find SharePoint image plugins
-    pattern = r'<div class="imagePlugin"[^>]*data-imageurl="([^"]*)"[^>]*>(.*?)</div>'
 
     def replace_plugin(match) -> str:  # noqa: ANN001
         image_url = match.group(1)
@@ -403,8 +466,8 @@ def convert_sharepoint_image_plugins(content: str) -> str:
         div_attrs = match.group(0)
 
         # Extract width and height
-        width_match = re.search(r'data-width="([^"]*)"', div_attrs)
-        height_match = re.search(r'data-height="([^"]*)"', div_attrs)
+        width_match = _WIDTH_RE.search(div_attrs)
+        height_match = _HEIGHT_RE.search(div_attrs)
 
         if width_match:
             attributes["width"] = width_match.group(1)
@@ -412,7 +475,7 @@ def convert_sharepoint_image_plugins(content: str) -> str:
             attributes["height"] = height_match.group(1)
 
         # Extract alt text/title
-        title_match = re.search(r'data-imagetitle="([^"]*)"', div_attrs)
+        title_match = _IMAGE_TITLE_RE.search(div_attrs)
         if title_match:
             attributes["alt"] = title_match.group(1)
 
@@ -425,26 +488,53 @@ def convert_sharepoint_image_plugins(content: str) -> str:
         return img_tag
 
     # Replace all image plugins with standard img tags
-    return re.sub(pattern, replace_plugin, content)
+    return _PLUGIN_BLOCK_RE.sub(replace_plugin, content)
+
+
+def _remove_empty_containers(soup: BeautifulSoup) -> None:
+    """Remove the div and span elements with no text and no img, a, table or iframe inside.
+
+    A single pass: in reverse document order, the descendants of a node come before it,
+    so whether it has content is known from its children alone.
+    """
+    nodes = list(soup.descendants)
+    has_content: set[int] = set()  # ids of the nodes with text or a kept tag inside
+    for node in reversed(nodes):
+        if isinstance(node, Tag):
+            if id(node) in has_content or node.name in _KEPT_TAGS:
+                has_content.add(id(node.parent))
+        # the strings get_text counts, not the comments nor the script and style contents
+        elif type(node) in (NavigableString, CData) and node.strip():
+            has_content.add(id(node.parent))
+
+    # only the outermost empty containers are removed, their descendants go with them
+    removed: set[int] = set()
+    outermost = []
+    for node in nodes:
+        if id(node.parent) in removed:
+            removed.add(id(node))
+        elif node.name in ("div", "span") and id(node) not in has_content:
+            removed.add(id(node))
+            outermost.append(node)
+
+    # decompose frees them at once, nothing holds on to the removed elements
+    for node in outermost:
+        node.decompose()
 
 
 def clean_sharepoint_html(content: str) -> str:
     """Clean up SharePoint specific HTML attributes and tags."""
     # Remove SharePoint specific data attributes, but preserve image data
-    cleaned = re.sub(r' data-sp-(?!prop-name="imageSource")[^=]*="[^"]*"', "", content)
+    cleaned = _DATA_SP_RE.sub("", content)
 
     # Convert imagePlugin divs to standard img tags if they weren't converted already
-    image_plugin_pattern = (
-        r'<div class="imagePlugin"[^>]*data-imageurl="([^"]*)"[^>]*>(.*?)</div>'
-    )
-
     def replace_image_plugin(match) -> str:  # noqa: ANN001
         image_url = match.group(1)
         return f'<img src="{image_url}">'
 
-    cleaned = re.sub(image_plugin_pattern, replace_image_plugin, cleaned)
+    cleaned = _PLUGIN_BLOCK_RE.sub(replace_image_plugin, cleaned)
 
-    soup = BeautifulSoup(cleaned, "html.parser")
+    soup = BeautifulSoup(cleaned, HTML_PARSER)
 
     # Process any remaining imagePlugin divs that regex didn't catch
     for div in soup.find_all("div", {"class": "imagePlugin"}):
@@ -455,12 +545,7 @@ def clean_sharepoint_html(content: str) -> str:
             div.replace_with(img)
 
     # Remove empty or unnecessary elements
-    for element in soup.find_all(["div", "span"]):
-        # Check if element is just a container with no useful content
-        if not element.get_text(strip=True) and not element.find_all(
-            ["img", "a", "table", "iframe"],
-        ):
-            element.extract()
-
-    # Convert back to string
-    return str(soup)
+    _remove_empty_containers(soup)
+
+    # Convert back to string, without the <html><body> lxml wraps a fragment in
+    return soup.body.decode_contents() if soup.body else str(soup)
@@ -0,0 +1,44 @@
+"""Run coroutines on one long-lived event loop, shared by the whole process."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use."""
+    global _loop, _loop_thread
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name="shared-event-loop", daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run the coroutine on the shared event loop and block until it returns.
+
+    The async OpenAI clients keep their httpx connections bound to the loop they were
+    first used on: an LLM shared by several threads, each with its own asyncio.run,
+    ends up with failed or hanging calls. Every async LLM call goes through this loop
+    instead, whichever thread it comes from.
+
+    Raises:
+        RuntimeError: If called from a coroutine running on the shared loop, it would
+            wait for itself forever.
+    """
+    loop = _get_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_coroutine called from the shared event loop, await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
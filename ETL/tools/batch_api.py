@@ -0,0 +1,104 @@
+"""Run chat completions through the Azure OpenAI Batch API."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
+
+from ETL.tools.exceptions import BatchError
+
+logger = logging.getLogger(__name__)
+
+# Batch API route of the requests; Azure OpenAI takes it without the /v1 prefix
+BATCH_ENDPOINT = "/chat/completions"
+# Time the Batch API is given to complete a job
+BATCH_COMPLETION_WINDOW = "24h"
+# States of a batch job that will never complete
+BATCH_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+
+def submit_batch(client: AzureOpenAI, deployment: str, bodies: dict[str, dict], file_name: str) -> str:
+    """Submit chat completion requests as one Batch API job.
+
+    Args:
+        client: Azure OpenAI client.
+        deployment: Global batch deployment to run the requests on.
+        bodies: Chat completion parameters, without the model, by request id.
+        file_name: Name of the uploaded JSONL file.
+
+    Returns:
+        The id of the batch job.
+
+    """
+    requests_jsonl = b"".join(
+        orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {"model": deployment, **body},
+        }) + b"\n"
+        for custom_id, body in bodies.items()
+    )
+    input_file = client.files.create(file=(file_name, requests_jsonl), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(bodies)} requests")
+    return batch.id
+
+
+def fetch_batch(client: AzureOpenAI, batch_id: str) -> dict[str, str] | None:
+    """Read the answers of a batch job submitted by submit_batch.
+
+    Args:
+        client: Azure OpenAI client.
+        batch_id: Id of the batch job.
+
+    Returns:
+        The message content by request id, None while the job is still running.
+        The requests the job failed on are missing from it.
+
+    Raises:
+        BatchError: If the job failed, expired or was cancelled.
+
+    """
+    batch = client.batches.retrieve(batch_id)
+    if batch.status in BATCH_FAILED_STATUSES:
+        msg = f"Batch {batch_id} ended with status '{batch.status}'"
+        raise BatchError(msg)
+    if batch.status != "completed":
+        return None
+    if batch.output_file_id is None:
+        return {}
+
+    contents = {}
+    for line in client.files.content(batch.output_file_id).content.splitlines():
+        if not line.strip():
+            continue
+        result = orjson.loads(line)
+        response = result.get("response")
+        if response and response["status_code"] == 200:  # noqa: PLR2004
+            contents[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        else:
+            logger.warning(f"Batch request {result.get('custom_id')} failed: {result.get('error')}")
+    return contents
+
+
+def wait_for_batch(client: AzureOpenAI, batch_id: str, poll_interval: float) -> dict[str, str]:
+    """Block until the batch job is done and return its answers, as fetch_batch does.
+
+    Raises:
+        BatchError: If the job failed, expired or was cancelled.
+
+    """
+    while (contents := fetch_batch(client, batch_id)) is None:
+        time.sleep(poll_interval)
+    return contents
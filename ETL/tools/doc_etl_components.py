@@ -1,13 +1,17 @@
 import os
-import gc
+import asyncio
 from datetime import datetime
 from PIL import Image
 import fitz
-import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import get_context
 import io
 import time
+import random
 from pathlib import Path
-import shutil
 import base64
 from tqdm import tqdm
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -17,9 +21,163 @@ from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain_core.documents import Document
 import openai
 from ETL.document_processor.base.models import complete_doc
+from ETL.tools.batch_api import submit_batch, wait_for_batch
+from ETL.tools.exceptions import MaxRetriesError
+from ETL.tools.settings import azure_openai_completion_settings
+from ETL.tools.token_bucket import get_llm_token_bucket
+
+
+# Resolution the PDF pages are rendered at, before being sent to the multimodal LLM
+PDF_RENDER_DPI = 300
+
+
+# Processes rendering the PDF pages, shared by all the files and created on first use
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Return the process pool rendering the PDF pages, creating it on the first call.
+
+    The workers are spawned rather than forked: the ETL process runs threads and
+    holds clients and locks that a forked child would inherit in an unknown state.
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=get_context("spawn"))
+        return _render_pool
+
+
+def _discard_render_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken render pool, the next file creates a new one."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is pool:
+            _render_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_page(file, page_num, dpi=PDF_RENDER_DPI):
+    """Render one page of a PDF to JPEG bytes. Top-level so that it can run in a worker process."""
+    with fitz.open(file) as pdf_document:
+        # Render the page to an image
+        pix = pdf_document.load_page(page_num).get_pixmap(dpi=dpi)
+
+    # Wrap the rendered pixels as they are, no PNG encoding and decoding in between
+    img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+
+    # Save the image to a BytesIO object in JPEG format
+    img_byte_arr = io.BytesIO()
+    img.save(img_byte_arr, format='JPEG')
+    return img_byte_arr.getvalue()
+
+
+# Number of attempts of an LLM call before giving up
+LLM_MAX_RETRIES = 10
+# Longest wait, in seconds, between two attempts of an LLM call
+LLM_MAX_WAIT = 60
+# Tokens counted for one page image: the vision models bill images by 512px tiles,
+# not by their base64 size, and an A4 page at PDF_RENDER_DPI is 6 tiles in high detail
+IMAGE_TOKEN_ESTIMATE = 85 + 170 * 6
+# Tokens counted for the answer of an LLM without max_tokens
+LLM_OUTPUT_TOKEN_ESTIMATE = 4096
+# Errors worth another attempt: rate limits, connection errors, timeouts and server errors
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+def _retry_wait(error, attempt):
+    """
+    Seconds to wait before the next attempt of a failed LLM call.
+
+    The Retry-After header of the response is used when there is one, otherwise
+    a random exponential backoff, so that concurrent callers do not retry in lockstep.
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        return min(float(retry_after), LLM_MAX_WAIT)
+    except (TypeError, ValueError):
+        return random.uniform(0, min(LLM_MAX_WAIT, 2 ** attempt))
+
+
+def _report_content_filter(error):
+    """Print the categories that made the Azure content filter reject a request, if it did."""
+    if error.code != "content_filter" or not isinstance(error.body, dict):
+        return
+    content_filter_result = error.body.get("innererror", {}).get("content_filter_result", {})
+    for category, details in content_filter_result.items():
+        print(f"{category}:\n filtered={details.get('filtered')}\n severity={details.get('severity')}")
+
+
+# Messages of the image summary prompts, the same for every image: built once, only the
+# HumanMessage carrying the image is built per call
+_SUMMARY_SYSTEM_MESSAGE = SystemMessage(content="""You are a bot that is good at analyzing images. Please act as an Expert and help in analysing and describing the tables, flowcharts, graphs, plots etc. 
+                          Please extract all the details given in the image.\n Use only these images.""")
+_SUMMARY_INSTRUCTIONS = {
+    "type": "text",
+    "text": """Execute the following tasks step by step and extract information.
+                    1. Capture the maximum possible details (all the details) given in the image in a best possible way.
+                    2. Wherever text is present, extract ALL the text as it is without changing/modifying the text. 
+                    In Image, if plots, diagrams, tables present please provide description and capture as much as details possible (note: some images has image caption). Please elaborate captions and other additional details also.
+                    3. Please examine the each step of flowcharts and process flow carefully and describe them step by step in detail.
+                    Please capture all the possible details.
+                    4. Please also capture facts and numeric information given in plots and graphs such barplot, histogram, lineplot etc
+                    5. Please also capture exact text given on different objects or products and also capture details of given entities.
+                    6. Please also capture information such as references, information given on header, footers, filenames,
+                    page, question, answers, multiple choice questions, signatures, signatory names and other additional information etc.
+                    7. Carefully, capture the exact text and details given on different tables and extract it in markdown structured table format.
+                    Please do it extremely carefully and in detail.
+
+                    # Provide all the extracted details in the best way possible in Markdown format (headings, Subheadings, text, points etc).
+                    # Please avois writing extra text such as Extracted Information from the Image. You can directly start from content. 
+                    
+                    Take a deep breath and let's do it step by step. It is important for my career!""",
+}
+_NEW_SUMMARY_SYSTEM_MESSAGE = SystemMessage(content="""You are an expert image analysis bot. You are a bot that is good at analyzing images. Please act as an Expert and help in analysing and describing the tables, flowcharts, graphs, plots etc.
+            Please extract all the details given in the image, maintaining original formatting, structure, and layout for the text.
+
+            **CRITICAL RULES:**
+            - Extract text EXACTLY as it appears in the image - preserve original formatting, line breaks, and structure.
+            - Start directly with the actual content from the image.
+            - Maintain the EXACT layout and format from the image for text content.
+
+            **Tasks:**
+            1. Capture the maximum possible details (all details) given in the image in the best possible way.
+                          
+            2. Extract ALL text as it is, without changing or modifying the text, and preserve original formatting and structure.
+                          
+            3. For all non-textual elements—such as flowcharts, diagrams, footers, pages, logos, visual objects, and any other graphical or layout features—provide clear, descriptive, and detailed explanations, covering every minute piece of information present.  
+            - Carefully describe each component, symbol, shape, icon, color, positioning, and any visible annotation or mark.
+            - If the image contains captions for these elements, elaborate on those captions and include all additional details.
+                          
+            4. For flowcharts and process flows: examine each step carefully and describe them step by step in detail.
+                          
+            5. Capture all facts and numeric information given in plots and graphs (such as bar plots, histograms, line plots, etc.).
+                          
+            6. Extract exact text given on different objects, products, and entities. Capture details of all given entities.
+                          
+            7. Capture and extract details such as references, headers, footers, filenames, page numbers, questions, answers, multiple choice questions, signatures, signatory names, and any other additional information present.
+                - For elements such as dates, signatures, names, or other indicators, you may add a brief clarifying note in parentheses or as a footnote to indicate what the element is (e.g., "Date: 2023-05-01 (document creation date)", "Signature: John Doe (signatory)"), but **do NOT change or paraphrase the actual text content**.
+                - If additional details about a signature, date, or other indicator are present (such as title, position, or context), include those descriptively.
+          
+            8. For tables: extract the exact text and details given on different tables and present them in Markdown structured table format, preserving the exact structure. Do this with extreme care and detail.
 
+            **Output Format:**
+            - Use Markdown formatting (headings, subheadings, text, points, code blocks where appropriate).
+            - For text content: maintain the EXACT layout and format from the image.
+            - For visual and graphical elements (charts, diagrams, flowcharts, logos, etc.): provide clear, comprehensive, and detailed descriptions, including any captions and additional details.
+            - For tables: use Markdown table format, preserving the original structure and all details.
+
+            Begin extraction immediately without preamble."""
+)
+
+
+# Seconds between two checks of the status of a batch job
+BATCH_POLL_INTERVAL = 60
+# Chat Completions role of each langchain message type
+_BATCH_ROLES = {"system": "system", "human": "user"}
 
-Image.MAX_IMAGE_PIXELS = None
 
 class etl_components:
     """Processes images."""
@@ -36,76 +194,31 @@ class etl_components:
         self.llm_multimodal = llm_multimodal
 
 
-    def pdf_to_base64_utf8_images(self,blob_pdf_path=False):
-        # Open the PDF file
-        pdf_document = fitz.open(self.file)
+    def iter_pdf_base64_images(self):
+        """Yield the name and the base64 JPEG of each page, in page order, as soon as the page is rendered."""
+        # Only the page count is needed here, the pages are rendered by the workers
+        with fitz.open(self.file) as pdf_document:
+            page_count = len(pdf_document)
 
-        # List to store base64 encoded images
-        base64_images = []
-        raw_images = []
-        images_path = []
-        images_path_blob = []
-        names=[]
+        stem = Path(self.file).stem
 
-        # Ensure the output folder exists
-        temp_dir=tempfile.mkdtemp()+"/"
+        # Rendering is CPU bound, the pages go to the shared worker processes; map keeps the page order
+        pool = _get_render_pool()
+        jpeg_pages = pool.map(partial(_render_page, self.file, dpi=PDF_RENDER_DPI), range(page_count), chunksize=2)
 
         try:
             # Iterate over each page
-            for page_num in range(len(pdf_document)):
-                # Get the page
-                page = pdf_document.load_page(page_num)
-
-                # Render the page to an image
-                pix = page.get_pixmap(dpi=300)
-
-                # Convert the image to PIL Image format
-                img = Image.open(io.BytesIO(pix.tobytes("png")))
-                raw_images.append(img)
-
-                # Save the image to a BytesIO object in JPEG format
-                img_byte_arr = io.BytesIO()
-                img.save(img_byte_arr, format='JPEG')
-
-                ##### For image source - blob storage
-                if blob_pdf_path != False:
-                    blob_image_full_path = os.path.join(os.path.dirname(blob_pdf_path),f"{Path(self.file).stem}_{page_num + 1}.jpeg")
-                    images_path_blob.append(blob_image_full_path)
-
-
-
-                ##### local images path
-                images_location_locally = os.path.join(temp_dir, f"{Path(self.file).stem}_{page_num + 1}.jpeg")
-                images_path.append(images_location_locally)
-                names.append(Path(images_location_locally).stem)
-                #####
-
-
-                # Get the byte data of the image
-                img_byte_arr = img_byte_arr.getvalue()
-
-                # Encode the byte data to base64
-                img_base64 = base64.b64encode(img_byte_arr)
-
-                # Encode the base64 bytes to UTF-8 string
-                img_base64_utf8 = img_base64.decode('utf-8')
+            for page_num, img_byte_arr in enumerate(jpeg_pages):
+                # Encode the JPEG bytes to a base64 string, base64 is pure ASCII
+                yield f"{stem}_{page_num + 1}", base64.b64encode(img_byte_arr).decode('ascii')
+        except BrokenProcessPool:
+            _discard_render_pool(pool)
+            raise
 
-                # Append the UTF-8 string to the list
-                base64_images.append(img_base64_utf8)
-                imagestring_n_name = dict(zip(names,base64_images))
 
-                del img_byte_arr
-                del img_base64_utf8
-                del img
-                del img_base64
-                del page
-
-                gc.collect()
-
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-
-        return (imagestring_n_name)
+    def pdf_to_base64_utf8_images(self):
+        # base64 encoded images, by image name
+        return dict(self.iter_pdf_base64_images())
 
 
     def summarize_image(self,encoded_image: str) -> str:
@@ -119,62 +232,14 @@ class etl_components:
             str: Summarized content of the image.
         """
         prompt = [
-            SystemMessage(content="""You are a bot that is good at analyzing images. Please act as an Expert and help in analysing and describing the tables, flowcharts, graphs, plots etc. 
-                          Please extract all the details given in the image.\n Use only these images."""),
+            _SUMMARY_SYSTEM_MESSAGE,
             HumanMessage(content=[
-                {
-                    "type": "text",
-                    "text": """Execute the following tasks step by step and extract information.
-                    1. Capture the maximum possible details (all the details) given in the image in a best possible way.
-                    2. Wherever text is present, extract ALL the text as it is without changing/modifying the text. 
-                    In Image, if plots, diagrams, tables present please provide description and capture as much as details possible (note: some images has image caption). Please elaborate captions and other additional details also.
-                    3. Please examine the each step of flowcharts and process flow carefully and describe them step by step in detail.
-                    Please capture all the possible details.
-                    4. Please also capture facts and numeric information given in plots and graphs such barplot, histogram, lineplot etc
-                    5. Please also capture exact text given on different objects or products and also capture details of given entities.
-                    6. Please also capture information such as references, information given on header, footers, filenames,
-                    page, question, answers, multiple choice questions, signatures, signatory names and other additional information etc.
-                    7. Carefully, capture the exact text and details given on different tables and extract it in markdown structured table format.
-                    Please do it extremely carefully and in detail.
-
-                    # Provide all the extracted details in the best way possible in Markdown format (headings, Subheadings, text, points etc).
-                    # Please avois writing extra text such as Extracted Information from the Image. You can directly start from content. 
-                    
-                    Take a deep breath and let's do it step by step. It is important for my career!"""
-
-                },
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{encoded_image}"
-                    },
-                },
-            ])
+                _SUMMARY_INSTRUCTIONS,
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{encoded_image}"}},
+            ]),
         ]
 
-
-        retries = 0
-        max_retries = 10
-        while retries < max_retries:
-
-            try:
-                response = self.llm_multimodal.invoke(prompt)
-                return response.content
-            
-            except openai.error.InvalidRequestError as e:
-                if e.error.code == "content_filter" and e.error.innererror:
-                    content_filter_result = e.error.innererror.content_filter_result
-                    # print the formatted JSON
-                    print(content_filter_result)
-                    # or access the individual categories and details
-                    for category, details in content_filter_result.items():
-                        print(f"{category}:\n filtered={details['filtered']}\n severity={details['severity']}")
-
-            except Exception as e:
-                if "limit" in str(e).lower():
-                    print(f"Rate limit error encountered. Retrying in 30 seconds... (Attempt {retries+1}/{max_retries})")
-                    retries += 1
-                    time.sleep(6)
+        return self._invoke_with_retry(prompt)
 
         
     def new_summarize_image(self,encoded_image: str) -> str:
@@ -187,78 +252,136 @@ class etl_components:
         Returns:
             str: Summarized content of the image.
         """
-        prompt = [
-            SystemMessage(content="""You are an expert image analysis bot. You are a bot that is good at analyzing images. Please act as an Expert and help in analysing and describing the tables, flowcharts, graphs, plots etc.
-            Please extract all the details given in the image, maintaining original formatting, structure, and layout for the text.
+        prompt = self._new_summary_prompt(encoded_image)
 
-            **CRITICAL RULES:**
-            - Extract text EXACTLY as it appears in the image - preserve original formatting, line breaks, and structure.
-            - Start directly with the actual content from the image.
-            - Maintain the EXACT layout and format from the image for text content.
+        return self._invoke_with_retry(prompt)
 
-            **Tasks:**
-            1. Capture the maximum possible details (all details) given in the image in the best possible way.
-                          
-            2. Extract ALL text as it is, without changing or modifying the text, and preserve original formatting and structure.
-                          
-            3. For all non-textual elements—such as flowcharts, diagrams, footers, pages, logos, visual objects, and any other graphical or layout features—provide clear, descriptive, and detailed explanations, covering every minute piece of information present.  
-            - Carefully describe each component, symbol, shape, icon, color, positioning, and any visible annotation or mark.
-            - If the image contains captions for these elements, elaborate on those captions and include all additional details.
-                          
-            4. For flowcharts and process flows: examine each step carefully and describe them step by step in detail.
-                          
-            5. Capture all facts and numeric information given in plots and graphs (such as bar plots, histograms, line plots, etc.).
-                          
-            6. Extract exact text given on different objects, products, and entities. Capture details of all given entities.
-                          
-            7. Capture and extract details such as references, headers, footers, filenames, page numbers, questions, answers, multiple choice questions, signatures, signatory names, and any other additional information present.
-                - For elements such as dates, signatures, names, or other indicators, you may add a brief clarifying note in parentheses or as a footnote to indicate what the element is (e.g., "Date: 2023-05-01 (document creation date)", "Signature: John Doe (signatory)"), but **do NOT change or paraphrase the actual text content**.
-                - If additional details about a signature, date, or other indicator are present (such as title, position, or context), include those descriptively.
-          
-            8. For tables: extract the exact text and details given on different tables and present them in Markdown structured table format, preserving the exact structure. Do this with extreme care and detail.
 
-            **Output Format:**
-            - Use Markdown formatting (headings, subheadings, text, points, code blocks where appropriate).
-            - For text content: maintain the EXACT layout and format from the image.
-            - For visual and graphical elements (charts, diagrams, flowcharts, logos, etc.): provide clear, comprehensive, and detailed descriptions, including any captions and additional details.
-            - For tables: use Markdown table format, preserving the original structure and all details.
+    async def anew_summarize_image(self, encoded_image: str) -> str:
+        """
+        Same as new_summarize_image, awaiting the LLM so that many pages can be in flight at once.
 
-            Begin extraction immediately without preamble."""
-            ),
-            HumanMessage(content=[
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{encoded_image}"
-                    },
-                },
-            ])
-        ]
+        Args:
+            encoded_image (str): Base64-encoded image string.
 
+        Returns:
+            str: Summarized content of the image.
+        """
+        prompt = self._new_summary_prompt(encoded_image)
+        return await self._ainvoke_with_retry(prompt)
 
-        retries = 0
-        max_retries = 10
-        while retries < max_retries:
 
+    def _invoke_with_retry(self, prompt) -> str:
+        """
+        Invoke the LLM, retrying the rate limits, connection errors, timeouts and server errors.
+
+        Raises:
+            MaxRetriesError: If the LLM still fails after LLM_MAX_RETRIES attempts.
+        """
+        token_bucket = get_llm_token_bucket()
+        for attempt in range(LLM_MAX_RETRIES):
+            if token_bucket is not None:
+                token_bucket.acquire(self._estimate_tokens(prompt))
             try:
-                response = self.llm_multimodal.invoke(prompt)
-                return response.content
-            
-            except openai.error.InvalidRequestError as e:
-                if e.error.code == "content_filter" and e.error.innererror:
-                    content_filter_result = e.error.innererror.content_filter_result
-                    # print the formatted JSON
-                    print(content_filter_result)
-                    # or access the individual categories and details
-                    for category, details in content_filter_result.items():
-                        print(f"{category}:\n filtered={details['filtered']}\n severity={details['severity']}")
+                return self.llm_multimodal.invoke(prompt).content
+
+            except _RETRYABLE_ERRORS as e:
+                if attempt + 1 == LLM_MAX_RETRIES:
+                    raise MaxRetriesError("Max retries reached due to LLM errors.") from e
+                wait_time = _retry_wait(e, attempt)
+                print(f"{type(e).__name__} encountered. Retrying in {wait_time:.1f} seconds... (Attempt {attempt+1}/{LLM_MAX_RETRIES})")
+                time.sleep(wait_time)
+
+            except openai.BadRequestError as e:
+                _report_content_filter(e)
+                raise
+
+
+    async def _ainvoke_with_retry(self, prompt) -> str:
+        """Same as _invoke_with_retry, awaiting the LLM and the waits."""
+        token_bucket = get_llm_token_bucket()
+        for attempt in range(LLM_MAX_RETRIES):
+            if token_bucket is not None:
+                await token_bucket.aacquire(self._estimate_tokens(prompt))
+            try:
+                return (await self.llm_multimodal.ainvoke(prompt)).content
 
-            except Exception as e:
-                if "limit" in str(e).lower():
-                    print(f"Rate limit error encountered. Retrying in 30 seconds... (Attempt {retries+1}/{max_retries})")
-                    retries += 1
-                    time.sleep(6)
+            except _RETRYABLE_ERRORS as e:
+                if attempt + 1 == LLM_MAX_RETRIES:
+                    raise MaxRetriesError("Max retries reached due to LLM errors.") from e
+                wait_time = _retry_wait(e, attempt)
+                print(f"{type(e).__name__} encountered. Retrying in {wait_time:.1f} seconds... (Attempt {attempt+1}/{LLM_MAX_RETRIES})")
+                await asyncio.sleep(wait_time)
+
+            except openai.BadRequestError as e:
+                _report_content_filter(e)
+                raise
+
+
+    def batch_summarize_images(self, imagestring_n_name: dict, poll_interval=BATCH_POLL_INTERVAL) -> dict:
+        """
+        Summarize the images through the Batch API, at about half the cost of direct calls.
+
+        The new_summarize_image prompts of all the images go as one job on the batch deployment,
+        blocking until it is done: up to the BATCH_COMPLETION_WINDOW of batch_api.
+
+        Args:
+            imagestring_n_name (dict): Base64-encoded images, by image name.
+            poll_interval (int): Seconds between two checks of the job status.
+
+        Returns:
+            dict: Summaries by image name. The images the job failed on are missing from it.
 
+        Raises:
+            BatchError: If the job failed, expired or was cancelled.
+        """
+        client = self.llm_multimodal.root_client
+        batch_id = submit_batch(
+            client,
+            azure_openai_completion_settings.batch_deployment or azure_openai_completion_settings.deployment,
+            {
+                name: {
+                    "temperature": self.llm_multimodal.temperature,
+                    "messages": [
+                        {"role": _BATCH_ROLES[message.type], "content": message.content}
+                        for message in self._new_summary_prompt(encoded_image)
+                    ],
+                }
+                for name, encoded_image in imagestring_n_name.items()
+            },
+            file_name="summaries.jsonl",
+        )
+        return wait_for_batch(client, batch_id, poll_interval)
+
+
+    def _estimate_tokens(self, prompt) -> int:
+        """
+        Estimate the tokens an LLM call counts against the tokens-per-minute limit.
+
+        About 4 characters per text token, IMAGE_TOKEN_ESTIMATE per image and
+        the output budget of the LLM, LLM_OUTPUT_TOKEN_ESTIMATE when it has none.
+        """
+        tokens = getattr(self.llm_multimodal, "max_tokens", None) or LLM_OUTPUT_TOKEN_ESTIMATE
+        for message in prompt:
+            if isinstance(message.content, str):
+                tokens += len(message.content) // 4
+                continue
+            for part in message.content:
+                if part["type"] == "image_url":
+                    tokens += IMAGE_TOKEN_ESTIMATE
+                else:
+                    tokens += len(part["text"]) // 4
+        return tokens
+
+
+    def _new_summary_prompt(self, encoded_image: str) -> list:
+        """Build the messages of new_summarize_image for one page image."""
+        return [
+            _NEW_SUMMARY_SYSTEM_MESSAGE,
+            HumanMessage(content=[
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{encoded_image}"}},
+            ]),
+        ]
 
 
     def generate_document_summary_stuff(self, image_summary_list):
@@ -321,10 +444,10 @@ class etl_components:
 
         chunk_n = copy.deepcopy(splitted_text)
         doc_summary = concise_doc_summary
+        # only the chunk content changes from one chunk to the next, format the tail once
+        summary_tail = f'\n\n---\n\n### **Filename : {filename}** \n### Consolidated summary / high-level overview of whole document given below: ##############\n\n{str(doc_summary)}'
         for d in range(len(chunk_n)):
-            entire_summary = f'{str(chunk_n[d].page_content)}\n\n---\n\n### **Filename : {filename}** \n### Consolidated summary / high-level overview of whole document given below: ##############\n\n{str(doc_summary)}'
-
-            chunk_n[d].page_content = entire_summary
+            chunk_n[d].page_content = str(chunk_n[d].page_content) + summary_tail
 
         return chunk_n
     
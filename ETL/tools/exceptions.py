@@ -17,6 +17,10 @@ class DBError(Exception):
     """Exception raised when miss ineteract with the DB."""
 
 
+class BatchError(Exception):
+    """Exception raised when an Azure OpenAI batch job does not complete."""
+
+
 #### Refinement 
 class ProcessingError(Exception):
     """Base exception for processing errors."""
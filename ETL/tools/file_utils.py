@@ -0,0 +1,23 @@
+"""Write files safely for concurrent readers."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+
+def write_atomic(file: Path, data: str | bytes) -> None:
+    """Write data to file through a temporary file and a rename, creating its folder if needed.
+
+    A concurrent reader sees either the previous file or the complete new one, never a
+    partial write. The temporary file is named after the process and the thread, so two
+    writers of the same file don't write into each other's. str data is written as UTF-8.
+    """
+    file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    if isinstance(data, str):
+        tmp_file.write_text(data, encoding="utf-8")
+    else:
+        tmp_file.write_bytes(data)
+    os.replace(tmp_file, file)
@@ -22,4 +22,16 @@ OLD_METADATA_FILE = DOWNLOAD_DIR / "spo_old_files.json"
 # new files to be processed
 NEW_FILES = DOWNLOAD_DIR / "new_files.json"
 UPDATED_FILES = DOWNLOAD_DIR / "changed_files.json"
-DELETED_FILES = DOWNLOAD_DIR / "deleted_files.json"
\ No newline at end of file
+DELETED_FILES = DOWNLOAD_DIR / "deleted_files.json"
+
+# document summaries already generated, by content hash
+SUMMARY_CACHE_DIR = DOWNLOAD_DIR / "summary_cache"
+
+# ETL configurations last fetched from the App Registry, by app_id
+REGISTRY_CACHE_DIR = DOWNLOAD_DIR / "registry_cache"
+
+# Markdown of the ASPX pages already converted, by content hash
+ASPX_CACHE_DIR = DOWNLOAD_DIR / "aspx_cache"
+
+# files processed by a run not completed yet, one JSON line each
+ETL_CHECKPOINT_FILE = DOWNLOAD_DIR / "etl_checkpoint.jsonl"
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from langchain_openai import AzureChatOpenAI
 
 
+import asyncio
 import base64
 import logging
 import time
@@ -15,10 +16,28 @@ from pathlib import Path
 
 from langchain.schema.messages import HumanMessage, SystemMessage
 
+from ETL.tools.async_loop import run_coroutine
 from ETL.tools.exceptions import InterpretationError, MaxRetriesError
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of images summarized by the LLM at the same time
+MAX_CONCURRENT_IMAGES = 8
+
+# The prompt is the same for every image, only the image itself is added per call
+_SYSTEM_MESSAGE = SystemMessage(
+    content="""You are a bot that is good at analyzing images, specifically
+            screenshots of operations to be performed from the users in order to
+            fulfill operations related to BIS (Bank for International Settlements)
+            Meeting Services office, like: booking rooms, organizing events, etc.
+            """,
+)
+_EXAMPLE_INSTRUCTIONS = """Describe this screenshot with one single paragraph.
+                The information shown (dates, etc.) are actually examples,
+                so state this in the answer in an appropriate way.
+                """
+_INSTRUCTIONS = """Describe this screenshot with one single paragraph."""
+
 
 def read_n_convert_image(image_path: str) -> str:
     """Read the image."""
@@ -26,34 +45,13 @@ def read_n_convert_image(image_path: str) -> str:
         return base64.b64encode(image_file.read()).decode("utf-8")
 
 
-def throttle_summarize_image(
-    encoded_image: str,
-    llm_multimodal: AzureChatOpenAI,
-    max_retries: int = 5,
-    backoff_factor: int = 2,
-    *,
-    is_example: bool = False,
-) -> str:
-    """Summarize the content of the provided image using an LLM."""
-    if is_example:
-        h_m = """Describe this screenshot with one single paragraph.
-                The information shown (dates, etc.) are actually examples,
-                so state this in the answer in an appropriate way.
-                """
-    else:
-        h_m = """Describe this screenshot with one single paragraph."""
-
-    prompt = [
-        SystemMessage(
-            content="""You are a bot that is good at analyzing images, specifically
-            screenshots of operations to be performed from the users in order to
-            fulfill operations related to BIS (Bank for International Settlements)
-            Meeting Services office, like: booking rooms, organizing events, etc.
-            """,
-        ),
+def _summary_prompt(encoded_image: str, *, is_example: bool) -> list:
+    """Build the messages asking the LLM to describe one image."""
+    return [
+        _SYSTEM_MESSAGE,
         HumanMessage(
             content=[
-                {"type": "text", "text": h_m},
+                {"type": "text", "text": _EXAMPLE_INSTRUCTIONS if is_example else _INSTRUCTIONS},
                 {
                     "type": "image_url",
                     "image_url": {"url": f"data:image/jpeg;base64,{encoded_image}"},
@@ -61,6 +59,23 @@ def throttle_summarize_image(
             ],
         ),
     ]
+
+
+def _is_rate_limit(e: Exception) -> bool:
+    """Tell whether an LLM call failed because of the rate limit."""
+    return "rate limit" in str(e).lower() or "ratelimit" in str(e).lower()
+
+
+def throttle_summarize_image(
+    encoded_image: str,
+    llm_multimodal: AzureChatOpenAI,
+    max_retries: int = 5,
+    backoff_factor: int = 2,
+    *,
+    is_example: bool = False,
+) -> str:
+    """Summarize the content of the provided image using an LLM."""
+    prompt = _summary_prompt(encoded_image, is_example=is_example)
     wait_time = 1  # Initial wait time in seconds
 
     retries = 0
@@ -69,9 +84,7 @@ def throttle_summarize_image(
             response = llm_multimodal.invoke(prompt)
             return response.content  # noqa: TRY300
         except Exception as e:  # noqa: PERF203
-            if (
-                "rate limit" in str(e).lower() or "ratelimit" in str(e).lower()
-            ):  # Check if it's a rate limit error
+            if _is_rate_limit(e):  # Check if it's a rate limit error
                 retries += 1
                 if retries > max_retries:
                     msg = f"Rate limit exceeded after {max_retries} retries."
@@ -87,26 +100,68 @@ def throttle_summarize_image(
     raise MaxRetriesError(msg)
 
 
+async def athrottle_summarize_image(
+    encoded_image: str,
+    llm_multimodal: AzureChatOpenAI,
+    max_retries: int = 5,
+    backoff_factor: int = 2,
+    *,
+    is_example: bool = False,
+) -> str:
+    """Summarize the content of the provided image using an LLM, without blocking the event loop."""
+    prompt = _summary_prompt(encoded_image, is_example=is_example)
+    wait_time = 1  # Initial wait time in seconds
+
+    for _ in range(max_retries):
+        try:
+            response = await llm_multimodal.ainvoke(prompt)
+            return response.content  # noqa: TRY300
+        except Exception as e:  # noqa: PERF203
+            if not _is_rate_limit(e):
+                raise
+            msg = f"Rate limit reached. Retrying in {wait_time} seconds..."
+            logger.info(msg)
+            await asyncio.sleep(wait_time)
+            wait_time *= backoff_factor  # Exponential backoff
+
+    msg = "Max retries reached due to rate limit errors."
+    raise MaxRetriesError(msg)
+
+
+async def _summarize_images(
+    inputs_images: list,
+    llm_multimodal: AzureChatOpenAI,
+    *,
+    is_example: bool,
+) -> list[str]:
+    """Summarize the images concurrently, at most MAX_CONCURRENT_IMAGES at a time."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGES)
+
+    async def summarize(img: str) -> str:
+        async with semaphore:
+            return await athrottle_summarize_image(
+                img,
+                llm_multimodal=llm_multimodal,
+                is_example=is_example,
+            )
+
+    return await asyncio.gather(*(summarize(img) for img in inputs_images))
+
+
 def process_images(
     inputs_images: list,
     llm_multimodal: AzureChatOpenAI,
     *,
     is_example: bool = True,
 ) -> list[str]:
-    """Summarizes a list of images using the provided image processor."""
-    summarize_images_list = []
-
-    batch_summarize_images_list = [
-        throttle_summarize_image(
-            img,
-            llm_multimodal=llm_multimodal,
-            is_example=is_example,
-        )
-        for img in inputs_images
-    ]
-    summarize_images_list.extend(batch_summarize_images_list)
+    """Summarizes a list of images using the provided image processor.
 
-    return summarize_images_list
+    The LLM calls overlap, so the images cost about one round-trip per
+    MAX_CONCURRENT_IMAGES instead of one each. The summaries keep the order of the images.
+    """
+    return run_coroutine(
+        _summarize_images(inputs_images, llm_multimodal=llm_multimodal, is_example=is_example),
+    )
 
 
 def resume_image(
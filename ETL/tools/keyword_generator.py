@@ -2,32 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
     from langchain_openai import AzureChatOpenAI
+    from openai import AzureOpenAI
 from pydantic import BaseModel, Field, field_validator
 
+from ETL.tools.batch_api import submit_batch, wait_for_batch
 from ETL.tools.exceptions import MaxRetriesError
 
 logger = logging.getLogger(__name__)
 
+# System message sent with every keyword request
+KEYWORD_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are a keyword extraction expert.
+                Always respond with exactly 4-6 keywords in
+                the specified JSON format.""",
+}
+
 
 def invoke_with_retry(  # noqa: RET503
-    llm: AzureChatOpenAI,
+    structured_llm: Runnable,
     messages: list[dict],
-    schema: type[BaseModel],
     max_retries: int = 5,
     backoff_factor: int = 2,
 ) -> dict:
     """Invoke the LLM with retry logic for rate limit errors.
 
     Args:
-        llm: The LLM instance.
+        structured_llm: The LLM bound to the schema of its structured output.
         messages: The input messages for the LLM.
-        schema: Pydantic schema for structured output.
         max_retries: Maximum number of retries.
         backoff_factor: Factor by which the wait time increases after each retry.
 
@@ -43,11 +53,6 @@ def invoke_with_retry(  # noqa: RET503
 
     while retries <= max_retries:
         try:
-            # Get structured output using Pydantic model
-            structured_llm = llm.with_structured_output(
-                schema=schema,
-                method="json_mode",
-            )
             return structured_llm.invoke(messages)
         except Exception as e:  # noqa: PERF203
             if (
@@ -65,6 +70,47 @@ def invoke_with_retry(  # noqa: RET503
                 raise  # Re-raise other exceptions that aren't rate limit errors
 
 
+async def ainvoke_with_retry(  # noqa: RET503
+    structured_llm: Runnable,
+    messages: list[dict],
+    max_retries: int = 5,
+    backoff_factor: int = 2,
+) -> dict:
+    """Async version of invoke_with_retry, waiting without blocking the event loop.
+
+    Args:
+        structured_llm: The LLM bound to the schema of its structured output.
+        messages: The input messages for the LLM.
+        max_retries: Maximum number of retries.
+        backoff_factor: Factor by which the wait time increases after each retry.
+
+    Returns:
+        The response from the LLM.
+
+    Raises:
+        MaxRetriesError: If the maximum number of retries is exceeded.
+
+    """
+    retries = 0
+    wait_time = 4  # Initial wait time in seconds
+
+    while retries <= max_retries:
+        try:
+            return await structured_llm.ainvoke(messages)
+        except Exception as e:  # noqa: PERF203
+            if "rate limit" in str(e).lower() or "ratelimit" in str(e).lower():
+                retries += 1
+                if retries > max_retries:
+                    msg = f"Rate limit exceeded after {max_retries} retries."
+                    raise MaxRetriesError(msg) from e
+                msg = f"Rate limit error. Retrying in {wait_time} seconds..."
+                logger.info(msg)
+                await asyncio.sleep(wait_time)
+                wait_time *= backoff_factor  # Exponential backoff
+            else:
+                raise
+
+
 class KeywordResponse(BaseModel):
     """Response model."""
 
@@ -100,6 +146,11 @@ class KeywordGenerator:
     def __init__(self, llm: AzureChatOpenAI) -> None:
         """Init the class."""
         self.llm = llm
+        # Bind the output schema once, rather than on every call
+        self.structured_llm = llm.with_structured_output(
+            schema=KeywordResponse,
+            method="json_mode",
+        )
         self.prompt_template = """
         You are an expert in identifying keywords in text.
 
@@ -122,29 +173,79 @@ class KeywordGenerator:
         - Keywords must not be empty or only whitespace
         """
 
-    def generate_keywords(self, text: str) -> list[str]:
-        """Generate keywords for the given text."""
+    def _build_messages(self, text: str) -> list[dict]:
+        """Build the LLM messages asking for the keywords of the text."""
         prompt = self.prompt_template.format(text=text)
 
-        # Create message for the LLM
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a keyword extraction expert.
-                Always respond with exactly 4-6 keywords in
-                the specified JSON format.""",
-            },
-            {"role": "user", "content": prompt},
-        ]
+        return [KEYWORD_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
 
+    def generate_keywords(self, text: str) -> list[str]:
+        """Generate keywords for the given text."""
         # Get structured output using Pydantic model
         response = invoke_with_retry(
-            llm=self.llm,
-            messages=messages,
-            schema=KeywordResponse,
+            structured_llm=self.structured_llm,
+            messages=self._build_messages(text),
         )
 
         # Validate the response using Pydantic
         structured_response = KeywordResponse.model_validate(response)
 
         return structured_response.keywords
+
+    async def agenerate_keywords(self, text: str) -> list[str]:
+        """Generate keywords for the given text, asynchronously."""
+        response = await ainvoke_with_retry(
+            structured_llm=self.structured_llm,
+            messages=self._build_messages(text),
+        )
+
+        structured_response = KeywordResponse.model_validate(response)
+
+        return structured_response.keywords
+
+    def generate_keywords_batch(
+        self,
+        texts: dict[str, str],
+        client: AzureOpenAI,
+        deployment: str,
+        poll_interval: float = 60,
+    ) -> dict[str, list[str]]:
+        """Generate keywords for many texts with a single Azure OpenAI Batch API job.
+
+        Cheaper than real-time calls but with up to 24h turnaround, so only for offline runs.
+
+        Args:
+            texts: Texts to extract keywords from, by request id.
+            client: Azure OpenAI client.
+            deployment: Global batch deployment to run the requests on.
+            poll_interval: Seconds between two checks of the batch status.
+
+        Returns:
+            The keywords by request id; empty for the requests that failed.
+
+        Raises:
+            BatchError: If the batch job does not complete.
+
+        """
+        batch_id = submit_batch(
+            client,
+            deployment,
+            {
+                custom_id: {
+                    "messages": self._build_messages(text),
+                    "response_format": {"type": "json_object"},
+                    "temperature": 0.0,
+                }
+                for custom_id, text in texts.items()
+            },
+            file_name="keywords.jsonl",
+        )
+        contents = wait_for_batch(client, batch_id, poll_interval)
+
+        keywords: dict[str, list[str]] = dict.fromkeys(texts, [])
+        for custom_id, content in contents.items():
+            try:
+                keywords[custom_id] = KeywordResponse.model_validate_json(content).keywords
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Keyword batch request {custom_id} failed: {e}")
+        return keywords
@@ -1,24 +1,17 @@
 """Functions to parse PDFs."""
 
+import asyncio
+from typing import IO
+
 from azure.ai.documentintelligence import DocumentIntelligenceClient
-from azure.ai.documentintelligence.models import AnalyzeDocumentRequest, AnalyzeResult, AnalyzeOutputOption
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient as AsyncDocumentIntelligenceClient
+from azure.ai.documentintelligence.models import AnalyzeResult, AnalyzeOutputOption
 
 from ETL.document_processor.base.models import RAGEntry, RAGMetadata
 
 
-def parse_pdf_file_with_document_intelligence(
-    client: DocumentIntelligenceClient,
-    bytes_source: bytes,
-) -> AnalyzeResult:
-    """As the title."""
-    poller = client.begin_analyze_document(
-        model_id="prebuilt-layout",
-        body=AnalyzeDocumentRequest(bytes_source=bytes_source),
-        output_content_format="markdown", 
-        output=[AnalyzeOutputOption.FIGURES]
-    )
-    result: AnalyzeResult = poller.result()
-
+def _summarize_analysis(result: AnalyzeResult) -> dict:
+    """Wrap the analysis result with the count and location of its figures."""
     figures = result.figures or []
     total_graphics_count = len(figures)
 
@@ -40,6 +33,43 @@ def parse_pdf_file_with_document_intelligence(
     return {'result':result, 'total_graphics_count': total_graphics_count, 'images_coordinates': images_coordinates}
 
 
+def parse_pdf_file_with_document_intelligence(
+    client: DocumentIntelligenceClient,
+    document: IO[bytes],
+) -> AnalyzeResult:
+    """As the title, streaming the open document as the raw request body."""
+    poller = client.begin_analyze_document(
+        model_id="prebuilt-layout",
+        body=document,
+        content_type="application/octet-stream",
+        output_content_format="markdown",
+        output=[AnalyzeOutputOption.FIGURES]
+    )
+    result: AnalyzeResult = poller.result()
+
+    return _summarize_analysis(result)
+
+
+async def aparse_pdf_file_with_document_intelligence(
+    client: AsyncDocumentIntelligenceClient,
+    document: bytes,
+) -> AnalyzeResult:
+    """As the title, with the async client so the poller waits don't block a thread.
+
+    The document is sent as the raw request body, as in the sync version.
+    """
+    poller = await client.begin_analyze_document(
+        model_id="prebuilt-layout",
+        body=document,
+        content_type="application/octet-stream",
+        output_content_format="markdown",
+        output=[AnalyzeOutputOption.FIGURES]
+    )
+    result: AnalyzeResult = await poller.result()
+
+    return _summarize_analysis(result)
+
+
 def create_header_page_mapping(paragraphs: list) -> dict:
     """Create a mapping of header content to page numbers for section headings."""
     header_pages = {}
@@ -55,20 +85,10 @@ def create_header_page_mapping(paragraphs: list) -> dict:
     return header_pages
 
 
-def parse_pdf_docs(
-    di_client: DocumentIntelligenceClient,
-    file_metadata: dict,
-) -> tuple[RAGEntry, int]:
-    """Extract info from PDF files."""
+def _build_pdf_entry(result: dict, file_metadata: dict) -> tuple[RAGEntry, int]:
+    """Build the RAGEntry of a PDF from its Document Intelligence analysis."""
     file_path = file_metadata["file_path"]
 
-    pdf_path = file_path.with_suffix(".pdf")
-
-    result = parse_pdf_file_with_document_intelligence(
-        bytes_source=pdf_path.read_bytes(),
-        client=di_client,
-    )
-    
     header_pages = create_header_page_mapping(result['result'].paragraphs)
 
     metadata = RAGMetadata(
@@ -89,6 +109,39 @@ def parse_pdf_docs(
     return msdb_entry, result.get("total_graphics_count", 0)
 
 
+def parse_pdf_docs(
+    di_client: DocumentIntelligenceClient,
+    file_metadata: dict,
+) -> tuple[RAGEntry, int]:
+    """Extract info from PDF files."""
+    pdf_path = file_metadata["file_path"].with_suffix(".pdf")
+
+    with pdf_path.open("rb") as document:
+        result = parse_pdf_file_with_document_intelligence(
+            document=document,
+            client=di_client,
+        )
+
+    return _build_pdf_entry(result, file_metadata)
+
+
+async def aparse_pdf_docs(
+    di_client: AsyncDocumentIntelligenceClient,
+    file_metadata: dict,
+) -> tuple[RAGEntry, int]:
+    """Extract info from PDF files, with the async Document Intelligence client."""
+    pdf_path = file_metadata["file_path"].with_suffix(".pdf")
+
+    # the file read is blocking I/O, keep it off the event loop
+    document = await asyncio.to_thread(pdf_path.read_bytes)
+    result = await aparse_pdf_file_with_document_intelligence(
+        document=document,
+        client=di_client,
+    )
+
+    return _build_pdf_entry(result, file_metadata)
+
+
 
 def parse_text_or_markdown(file_path, file_metadata: dict) -> RAGEntry:
     """
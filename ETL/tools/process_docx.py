@@ -6,7 +6,7 @@ import base64
 import logging
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from docx import Document
 from langchain_openai import AzureChatOpenAI
@@ -414,10 +414,10 @@ def extract_docx_elements(
     doc: Document,
     llm_multimodal: AzureChatOpenAI,
     output_dir: Path = Path("images"),
-) -> list[str]:
+) -> Iterator[str]:
     """Extract text, tables, and images from a DOCX document.
 
-    Returns a list where:
+    Yields the elements of the body one at a time, where:
         - Text is preserved with formatting (including hyperlinks)
         - Headings are converted to Markdown headers (#, ##, etc.)
         - Tables are represented as markdown
@@ -430,21 +430,16 @@ def extract_docx_elements(
 
     # Start processing from the document body
     body = doc.element.body
-    output = []
     image_counter = [1]  # Use a list to allow modification within nested functions
     for child in body.iterchildren():
-        output.extend(
-            process_element(
-                child,
-                image_counter,
-                doc=doc,
-                output_dir=output_dir,
-                llm_multimodal=llm_multimodal,
-            ),
+        yield from process_element(
+            child,
+            image_counter,
+            doc=doc,
+            output_dir=output_dir,
+            llm_multimodal=llm_multimodal,
         )
 
-    return output
-
 
 def extract_text_images_and_tables(
     doc: Document,
@@ -453,13 +448,18 @@ def extract_text_images_and_tables(
 ) -> str:
     """Extract data from document."""
     paragraphs = extract_docx_elements(doc=doc, llm_multimodal=llm_multimodal)
-
-    full_doc_text = "\n\n".join(paragraphs)
-    if output_txt_file is not None:
-        # Save the extracted content to a .txt file
-        with output_txt_file.open(mode="w", encoding="utf-8") as txt_file:
-            txt_file.write(full_doc_text)
-    return full_doc_text
+    if output_txt_file is None:
+        return "\n\n".join(paragraphs)
+
+    # Save the extracted content to a .txt file as each element is produced
+    parts = []
+    with output_txt_file.open(mode="w", encoding="utf-8") as txt_file:
+        for paragraph in paragraphs:
+            if parts:
+                txt_file.write("\n\n")
+            txt_file.write(paragraph)
+            parts.append(paragraph)
+    return "\n\n".join(parts)
 
 
 def process_docx(
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from langchain_openai import AzureChatOpenAI
 from langgraph.graph import END, StateGraph
 
@@ -49,6 +51,8 @@ class ChunkImprover:
 
         # Build the workflow graph
         self.workflow = self._build_graph()
+        # Same workflow, for chunks whose first evaluation is already in the state
+        self.workflow_from_reconstruction = self._build_graph(entry_point="reconstruct")
 
     # LangGraph node functions
     def _evaluate_chunk(self, state: dict[str, Any]) -> dict[str, Any]:
@@ -229,7 +233,7 @@ class ChunkImprover:
         # Convert back to dict for LangGraph
         return state_model.model_dump()
 
-    def _build_graph(self) -> StateGraph:
+    def _build_graph(self, entry_point: str = "evaluate") -> StateGraph:
         """Build the LangGraph workflow."""
         # Create the graph
         # Note: LangGraph now expects a Dict instead of a Pydantic model
@@ -241,7 +245,7 @@ class ChunkImprover:
         graph.add_node("finish", self._finish)
 
         # Set the entry point
-        graph.set_entry_point("evaluate")
+        graph.set_entry_point(entry_point)
 
         # Add conditional edges
         graph.add_conditional_edges(
@@ -259,6 +263,45 @@ class ChunkImprover:
         # Compile the graph
         return graph.compile()
 
+    @staticmethod
+    def _initial_state(
+        document: str,
+        chunk: str,
+        max_iterations: int | None,
+        quality_threshold: float | None,
+    ) -> ChunkState:
+        """Build the state a chunk enters the workflow with."""
+        return ChunkState(
+            document=document,
+            chunk=chunk,
+            original_chunk=chunk,
+            evaluation=ChunkEvaluation(),
+            improvements=[],
+            chunk_versions=[chunk],
+            iteration=0,
+            max_iterations=max_iterations,
+            quality_threshold=quality_threshold,
+            complete=False,
+            logs=[],
+        )
+
+    @staticmethod
+    def _result(final_state: ChunkState) -> ImprovementResult:
+        """Format the final state of the workflow as an ImprovementResult."""
+        return ImprovementResult(
+            original_chunk=final_state.original_chunk,
+            improved_chunk=final_state.chunk,
+            quality_score=final_state.evaluation.quality_score,
+            is_self_contained=final_state.evaluation.final_judgment.is_self_contained,
+            total_iterations=final_state.iteration,
+            improvement_history=final_state.improvements,
+            chunk_versions=final_state.chunk_versions,
+            quality_improvement=final_state.quality_improvement,
+            critical_issues_resolved=final_state.critical_issues_resolved,
+            final_evaluation=final_state.evaluation,
+            logs=final_state.logs,
+        )
+
     def improve_chunk(
         self,
         document: str,
@@ -283,19 +326,7 @@ class ChunkImprover:
 
         """
         # Initialize the state
-        initial_state = ChunkState(
-            document=document,
-            chunk=chunk,
-            original_chunk=chunk,
-            evaluation=ChunkEvaluation(),
-            improvements=[],
-            chunk_versions=[chunk],
-            iteration=0,
-            max_iterations=max_iterations,
-            quality_threshold=quality_threshold,
-            complete=False,
-            logs=[],
-        )
+        initial_state = self._initial_state(document, chunk, max_iterations, quality_threshold)
 
         # Execute the workflow - convert to dict for LangGraph
         final_state_dict = self.workflow.invoke(initial_state.model_dump())
@@ -307,16 +338,58 @@ class ChunkImprover:
             return final_state.chunk
 
         # Format results
-        return ImprovementResult(
-            original_chunk=final_state.original_chunk,
-            improved_chunk=final_state.chunk,
-            quality_score=final_state.evaluation.quality_score,
-            is_self_contained=final_state.evaluation.final_judgment.is_self_contained,
-            total_iterations=final_state.iteration,
-            improvement_history=final_state.improvements,
-            chunk_versions=final_state.chunk_versions,
-            quality_improvement=final_state.quality_improvement,
-            critical_issues_resolved=final_state.critical_issues_resolved,
-            final_evaluation=final_state.evaluation,
-            logs=final_state.logs,
+        return self._result(final_state)
+
+    def improve_chunks_batch(
+        self,
+        document: str,
+        chunks: list[str],
+        max_iterations: int | None = 2,
+        quality_threshold: float | None = 0.8,
+        map_fn: Callable[..., Iterable[ImprovementResult]] = map,
+    ) -> list[ImprovementResult]:
+        """Improve several chunks of the same document.
+
+        The first evaluation of the chunks is done in groups by evaluate_batch, so the
+        document is sent once per group. Only the chunks that need it then go through
+        the reconstruction loop, which gives the same results as improve_chunk.
+
+        Args:
+            document: Full document text
+            chunks: The chunks to improve
+            max_iterations: Maximum number of improvement iterations
+            quality_threshold: Target quality score (0-1)
+            map_fn: map-like function running the evaluations and the reconstruction
+                loops, e.g. executor.map
+
+        Returns:
+            list[ImprovementResult]: The improvement results, in the order of chunks
+
+        """
+        evaluations = self.evaluator.evaluate_batch(document=document, chunks=chunks, map_fn=map_fn)
+
+        results: list[ImprovementResult | None] = [None] * len(chunks)
+        to_improve = []
+        for idx, (chunk, evaluation) in enumerate(zip(chunks, evaluations)):
+            # the state as the evaluate node leaves it
+            state_model = self._initial_state(document, chunk, max_iterations, quality_threshold)
+            state_model.evaluation = evaluation
+            state_model.iteration = 1
+            state_model.logs.append("[Iteration 0] Evaluating chunk (batch)")
+
+            state, decision = self._decide_next_step(state_model.model_dump())
+            if decision == "improve":
+                to_improve.append((idx, state))
+            else:
+                results[idx] = self._result(ChunkState.model_validate(self._finish(state)))
+
+        improved = map_fn(
+            lambda state: self._result(
+                ChunkState.model_validate(self.workflow_from_reconstruction.invoke(state)),
+            ),
+            [state for _, state in to_improve],
         )
+        for (idx, _), result in zip(to_improve, improved):
+            results[idx] = result
+
+        return results
@@ -1,6 +1,9 @@
 """Strategies to be used in the chunk improvements."""
 
+import json
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
 from langchain_core.output_parsers import JsonOutputParser
@@ -9,6 +12,11 @@ from langchain_openai import AzureChatOpenAI
 
 from .models import ChunkEvaluation, ChunkReconstruction
 
+logger = logging.getLogger(__name__)
+
+# Chunks evaluated by a single batch call, the document is sent once per group
+EVALUATION_BATCH_SIZE = 15
+
 
 def load_prompt(filename: str) -> str:
     """Load prompt template from file."""
@@ -39,6 +47,27 @@ class EvaluationStrategy(ABC):
 
         """
 
+    def evaluate_batch(
+        self,
+        document: str,
+        chunks: list[str],
+        map_fn: Callable[..., Iterable[ChunkEvaluation]] = map,
+    ) -> list[ChunkEvaluation]:
+        """Evaluate several chunks of the same document.
+
+        Defaults to one evaluate call per chunk.
+
+        Args:
+            document: The full document text
+            chunks: The chunks to evaluate
+            map_fn: map-like function running the evaluate calls, e.g. executor.map
+
+        Returns:
+            list[ChunkEvaluation]: Evaluation results, in the order of chunks
+
+        """
+        return list(map_fn(lambda chunk: self.evaluate(document=document, chunk=chunk), chunks))
+
 
 class ReconstructionStrategy(ABC):
     """Abstract base class for chunk reconstruction strategies."""
@@ -78,6 +107,11 @@ class LLMEvaluationStrategy(EvaluationStrategy):
         # Create chain
         self.evaluation_chain = self.evaluation_prompt | self.llm | JsonOutputParser()
 
+        # Same evaluation, for a list of chunks in one call
+        batch_prompt_template = load_prompt("batch_evaluation_prompt.txt")
+        self.batch_evaluation_prompt = ChatPromptTemplate.from_template(batch_prompt_template)
+        self.batch_evaluation_chain = self.batch_evaluation_prompt | self.llm | JsonOutputParser()
+
     def evaluate(self, document: str, chunk: str) -> ChunkEvaluation:
         """Evaluate a chunk using LLM."""
         try:
@@ -106,6 +140,79 @@ class LLMEvaluationStrategy(EvaluationStrategy):
                 },
             )
 
+    def evaluate_batch(
+        self,
+        document: str,
+        chunks: list[str],
+        map_fn: Callable[..., Iterable[list[ChunkEvaluation] | None]] = map,
+    ) -> list[ChunkEvaluation]:
+        """Evaluate several chunks, EVALUATION_BATCH_SIZE of them per LLM call.
+
+        The chunks of a group whose response is not one evaluation per chunk are
+        evaluated again with one call per chunk.
+        """
+        if len(chunks) <= 1:
+            return super().evaluate_batch(document=document, chunks=chunks, map_fn=map_fn)
+
+        groups = [
+            list(range(start, min(start + EVALUATION_BATCH_SIZE, len(chunks))))
+            for start in range(0, len(chunks), EVALUATION_BATCH_SIZE)
+        ]
+        results = map_fn(
+            lambda group: self._evaluate_group(document, [chunks[idx] for idx in group]),
+            groups,
+        )
+
+        evaluations: list[ChunkEvaluation | None] = [None] * len(chunks)
+        failed = []
+        for group, group_evaluations in zip(groups, results):
+            if group_evaluations is None:
+                failed.extend(group)
+                continue
+            for idx, evaluation in zip(group, group_evaluations):
+                evaluations[idx] = evaluation
+
+        # not nested in the groups above, an executor.map would wait for its own workers
+        if failed:
+            fallback = super().evaluate_batch(
+                document=document,
+                chunks=[chunks[idx] for idx in failed],
+                map_fn=map_fn,
+            )
+            for idx, evaluation in zip(failed, fallback):
+                evaluations[idx] = evaluation
+
+        return evaluations
+
+    def _evaluate_group(self, document: str, chunks: list[str]) -> list[ChunkEvaluation] | None:
+        """Evaluate a group of chunks in a single LLM call, None if the response is unusable."""
+        try:
+            result = self.batch_evaluation_chain.invoke(
+                {
+                    "document": document,
+                    "chunks": json.dumps(
+                        [{"id": idx, "chunk": chunk} for idx, chunk in enumerate(chunks)],
+                        ensure_ascii=False,
+                    ),
+                },
+            )
+
+            evaluations_by_id = {item["id"]: item for item in result["evaluations"]}
+            if sorted(evaluations_by_id) != list(range(len(chunks))):
+                msg = f"expected {len(chunks)} evaluations, got ids {sorted(evaluations_by_id)}"
+                raise ValueError(msg)  # noqa: TRY301
+
+            evaluations = []
+            for idx in range(len(chunks)):
+                evaluation = ChunkEvaluation.model_validate(evaluations_by_id[idx])
+                self._calculate_quality_score(evaluation)
+                evaluations.append(evaluation)
+            return evaluations  # noqa: TRY300
+
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Batch evaluation failed, evaluating the chunks one by one: {e}")
+            return None
+
     def _calculate_quality_score(self, evaluation: ChunkEvaluation) -> None:
         """Calculate quality score based on evaluation results."""
         # Get key metrics
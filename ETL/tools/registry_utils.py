@@ -2,10 +2,17 @@
 """Utilities for fetching ETL configurations from App Registry API."""
 
 import logging
-import requests
+import time
+from functools import lru_cache
+from pathlib import Path
 from typing import List
+
+import orjson
+import requests
 from pydantic import BaseModel
-from ETL.tools.settings import registry_settings
+from ETL.tools.file_utils import write_atomic
+from ETL.tools.fs_constants import REGISTRY_CACHE_DIR
+from ETL.tools.settings import rag_app_settings, registry_settings
 
 logger = logging.getLogger(__name__)
 
@@ -52,3 +59,50 @@ def get_etl_sources() -> List[ETLSource]:
         msg = f"Error parsing ETL configurations: {e}"
         logger.exception(msg)
         raise ValueError(msg) from e  # Raise ValueError instead of sys.exit
+
+
+def _read_cached_sources(cache_file: Path) -> List[ETLSource]:
+    """Load the ETL configurations saved in cache_file."""
+    return [ETLSource(**item) for item in orjson.loads(cache_file.read_bytes())]
+
+
+@lru_cache
+def get_etl_sources_cached(app_id: int) -> List[ETLSource]:
+    """
+    Fetch ETL configurations from the App Registry API, reusing a recent answer.
+
+    The configurations are saved in REGISTRY_CACHE_DIR and reused for
+    rag_app_settings.registry_cache_ttl seconds, unless they don't contain app_id.
+    If the registry can't be reached, the last saved configurations are used.
+
+    Args:
+        app_id: The application whose configuration is needed
+
+    Returns:
+        List of ETLSource objects containing ETL configurations
+
+    Raises:
+        requests.exceptions.RequestException: If the API call fails and nothing was saved
+        ValueError: If the response cannot be parsed
+    """
+    cache_file = REGISTRY_CACHE_DIR / f"registry_{app_id}.json"
+    ttl = rag_app_settings.registry_cache_ttl
+    try:
+        if ttl and time.time() - cache_file.stat().st_mtime < ttl:
+            etl_sources = _read_cached_sources(cache_file)
+            if any(item.applicationId == app_id for item in etl_sources):
+                logger.info(f"Using the ETL configurations saved in {cache_file}")
+                return etl_sources
+    except (OSError, ValueError):
+        pass
+
+    try:
+        etl_sources = get_etl_sources()
+    except Exception:
+        if not cache_file.exists():
+            raise
+        logger.warning(f"App Registry unavailable, using the ETL configurations saved in {cache_file}")
+        return _read_cached_sources(cache_file)
+
+    write_atomic(cache_file, orjson.dumps([item.model_dump() for item in etl_sources]))
+    return etl_sources
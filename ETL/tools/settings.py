@@ -6,6 +6,7 @@ from functools import cached_property
 from typing import Literal
 
 import msal
+import orjson
 import requests
 from dotenv import load_dotenv
 from pydantic import Field, computed_field
@@ -30,6 +31,32 @@ class RagAppSettings(BaseSettings):
     )
 
     app_id: int
+    max_workers: int | None = Field(
+        default=None,
+        gt=0,
+        description="""Number of threads chunking and reconstructing the files.
+            Defaults to the chunk_workers of ProcessingConfig.""",
+    )
+    registry_cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        description="""Seconds the ETL configurations fetched from the App Registry are reused.
+            0 always fetches them again.""",
+    )
+    aspx_cache: bool = Field(
+        default=False,
+        description="If True, the Markdown of an ASPX page is reused when its content is unchanged.",
+    )
+    summary_cache: bool = Field(
+        default=False,
+        description="If True, the summary of a document is reused when its content is unchanged.",
+    )
+    llm_tokens_per_minute: int | None = Field(
+        default=None,
+        gt=0,
+        description="""Tokens per minute the image summaries may send to the multimodal LLM,
+            shared by all the concurrent calls. Defaults to no limit.""",
+    )
 
 
 class RegistrySettings(BaseSettings):
@@ -200,6 +227,8 @@ class AzureOpenAICompletionSettings(BaseSettings):
     api_version: str
     api_key: str
     temperature: float = 0.0
+    # Global batch deployment used by the Batch API, the deployment above if empty
+    batch_deployment: str = ""
 
 
 class AzureOpenAIEmbeddingSettings(BaseSettings):
@@ -230,6 +259,11 @@ class DocumentIntelligenceSettings(BaseSettings):
     api_key: str
 
 
+def _orjson_dumps(value: object) -> str:
+    """Serialize JSON columns with orjson, the DB driver expects a str."""
+    return orjson.dumps(value).decode()
+
+
 class SQLServerSettings(BaseSettings):
     """Settings for Microsoft SQL Server authentication."""
 
@@ -263,7 +297,16 @@ class SQLServerSettings(BaseSettings):
         try:
             # Register the 'sysname' type with SQLAlchemy
             mssql.dialect.ischema_names["sysname"] = String
-            return create_engine(self.connection_string)
+            # multi-row INSERTs are batched in a single statement per page,
+            # plain executemany calls use the pyodbc fast path
+            return create_engine(
+                self.connection_string,
+                fast_executemany=True,
+                use_insertmanyvalues=True,
+                insertmanyvalues_page_size=1000,
+                json_serializer=_orjson_dumps,
+                json_deserializer=orjson.loads,
+            )
         except OperationalError as e:
             raise DBError from e
 
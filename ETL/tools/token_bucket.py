@@ -0,0 +1,54 @@
+"""Share a tokens-per-minute budget between concurrent LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from functools import lru_cache
+
+from ETL.tools.settings import rag_app_settings
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to one minute of budget.
+
+    A call debits its estimated tokens before being sent and waits for as long
+    as the bucket is in debt, so calls are served in the order they asked.
+    The bucket is thread-safe: the files processed on different threads, each with
+    its own event loop, draw from the same budget.
+    """
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        self.capacity = tokens_per_minute
+        self.rate = tokens_per_minute / 60
+        self.tokens = float(tokens_per_minute)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Debit the tokens and return the seconds to wait before they are available."""
+        # a call larger than the whole budget would otherwise wait forever
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens: int) -> None:
+        """Block until the tokens can be spent."""
+        time.sleep(self._reserve(tokens))
+
+    async def aacquire(self, tokens: int) -> None:
+        """Wait, without blocking the event loop, until the tokens can be spent."""
+        await asyncio.sleep(self._reserve(tokens))
+
+
+@lru_cache(maxsize=1)
+def get_llm_token_bucket() -> TokenBucket | None:
+    """Return the bucket shared by all the multimodal LLM calls, None when no budget is set."""
+    if rag_app_settings.llm_tokens_per_minute is None:
+        return None
+    return TokenBucket(rag_app_settings.llm_tokens_per_minute)
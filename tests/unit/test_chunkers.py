@@ -5,7 +5,10 @@ from unittest.mock import Mock, patch
 from langchain_core.documents import Document
 
 from ETL.document_processor.chunkers.character_chunker import CharacterChunker
-from ETL.document_processor.chunkers.recursive_chunker import RecursiveChunker
+from ETL.document_processor.chunkers.recursive_chunker import (
+    FastRecursiveTextSplitter,
+    RecursiveChunker,
+)
 from ETL.document_processor.chunkers.markdown_chunker import MarkdownChunker
 from ETL.document_processor.chunkers.factory import ChunkerFactory
 from ETL.document_processor.base.models import ProcessingConfig, ChunkingStrategy
@@ -14,6 +17,7 @@ from tests.fixtures import (
     SAMPLE_TEXT_MEDIUM,
     SAMPLE_TEXT_LONG,
     create_sample_config,
+    create_sample_entry,
     create_mock_embeddings,
 )
 
@@ -130,6 +134,51 @@ class TestRecursiveChunker:
         for doc in result:
             assert doc.metadata == metadata
 
+    def test_fast_splitter_enabled_by_config(self):
+        """Test that the config flag selects the single-pass splitter."""
+        config = create_sample_config(
+            chunking_strategy=ChunkingStrategy.RECURSIVE, fast_recursive_splitter=True
+        )
+        chunker = RecursiveChunker(config)
+        assert isinstance(chunker._splitter, FastRecursiveTextSplitter)
+
+        config = create_sample_config(chunking_strategy=ChunkingStrategy.RECURSIVE)
+        assert not isinstance(RecursiveChunker(config)._splitter, FastRecursiveTextSplitter)
+
+    def test_fast_splitter_respects_chunk_size(self):
+        """Test that the single-pass splitter keeps chunks within size and covers the text."""
+        config = create_sample_config(
+            chunking_strategy=ChunkingStrategy.RECURSIVE,
+            chunk_size=200,
+            chunk_overlap=50,
+            fast_recursive_splitter=True,
+        )
+        chunker = RecursiveChunker(config)
+        result = chunker.split_text(SAMPLE_TEXT_LONG)
+
+        assert len(result) > 1
+        assert all(0 < len(doc.page_content) <= 200 for doc in result)
+        assert result[0].page_content.startswith("# Document Title")
+        assert result[-1].page_content.endswith("chunking tests.")
+
+    def test_fast_splitter_hard_cut_with_overlap(self):
+        """Test that text without separators is cut at chunk_size, with overlap."""
+        splitter = FastRecursiveTextSplitter(chunk_size=5, chunk_overlap=2)
+        assert splitter.split_text("abcdefghijklmnop") == [
+            "abcde", "defgh", "ghijk", "jklmn", "mnop"
+        ]
+
+    def test_fast_splitter_overlap_does_not_repeat_previous_chunk(self):
+        """Test that a chunk restarted by the overlap always reaches past the previous one."""
+        text = "a" * 40 + "\n\n" + "b" * 40 + "\n\n" + " ".join(f"word{i}" for i in range(40))
+        splitter = FastRecursiveTextSplitter(chunk_size=100, chunk_overlap=50)
+        chunks = splitter.split_text(text)
+
+        assert chunks[1] != "b" * 40
+        assert all(chunk not in prev for prev, chunk in zip(chunks, chunks[1:]))
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert chunks[-1].endswith("word39")
+
 
 class TestMarkdownChunker:
     """Tests for MarkdownChunker."""
@@ -257,6 +306,80 @@ class TestChunkerIntegration:
             # Chunks should not be identical
             assert chunk1 != chunk2
 
+    def test_process_entry_carries_metadata_to_chunks(self):
+        """Test that process_entry keeps the entry metadata and resets per-chunk fields."""
+        config = create_sample_config(
+            chunking_strategy=ChunkingStrategy.RECURSIVE,
+            chunk_size=200,
+            chunk_overlap=50,
+        )
+        chunker = ChunkerFactory.create_chunker(config)
+        entry = create_sample_entry(content=SAMPLE_TEXT_LONG, file_name="doc.pdf")
+        result = chunker.process_entry(entry)
+
+        assert len(result) > 1
+        for chunk in result:
+            assert chunk.file_id == entry.file_id
+            assert chunk.metadata.file_name == "doc.pdf"
+            assert chunk.metadata.etag == entry.metadata.etag
+            assert chunk.metadata.chunk_idx == ""
+            assert chunk.metadata.keywords == []
+            assert chunk.metadata.vector == []
+        # each chunk owns its metadata
+        assert result[0].metadata is not result[1].metadata
+        assert result[0].metadata.keywords is not result[1].metadata.keywords
+
+    def test_process_entry_many_chunks_keeps_order(self):
+        """Test that large documents, built in parallel, keep the chunk order."""
+        config = create_sample_config(
+            chunking_strategy=ChunkingStrategy.CHARACTER,
+            chunk_size=20,
+            chunk_overlap=0,
+        )
+        chunker = ChunkerFactory.create_chunker(config)
+        text = "\n\n".join(f"paragraph {i}" for i in range(1000))
+        result = chunker.process_entry(create_sample_entry(content=text))
+
+        assert len(result) > 500
+        assert [chunk.content for chunk in result] == [
+            doc.page_content for doc in chunker.split_text(text)
+        ]
+
+    def test_process_entry_short_text_single_chunk(self):
+        """Test that text fitting in one chunk is returned whole without splitting."""
+        config = create_sample_config(
+            chunking_strategy=ChunkingStrategy.RECURSIVE,
+            chunk_size=1000,
+            chunk_overlap=100,
+        )
+        chunker = ChunkerFactory.create_chunker(config)
+        entry = create_sample_entry(content="  A short page.  ")
+
+        with patch.object(chunker, "split_text") as mock_split:
+            result = chunker.process_entry(entry)
+            mock_split.assert_not_called()
+
+        assert len(result) == 1
+        assert result[0].content == "A short page."
+        assert result[0].metadata.chunk_idx == ""
+        assert result[0].metadata.keywords == []
+
+    def test_process_entry_keeps_chunker_vectors(self):
+        """Test that a vector computed by the chunker is carried to the entry."""
+        class EmbeddingChunker(RecursiveChunker):
+            splits_within_chunk_size = True
+
+            def split_text(self, text, **kwargs):
+                return [
+                    Document(page_content=part, metadata={"vector": [float(len(part))]})
+                    for part in text.split()
+                ]
+
+        chunker = EmbeddingChunker(create_sample_config())
+        result = chunker.process_entry(create_sample_entry(content="one three"))
+
+        assert [chunk.metadata.vector for chunk in result] == [[3.0], [5.0]]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
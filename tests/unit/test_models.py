@@ -271,6 +271,13 @@ class TestProcessingConfig:
         config = ProcessingConfig()
         assert config.document_page_stitching is False
 
+    def test_llm_concurrency_validation(self):
+        """Test llm_concurrency default and that it must be greater than 0."""
+        assert ProcessingConfig().llm_concurrency == 20
+
+        with pytest.raises(ValidationError):
+            ProcessingConfig(llm_concurrency=0)
+
     def test_config_with_all_parameters(self):
         """Test creating config with all parameters."""
         config = ProcessingConfig(
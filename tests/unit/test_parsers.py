@@ -1,10 +1,12 @@
 """Unit tests for parser modules - FIXED to match actual ParserFactory."""
 
+import asyncio
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 
 from ETL.document_processor.parsers.text_parser import TextParser
+from ETL.document_processor.parsers.document_intelligence_parser import DocumentIntelligenceParser
 from ETL.document_processor.parsers.docx_parser import DocxParser
 from ETL.document_processor.parsers.excel_parser import ExcelParser
 from ETL.document_processor.parsers.factory import ParserFactory
@@ -56,6 +58,16 @@ class TestTextParser:
         assert "test document" in result.lower()
         assert unprocessed_images == 0
 
+    def test_aparse_txt_file(self, tmp_path):
+        """Test that the default aparse runs parse in a thread."""
+        file_path = create_temp_file(tmp_path, "test.txt", "This is a test document.")
+
+        parser = TextParser()
+        result, unprocessed_images = asyncio.run(parser.aparse(file_path, {"file_name": "test.txt"}))
+
+        assert "test document" in result.lower()
+        assert unprocessed_images == 0
+
     def test_parse_md_file(self, tmp_path):
         """Test parsing a markdown file."""
         content = "# Header\n\nThis is markdown content."
@@ -87,6 +99,40 @@ class TestTextParser:
         assert "émojis" in result or "emojis" in result  # May be normalized
         assert isinstance(result, str)
 
+    def test_parse_normalizes_newlines(self, tmp_path):
+        """Test that Windows and old Mac newlines are read as \\n."""
+        file_path = tmp_path / "test_crlf.txt"
+        file_path.write_bytes(b"line one\r\nline two\rline three\n")
+
+        parser = TextParser()
+        result, _ = parser.parse(file_path, {"file_name": "test_crlf.txt"})
+
+        assert result == "line one\nline two\nline three\n"
+
+
+class TestDocumentIntelligenceParser:
+    """Tests for DocumentIntelligenceParser."""
+
+    def test_aparse_uses_async_client(self, tmp_path):
+        """Test that aparse awaits the async Document Intelligence client."""
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"%PDF-1.4")
+
+        analysis = MagicMock(figures=[MagicMock(bounding_regions=[])], paragraphs=[], content="# Title")
+        poller = MagicMock(result=AsyncMock(return_value=analysis))
+        async_client = MagicMock(begin_analyze_document=AsyncMock(return_value=poller))
+        sync_client = MagicMock()
+
+        parser = DocumentIntelligenceParser(sync_client, async_di_client=async_client)
+        result, unprocessed_images = asyncio.run(
+            parser.aparse(file_path, {"id": "1", "etag": "etag", "web_url": "https://example.com"})
+        )
+
+        assert result == "# Title"
+        assert unprocessed_images == 1
+        async_client.begin_analyze_document.assert_awaited_once()
+        sync_client.begin_analyze_document.assert_not_called()
+
 
 class TestDocxParser:
     """Tests for DocxParser."""
@@ -129,25 +175,29 @@ class TestExcelParser:
         assert not parser.supports_file_type(".pdf")
         assert not parser.supports_file_type(".docx")
 
-    @patch("ETL.document_processor.parsers.excel_parser.pd.read_excel")
-    def test_parse_excel_file(self, mock_read_excel):
-        """Test parsing an Excel file with mock."""
-        # Mock pandas DataFrame
-        import pandas as pd
-        mock_df = pd.DataFrame({
-            "Column1": ["A", "B", "C"],
-            "Column2": [1, 2, 3]
-        })
-        mock_read_excel.return_value = mock_df
+    def test_parse_excel_file(self, tmp_path):
+        """Test parsing an Excel file."""
+        from openpyxl import Workbook
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Data"
+        sheet.append(["Column1", "Column2"])
+        for row in [["A", 1], ["B", 2], ["C|D", None], ["E\r\nF", 3]]:
+            sheet.append(row)
+        workbook.create_sheet("Other").append(["Only header"])
+        file_path = tmp_path / "test.xlsx"
+        workbook.save(file_path)
 
         parser = ExcelParser()
         result, unprocessed_images = parser.parse(
-            Path("test.xlsx"), {"file_name": "test.xlsx"}
+            file_path, {"file_name": "test.xlsx"}
         )
 
         # Verify result contains data
         assert isinstance(result, str)
-        assert len(result) > 0
+        assert "# Sheet: Data" in result
+        assert "# Sheet: Other" in result
+        assert "| Column1 | Column2 |\n|---|---|\n| A | 1 |\n| B | 2 |\n| C\\|D |  |\n| E  F | 3 |" in result
         assert unprocessed_images == 0
 
 